@@ -5,6 +5,7 @@ MySQL表结构比较工具 - PyQt6版本启动文件
 
 import sys
 import os
+import multiprocessing
 
 # 获取当前文件所在目录
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -51,4 +52,6 @@ def main():
     pyqt_main()
 
 if __name__ == "__main__":
+    # 打包后的程序使用多进程解析SQL文件时需要
+    multiprocessing.freeze_support()
     main() 
\ No newline at end of file
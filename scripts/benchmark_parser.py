@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+SQL 文件解析性能测试脚本
+生成一个大型表结构文件，分别使用快速解析和 sqlparse 解析并比较耗时与结果
+
+用法：python scripts/benchmark_parser.py [--tables 2000] [--columns 30] [--db-type mysql] [--file schema.sql]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+# 与 app.py 相同，把 src 加入模块搜索路径
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+sys.path.insert(0, os.path.join(PROJECT_ROOT, 'src'))
+
+from src.core.sql_parser import SQLParser
+
+def generate_schema(file_path, table_count, column_count):
+    """生成测试用的 MySQL 表结构文件"""
+    column_types = [
+        "int NOT NULL DEFAULT '0' COMMENT '数量'",
+        "varchar(255) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci DEFAULT NULL",
+        "decimal(10,2) unsigned NOT NULL DEFAULT '0.00'",
+        "timestamp NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP",
+        "enum('a','b','c,d') NOT NULL DEFAULT 'a'",
+        "text COMMENT '备注, 可为空'",
+    ]
+    with open(file_path, 'w', encoding='utf-8') as file:
+        for table_index in range(table_count):
+            file.write(f"DROP TABLE IF EXISTS `table_{table_index}`;\n")
+            file.write(f"CREATE TABLE `table_{table_index}` (\n")
+            file.write("  `id` bigint NOT NULL AUTO_INCREMENT,\n")
+            for column_index in range(column_count):
+                column_type = column_types[column_index % len(column_types)]
+                file.write(f"  `col_{column_index}` {column_type},\n")
+            file.write("  PRIMARY KEY (`id`),\n")
+            file.write("  KEY `idx_col_0` (`col_0`),\n")
+            file.write("  UNIQUE KEY `uk_col_1` (`col_1`,`col_2`)\n")
+            file.write(") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COMMENT='测试表';\n\n")
+
+def run_parse(file_path, db_type, fast_path):
+    """解析文件，返回 (耗时, 表结构)"""
+    parser = SQLParser(db_type=db_type)
+    parser.parser.fast_path = fast_path
+    start = time.perf_counter()
+    tables = parser.parse_file(file_path)
+    return time.perf_counter() - start, tables
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="SQL 文件解析性能测试")
+    arg_parser.add_argument("--tables", type=int, default=2000, help="生成的表数量")
+    arg_parser.add_argument("--columns", type=int, default=30, help="每个表的字段数量")
+    arg_parser.add_argument("--db-type", default="mysql", help="解析器类型")
+    arg_parser.add_argument("--file", help="使用已有的SQL文件，不再生成")
+    args = arg_parser.parse_args()
+    
+    file_path = args.file
+    temp_file = None
+    if not file_path:
+        temp_file = tempfile.NamedTemporaryFile(suffix=".sql", delete=False)
+        temp_file.close()
+        file_path = temp_file.name
+        print(f"生成测试文件: {args.tables} 个表，每表 {args.columns} 个字段...")
+        generate_schema(file_path, args.tables, args.columns)
+        
+    try:
+        size_mb = os.path.getsize(file_path) / 1024 / 1024
+        print(f"文件: {file_path} ({size_mb:.1f} MB)")
+        
+        fast_time, fast_tables = run_parse(file_path, args.db_type, True)
+        print(f"快速解析:   {fast_time:.2f} 秒，{len(fast_tables)} 个表")
+        
+        sqlparse_time, sqlparse_tables = run_parse(file_path, args.db_type, False)
+        print(f"sqlparse:   {sqlparse_time:.2f} 秒，{len(sqlparse_tables)} 个表")
+        
+        if fast_time > 0:
+            print(f"加速比:     {sqlparse_time / fast_time:.1f}x")
+        print(f"结果一致:   {'是' if fast_tables == sqlparse_tables else '否'}")
+    finally:
+        if temp_file:
+            os.unlink(file_path)
+
+if __name__ == "__main__":
+    main()
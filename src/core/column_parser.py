@@ -0,0 +1,194 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# 属性处理函数：(details, 原始分词, 大写分词, 当前下标, 分词数) -> 下一个下标
+ColumnRule = Callable[[Dict[str, Any], List[str], List[str], int, int], int]
+
+def _not_null(details, parts, uppers, i, n):
+    """NOT NULL"""
+    if i + 1 < n and uppers[i + 1] == 'NULL':
+        details['Null'] = 'NO'
+        return i + 2
+    return i + 1
+
+def _null(details, parts, uppers, i, n):
+    """NULL"""
+    details['Null'] = 'YES'
+    return i + 1
+
+def _quoted_value(key: str) -> ColumnRule:
+    """关键字后的一个值，单引号包围时去掉引号（DEFAULT、COMMENT）"""
+    def rule(details, parts, uppers, i, n):
+        if i + 1 < n:
+            value = parts[i + 1]
+            if value.startswith("'") and value.endswith("'"):
+                value = value[1:-1]
+            details[key] = value
+        return i + 2
+    return rule
+
+def _plain_value(key: str) -> ColumnRule:
+    """关键字后的一个值，原样保存（COLLATE）"""
+    def rule(details, parts, uppers, i, n):
+        if i + 1 < n:
+            details[key] = parts[i + 1]
+        return i + 2
+    return rule
+
+def _flag(key: str, value: Any) -> ColumnRule:
+    """单个关键字设置固定值（AUTO_INCREMENT、IDENTITY）"""
+    def rule(details, parts, uppers, i, n):
+        details[key] = value
+        return i + 1
+    return rule
+
+def _phrase(words: Iterable[str], key: str, value: Any) -> ColumnRule:
+    """多个关键字组成的短语设置固定值（PRIMARY KEY、ON UPDATE CURRENT_TIMESTAMP）"""
+    words = tuple(words)
+    size = len(words)
+    def rule(details, parts, uppers, i, n):
+        if i + size <= n and tuple(uppers[i:i + size]) == words:
+            details[key] = value
+            return i + size
+        return i + 1
+    return rule
+
+def _charset(details, parts, uppers, i, n):
+    """CHARACTER SET 字符集"""
+    if i + 2 < n and uppers[i + 1] == 'SET':
+        details['Charset'] = parts[i + 2]
+        return i + 3
+    return i + 1
+
+def _attribute(details, parts, uppers, i, n):
+    """UNSIGNED、ZEROFILL 等属性，收集后按字母顺序拼接"""
+    details['Attributes'].add(uppers[i].lower())
+    return i + 1
+
+# 所有方言共有的属性关键字
+_COMMON_RULES = {
+    'NOT': _not_null,
+    'NULL': _null,
+    'DEFAULT': _quoted_value('Default'),
+    'COMMENT': _quoted_value('Comment'),
+}
+_COMMON_FIELDS = {
+    'Type': None,           # 数据类型
+    'Null': 'YES',          # YES/NO
+    'Default': None,        # 默认值
+    'Comment': None,        # 注释
+    'Extra': None,          # 额外信息
+}
+
+class ColumnDefinitionParser:
+    """表驱动的列定义解析器
+    
+    各方言只提供关键字表：字段默认值、结束类型解析的关键字、属性关键字的处理函数。
+    关键字表在创建时合并好，解析时对分词结果只遍历一次：先收集类型，遇到类型结束
+    关键字后按关键字表分派处理属性，不认识的分词跳过。
+    """
+    
+    def __init__(self, fields: Optional[Dict[str, Any]] = None, type_stop_words: Iterable[str] = (),
+                 rules: Optional[Dict[str, ColumnRule]] = None, attributes: Iterable[str] = ()):
+        self.fields = dict(_COMMON_FIELDS, **(fields or {}))
+        self.rules = dict(_COMMON_RULES, **(rules or {}))
+        self.attributes = frozenset(attributes)
+        for word in self.attributes:
+            self.rules[word] = _attribute
+        if self.attributes:
+            self.fields['Attributes'] = None
+        self.type_stop_words = frozenset(_COMMON_RULES) | frozenset(type_stop_words) | self.attributes
+        
+    def parse(self, definition: str) -> Dict[str, Any]:
+        """解析列定义（列名之后的部分），返回详细信息"""
+        details = self.fields.copy()
+        if self.attributes:
+            details['Attributes'] = set()
+            
+        parts = definition.split()
+        if not parts:
+            return details
+        uppers = definition.upper().split()
+        if len(uppers) != len(parts):
+            # 个别 Unicode 字符大写后长度或类别变化，逐个转换
+            uppers = [part.upper() for part in parts]
+            
+        n = len(parts)
+        i = 0
+        stop_words = self.type_stop_words
+        while i < n and uppers[i] not in stop_words:
+            i += 1
+        details['Type'] = ' '.join(parts[:i])
+        
+        rules = self.rules
+        while i < n:
+            rule = rules.get(uppers[i])
+            i = rule(details, parts, uppers, i, n) if rule is not None else i + 1
+            
+        if self.attributes:
+            # 将属性集合转换为字符串
+            attributes = details['Attributes']
+            details['Attributes'] = ' '.join(sorted(attributes)) if attributes else None
+        return details
+
+# MySQL，支持的列定义格式示例：
+# - INT NOT NULL AUTO_INCREMENT
+# - VARCHAR(255) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci NOT NULL DEFAULT ''
+# - DECIMAL(10,2) UNSIGNED NOT NULL DEFAULT 0.00
+# - TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+MYSQL_COLUMNS = ColumnDefinitionParser(
+    fields={
+        'Charset': None,        # 字符集
+        'Collation': None,      # 排序规则
+        'Attributes': None,     # 其他属性（如 UNSIGNED, ZEROFILL 等）
+        'Key': None,            # 键类型
+    },
+    type_stop_words=('CHARACTER', 'COLLATE', 'AUTO_INCREMENT', 'UNIQUE', 'PRIMARY', 'ON'),
+    rules={
+        'CHARACTER': _charset,
+        'COLLATE': _plain_value('Collation'),
+        'AUTO_INCREMENT': _flag('Extra', 'auto_increment'),
+        'ON': _phrase(('ON', 'UPDATE', 'CURRENT_TIMESTAMP'), 'Extra', 'on update CURRENT_TIMESTAMP'),
+    },
+    attributes=('UNSIGNED', 'ZEROFILL', 'STORAGE', 'MEMORY'),
+)
+
+POSTGRESQL_COLUMNS = ColumnDefinitionParser(
+    fields={'UDT': None},           # 用户定义类型
+)
+
+ORACLE_COLUMNS = ColumnDefinitionParser(
+    fields={
+        'Length': None,         # 长度
+        'Precision': None,      # 精度
+        'Scale': None,          # 小数位数
+    },
+)
+
+SQLSERVER_COLUMNS = ColumnDefinitionParser(
+    fields={
+        'Identity': None,       # 自增属性
+        'Length': None,         # 长度
+        'Precision': None,      # 精度
+        'Scale': None,          # 小数位数
+    },
+    type_stop_words=('IDENTITY',),
+    rules={'IDENTITY': _flag('Identity', True)},
+)
+
+SQLITE_COLUMNS = ColumnDefinitionParser(
+    fields={'PrimaryKey': False},   # 主键
+    type_stop_words=('PRIMARY', 'KEY'),
+    rules={'PRIMARY': _phrase(('PRIMARY', 'KEY'), 'PrimaryKey', True)},
+)
+
+MONGODB_COLUMNS = ColumnDefinitionParser(
+    fields={'MongoDBType': None},  # MongoDB原始类型
+)
+
+DB2_COLUMNS = ColumnDefinitionParser(
+    fields={
+        'Length': None,         # 长度
+        'Precision': None,      # 精度
+        'Scale': None,          # 小数位数
+    },
+)
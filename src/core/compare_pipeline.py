@@ -0,0 +1,138 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from typing import Dict, Any, Optional, Tuple
+from .db_connector import DBConnector
+
+class ComparePipeline:
+    """边加载边比较的比较流水线
+    
+    左右两侧的表结构在各自的线程中加载，每加载完一个表调用一次 add_table。
+    同名表在两侧都到达后立即比较，因此两侧都加载完成时大部分差异已经计算完毕，
+    总耗时接近较慢一侧的加载时间，而不是两侧加载时间与比较时间之和。
+    本类的方法可以在多个线程中同时调用。
+    """
+    
+    SIDES = ("left", "right")
+    
+    def __init__(self, sql_parser):
+        self.sql_parser = sql_parser
+        self._lock = threading.Lock()
+        # 每侧：标准化表名 -> (原始表名, 表结构)
+        self._tables = {side: {} for side in self.SIDES}
+        self._finished = {side: False for side in self.SIDES}
+        # 标准化表名 -> (左侧表名, 表差异)
+        self._modified = {}
+        
+    def reset_side(self, side: str) -> None:
+        """开始重新加载某一侧，清除该侧已有的表和相关差异"""
+        with self._lock:
+            self._tables[side] = {}
+            self._finished[side] = False
+            self._modified = {}
+            
+    def add_table(self, side: str, table_name: str, structure: Dict[str, Any]) -> None:
+        """某一侧加载完成一个表，另一侧已有同名表时立即比较"""
+        key = self.sql_parser.normalize_name(table_name)
+        other_side = "right" if side == "left" else "left"
+        with self._lock:
+            self._tables[side][key] = (table_name, structure)
+            other = self._tables[other_side].get(key)
+        if other is None:
+            return
+            
+        if side == "left":
+            left, right = (table_name, structure), other
+        else:
+            left, right = other, (table_name, structure)
+        table_diffs = self.sql_parser.compare_table(left[1], right[1])
+        
+        with self._lock:
+            # 比较期间该表可能已被重新加载，只保留与当前结构对应的结果
+            if (self._tables["left"].get(key) is not None and self._tables["left"][key][1] is left[1] and
+                    self._tables["right"].get(key) is not None and self._tables["right"][key][1] is right[1]):
+                if table_diffs:
+                    self._modified[key] = (left[0], table_diffs)
+                else:
+                    self._modified.pop(key, None)
+                    
+    def finish_side(self, side: str, tables: Dict[str, Dict[str, Any]]) -> None:
+        """某一侧加载完成，以最终结果补齐未通过 add_table 报告的表"""
+        with self._lock:
+            known = self._tables[side]
+            final_keys = {self.sql_parser.normalize_name(table_name) for table_name in tables}
+            for key in [key for key in known if key not in final_keys]:
+                del known[key]
+                self._modified.pop(key, None)
+            missing = [
+                (table_name, structure) for table_name, structure in tables.items()
+                if known.get(self.sql_parser.normalize_name(table_name), (None, None))[1] is not structure
+            ]
+        for table_name, structure in missing:
+            self.add_table(side, table_name, structure)
+        with self._lock:
+            self._finished[side] = True
+            
+    def is_complete(self) -> bool:
+        """两侧是否都已加载完成"""
+        with self._lock:
+            return all(self._finished.values())
+            
+    def matches(self, left_tables: Dict[str, Dict[str, Any]], right_tables: Dict[str, Dict[str, Any]]) -> bool:
+        """流水线的结果是否对应给定的两侧表结构（同一批表结构对象）"""
+        with self._lock:
+            if not all(self._finished.values()):
+                return False
+            for side, tables in (("left", left_tables), ("right", right_tables)):
+                known = self._tables[side]
+                if len(known) != len(tables):
+                    return False
+                for table_name, structure in tables.items():
+                    entry = known.get(self.sql_parser.normalize_name(table_name))
+                    if entry is None or entry[1] is not structure:
+                        return False
+            return True
+            
+    def get_differences(self) -> Dict[str, Any]:
+        """返回与 compare_tables 相同格式的差异"""
+        with self._lock:
+            left, right = self._tables["left"], self._tables["right"]
+            return {
+                'added_tables': [right[key][0] for key in right if key not in left],
+                'removed_tables': [left[key][0] for key in left if key not in right],
+                'modified_tables': {table_name: table_diffs for table_name, table_diffs in self._modified.values()}
+            }
+            
+    def run(self, left_source: Tuple[str, Dict[str, Any]], right_source: Tuple[str, Dict[str, Any]],
+            schema_cache=None, cancel_event: Optional[threading.Event] = None) -> Tuple[Dict, Dict, Dict]:
+        """同时加载两个数据库并比较，返回 (左侧表结构, 右侧表结构, 差异)
+        
+        left_source / right_source 为 (数据库类型, 连接配置)，两侧分别使用独立的连接和线程。
+        """
+        # 一侧失败时通过同一个事件让另一侧尽快停止
+        cancel_event = cancel_event or threading.Event()
+        
+        def load(side, source):
+            db_type, config = source
+            self.reset_side(side)
+            db_connector = DBConnector(schema_cache)
+            db_connector.connect(config, db_type)
+            try:
+                tables = db_connector.get_table_structure(
+                    progress_callback=lambda done, total, table_name, structure: self.add_table(side, table_name, structure),
+                    cancel_event=cancel_event
+                )
+            finally:
+                db_connector.close()
+            self.finish_side(side, tables)
+            return tables
+            
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            left_future = executor.submit(load, "left", left_source)
+            right_future = executor.submit(load, "right", right_source)
+            done, _ = wait([left_future, right_future], return_when=FIRST_EXCEPTION)
+            if any(future.exception() for future in done):
+                cancel_event.set()
+            left_tables = left_future.result()
+            right_tables = right_future.result()
+            
+        return left_tables, right_tables, self.get_differences()
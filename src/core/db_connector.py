@@ -1,22 +1,240 @@
+import json
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import mysql.connector
 import psycopg2
 from typing import Dict, Any, Optional, List, Set
-from utils.util import normalize_sql_definition
+from .schema_model import ColumnDef
+
+class LoadCancelled(Exception):
+    """表结构加载被取消"""
 
 class BaseDBConnector:
-    """数据库连接器基类"""
+    """数据库连接器基类
+    
+    逐表获取结构的连接器只需实现 _list_tables 和 _get_table。连接配置中的 max_workers
+    大于1时，表会被分发到多个工作连接上并行查询（默认1，即串行使用当前连接）。
+    
+    设置 progress_callback(done, total, table_name, structure) 后每获取完一个表回调一次；
+    设置 cancel_event 后在表与表之间检查，置位时抛出 LoadCancelled。
+    """
+    
+    # 连接池健康检查使用的语句
+    _ping_sql = "SELECT 1"
     
     def __init__(self):
         self.connection = None
+        self.config = {}
+        self.progress_callback = None
+        self.cancel_event = None
+        self._progress_lock = threading.Lock()
+        self._progress_done = 0
+        self._progress_total = 0
         
     def connect(self, config: Dict[str, Any]) -> None:
         """连接到数据库，子类必须实现"""
         raise NotImplementedError
         
     def get_table_structure(self) -> Dict[str, Dict[str, Any]]:
-        """获取所有表的结构，子类必须实现"""
+        """获取所有表的结构"""
+        if not self.connection:
+            raise Exception("未连接到数据库")
+            
+        cursor = self._cursor()
+        try:
+            table_names = self._list_tables(cursor)
+        finally:
+            cursor.close()
+            
+        self._start_progress(len(table_names))
+        return self.get_tables(table_names)
+        
+    def get_tables(self, table_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """获取指定表的结构"""
+        if not self.connection:
+            raise Exception("未连接到数据库")
+            
+        max_workers = min(int(self.config.get('max_workers') or 1), len(table_names))
+        if max_workers > 1:
+            return self._get_tables_parallel(table_names, max_workers)
+        return self._get_tables(table_names)
+        
+    def get_create_table_sql(self, table_name: str) -> Optional[str]:
+        """按需获取单个表的原始建表语句，加载表结构时已获取建表语句的连接器返回 None"""
+        return None
+        
+    def get_table_fingerprints(self) -> Optional[Dict[str, str]]:
+        """获取每个表的结构指纹（表名 -> 指纹），不支持时返回None
+        
+        指纹只需在表结构变化时改变，用于判断结构快照缓存是否仍然有效。
+        """
+        if not self.connection:
+            raise Exception("未连接到数据库")
+            
+        cursor = self._cursor()
+        try:
+            return self._list_fingerprints(cursor)
+        finally:
+            cursor.close()
+            
+    def _list_fingerprints(self, cursor) -> Optional[Dict[str, str]]:
+        """查询所有表的结构指纹，子类可覆盖"""
+        return None
+        
+    def refresh(self, previous_tables: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """基于上一次的结果增量刷新表结构
+        
+        通过结构指纹（DDL时间等目录元数据）识别新增、删除和变更的表，只重新查询
+        新增和变更的表，未变化的表直接沿用 previous_tables 中的结构。
+        返回的每个表都带有 fingerprint 字段，可作为下一次 refresh 的输入；
+        不支持指纹的连接器退化为全量获取。
+        """
+        fingerprints = self.get_table_fingerprints()
+        if fingerprints is None:
+            return self.get_table_structure()
+            
+        changed = [
+            table_name for table_name, fingerprint in fingerprints.items()
+            if previous_tables.get(table_name, {}).get('fingerprint') != fingerprint
+        ]
+        self._start_progress(len(fingerprints))
+        for table_name in fingerprints:
+            if table_name not in changed:
+                self._report_progress(table_name, previous_tables[table_name])
+        fetched = self.get_tables(changed) if changed else {}
+        
+        # 指纹在获取结构之前查询，期间发生的变更会在下一次刷新时被发现
+        tables = {}
+        for table_name, fingerprint in fingerprints.items():
+            if table_name in fetched:
+                tables[table_name] = fetched[table_name]
+                tables[table_name]['fingerprint'] = fingerprint
+            elif table_name not in changed:
+                tables[table_name] = previous_tables[table_name]
+        return tables
+        
+    def _cursor(self):
+        """创建游标，子类可覆盖以使用特定的游标类型"""
+        return self.connection.cursor()
+        
+    def _start_progress(self, total: int) -> None:
+        """开始一次加载，重置进度计数"""
+        self._check_cancelled()
+        with self._progress_lock:
+            self._progress_done = 0
+            self._progress_total = total
+            
+    def _report_progress(self, table_name: str, structure: Dict[str, Any]) -> None:
+        """检查是否已取消，并报告一个表已获取完成（可在工作线程中调用）
+        
+        先检查取消，已取消的加载不会再把结果交给回调。
+        """
+        self._check_cancelled()
+        if self.progress_callback:
+            with self._progress_lock:
+                self._progress_done += 1
+                done = self._progress_done
+            self.progress_callback(done, self._progress_total, table_name, structure)
+        
+    def _check_cancelled(self) -> None:
+        """已请求取消时抛出 LoadCancelled"""
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise LoadCancelled("表结构加载已取消")
+            
+    def _list_tables(self, cursor) -> List[str]:
+        """获取所有表名，逐表查询的子类必须实现"""
+        raise NotImplementedError
+        
+    def _get_table(self, cursor, table_name: str) -> Dict[str, Any]:
+        """获取单个表的结构，逐表查询的子类必须实现"""
         raise NotImplementedError
         
+    def _get_tables(self, table_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """使用当前连接依次获取指定表的结构"""
+        cursor = self._cursor()
+        tables = {}
+        try:
+            for table_name in table_names:
+                tables[table_name] = self._get_table(cursor, table_name)
+                self._report_progress(table_name, tables[table_name])
+        finally:
+            cursor.close()
+        return tables
+        
+    def _get_tables_parallel(self, table_names: List[str], max_workers: int) -> Dict[str, Dict[str, Any]]:
+        """将逐表查询分发到多个连接上并行执行
+        
+        当前连接在调用线程中处理一部分表，另外 max_workers-1 个线程各自建立一个
+        同配置的新连接，从共享队列中领取表名。结果按表名排序后合并，与执行顺序无关。
+        """
+        pending = queue.Queue()
+        for table_name in table_names:
+            pending.put(table_name)
+        stop = threading.Event()
+        
+        def drain(connector: 'BaseDBConnector') -> Dict[str, Dict[str, Any]]:
+            cursor = connector._cursor()
+            result = {}
+            try:
+                while not stop.is_set():
+                    try:
+                        table_name = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    result[table_name] = connector._get_table(cursor, table_name)
+                    self._report_progress(table_name, result[table_name])
+            except Exception:
+                stop.set()
+                raise
+            finally:
+                cursor.close()
+            return result
+            
+        def worker() -> Dict[str, Dict[str, Any]]:
+            connector = type(self)()
+            connector.connect(self.config)
+            try:
+                return drain(connector)
+            finally:
+                connector.close()
+                
+        tables = {}
+        with ThreadPoolExecutor(max_workers=max_workers - 1) as executor:
+            futures = [executor.submit(worker) for _ in range(max_workers - 1)]
+            tables.update(drain(self))
+            # 任一线程出错时 stop 已被设置，其余线程领取完当前表后退出
+            for future in futures:
+                tables.update(future.result())
+                
+        return dict(sorted(tables.items()))
+        
+    def ping(self) -> bool:
+        """检查连接是否仍然可用"""
+        if not self.connection:
+            return False
+        try:
+            cursor = self.connection.cursor()
+            try:
+                cursor.execute(self._ping_sql)
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            return True
+        except Exception:
+            return False
+            
+    def reset(self) -> bool:
+        """结束当前事务，使连接可以放回连接池复用"""
+        if not self.connection:
+            return False
+        try:
+            self.connection.rollback()
+            return True
+        except Exception:
+            return False
+            
     def close(self):
         """关闭数据库连接"""
         if self.connection:
@@ -24,10 +242,20 @@ class BaseDBConnector:
             self.connection = None
 
 class MySQLConnector(BaseDBConnector):
-    """MySQL数据库连接器"""
+    """MySQL数据库连接器
+    
+    默认使用批量模式：通过information_schema的几次集合查询获取整个库的列和索引，
+    往返次数与表数量无关。原始建表语句（raw_sql）不参与比较，批量模式下不获取，
+    生成同步SQL时通过 get_create_table_sql 按需获取。
+    可在连接配置中设置 bulk_introspection=False 回退到逐表查询。
+    """
+    
+    # 逐表查询时整个库的表大小（表名 -> DATA_LENGTH），每次加载查询一次
+    _data_lengths = None
     
     def connect(self, config: Dict[str, Any]) -> None:
         """连接到MySQL数据库"""
+        self.config = config
         try:
             self.connection = mysql.connector.connect(
                 host=config['host'],
@@ -39,88 +267,264 @@ class MySQLConnector(BaseDBConnector):
         except Exception as e:
             raise Exception(f"连接MySQL数据库失败: {str(e)}")
             
+    def ping(self) -> bool:
+        """使用驱动自带的 ping 检查连接，不自动重连"""
+        if not self.connection:
+            return False
+        try:
+            self.connection.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+            
     def get_table_structure(self) -> Dict[str, Dict[str, Any]]:
         """获取所有表的结构"""
         if not self.connection:
             raise Exception("未连接到数据库")
             
-        cursor = self.connection.cursor(dictionary=True)
+        if self.config.get('bulk_introspection', True):
+            return self._get_table_structure_bulk()
+        return super().get_table_structure()
+        
+    def get_tables(self, table_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """获取指定表的结构"""
+        if self.config.get('bulk_introspection', True):
+            return self._get_table_structure_bulk(table_names)
+        # 表大小在本次加载中首次用到时重新查询
+        self._data_lengths = None
+        return super().get_tables(table_names)
+        
+    def get_create_table_sql(self, table_name: str) -> str:
+        """按需获取单个表的 SHOW CREATE TABLE 语句"""
+        if not self.connection:
+            raise Exception("未连接到数据库")
+            
+        cursor = self._cursor()
+        try:
+            return self._show_create_table(cursor, table_name)
+        finally:
+            cursor.close()
+            
+    def _show_create_table(self, cursor, table_name: str) -> str:
+        """执行 SHOW CREATE TABLE，返回原始建表语句"""
+        cursor.execute(f"SHOW CREATE TABLE `{table_name.replace('`', '``')}`")
+        return cursor.fetchone()['Create Table']
+        
+    def _cursor(self):
+        """创建返回字典行的游标"""
+        return self.connection.cursor(dictionary=True)
+        
+    def _list_tables(self, cursor) -> List[str]:
+        """获取所有表名"""
+        cursor.execute("SHOW TABLES")
+        return [row[f'Tables_in_{self.connection.database}'] for row in cursor.fetchall()]
+        
+    def _list_fingerprints(self, cursor) -> Optional[Dict[str, str]]:
+        """以表的创建时间、表选项以及列和索引定义的校验和作为指纹
+        
+        CREATE_TIME 只在重建表时变化，原地修改（如 INSTANT 加列）不会更新它，
+        因此额外对 COLUMNS / STATISTICS 按表聚合 CRC32，一次查询返回每表一行。
+        """
+        cursor.execute("""
+            SELECT t.TABLE_NAME AS table_name,
+                   CONCAT_WS('|', t.CREATE_TIME, t.ENGINE, t.TABLE_COLLATION, t.TABLE_COMMENT,
+                             c.checksum, s.checksum) AS fingerprint
+            FROM information_schema.TABLES t
+            LEFT JOIN (
+                SELECT TABLE_NAME,
+                       CONCAT(COUNT(*), ':', SUM(CRC32(CONCAT_WS('|', COLUMN_NAME, ORDINAL_POSITION,
+                           COLUMN_TYPE, COLLATION_NAME, IS_NULLABLE, COLUMN_KEY, COLUMN_DEFAULT,
+                           EXTRA, COLUMN_COMMENT)))) AS checksum
+                FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE()
+                GROUP BY TABLE_NAME
+            ) c ON c.TABLE_NAME = t.TABLE_NAME
+            LEFT JOIN (
+                SELECT TABLE_NAME,
+                       CONCAT(COUNT(*), ':', SUM(CRC32(CONCAT_WS('|', INDEX_NAME, NON_UNIQUE,
+                           SEQ_IN_INDEX, COLUMN_NAME)))) AS checksum
+                FROM information_schema.STATISTICS
+                WHERE TABLE_SCHEMA = DATABASE()
+                GROUP BY TABLE_NAME
+            ) s ON s.TABLE_NAME = t.TABLE_NAME
+            WHERE t.TABLE_SCHEMA = DATABASE() AND t.TABLE_TYPE = 'BASE TABLE'
+            ORDER BY t.TABLE_NAME
+        """)
+        # 指纹带上 raw_sql 的来源，早期由元数据生成建表语句的缓存快照会被重新获取
+        source = 'ddl' if self.config.get('fetch_create_sql', False) else 'lazy'
+        return {row['table_name']: f"{source}|{row['fingerprint']}" for row in cursor.fetchall()}
+        
+    def _get_table(self, cursor, table_name: str) -> Dict[str, Any]:
+        """逐表获取单个表的结构（三次查询，表大小按库一次性查询）"""
+        # 获取表结构
+        create_table_sql = self._show_create_table(cursor, table_name)
+        
+        # 获取列信息
+        cursor.execute(f"SHOW FULL COLUMNS FROM `{table_name}`")
+        columns = {}
+        for col in cursor.fetchall():
+            columns[col['Field']] = self._build_column(col)
+        
+        # 获取索引信息
+        cursor.execute(f"SHOW INDEX FROM `{table_name}`")
+        indexes = {}
+        for idx in cursor.fetchall():
+            self._add_index_column(indexes, idx)
+            
+        return {
+            'columns': columns,
+            'indexes': indexes,
+            'raw_sql': create_table_sql,
+            'data_length': self._table_data_lengths(cursor).get(table_name)
+        }
+        
+    def _table_data_lengths(self, cursor) -> Dict[str, Optional[int]]:
+        """整个库所有表的数据大小，每次加载（并行加载时每个连接）只查询一次"""
+        if self._data_lengths is None:
+            cursor.execute("""
+                SELECT TABLE_NAME AS table_name, DATA_LENGTH AS data_length
+                FROM information_schema.TABLES
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_TYPE = 'BASE TABLE'
+            """)
+            self._data_lengths = {row['table_name']: self._data_length(row['data_length']) for row in cursor.fetchall()}
+        return self._data_lengths
+        
+    @staticmethod
+    def _data_length(value) -> Optional[int]:
+        """information_schema.TABLES.DATA_LENGTH 转换为整数，未知时为 None"""
+        return int(value) if value is not None else None
+        
+    def _get_table_structure_bulk(self, table_names: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """批量获取所有表（或指定表）的结构
+        
+        列和索引分别通过一次 information_schema.COLUMNS / STATISTICS 查询获取，
+        查询结果的列名与 SHOW FULL COLUMNS / SHOW INDEX 保持一致，复用同一套构建逻辑。
+        raw_sql 为 None，只有新增表的同步SQL和按依赖排序需要它，届时通过 get_create_table_sql
+        按需获取（外键、CHECK 约束、前缀索引、生成列表达式、分区等无法从元数据可靠还原）。
+        设置 fetch_create_sql=True 时在加载时逐表执行 SHOW CREATE TABLE。
+        """
+        cursor = self._cursor()
         tables = {}
         
+        # 只获取指定表时在每个查询上追加表名过滤
+        table_filter = ''
+        params = ()
+        if table_names is not None:
+            if not table_names:
+                return tables
+            table_filter = f" AND TABLE_NAME IN ({', '.join(['%s'] * len(table_names))})"
+            params = tuple(table_names)
+            
         try:
-            # 获取所有表名
-            cursor.execute("SHOW TABLES")
-            table_names = [row[f'Tables_in_{self.connection.database}'] for row in cursor.fetchall()]
+            # 获取所有基础表及表选项（排除视图）
+            cursor.execute("""
+                SELECT TABLE_NAME AS table_name, ENGINE AS engine,
+                       TABLE_COLLATION AS table_collation, TABLE_COMMENT AS table_comment,
+                       DATA_LENGTH AS data_length
+                FROM information_schema.TABLES
+                WHERE TABLE_SCHEMA = DATABASE() AND TABLE_TYPE = 'BASE TABLE'""" + table_filter + """
+                ORDER BY TABLE_NAME
+            """, params)
+            table_options = {row['table_name']: row for row in cursor.fetchall()}
+            if table_names is None:
+                self._start_progress(len(table_options))
+            all_columns = {table_name: {} for table_name in table_options}
+            all_indexes = {table_name: {} for table_name in table_options}
             
-            for table_name in table_names:
-                # 获取表结构
-                cursor.execute(f"SHOW CREATE TABLE `{table_name}`")
-                create_table_sql = cursor.fetchone()['Create Table']
-                
-                # 获取列信息
-                cursor.execute(f"SHOW FULL COLUMNS FROM `{table_name}`")
-                columns = {}
-                for col in cursor.fetchall():
-                    col_name = col['Field']
-                    col_type = col['Type']
-                    col_null = 'NULL' if col['Null'] == 'YES' else 'NOT NULL'
-                    col_default = f"DEFAULT {col['Default']}" if col['Default'] is not None else ''
-                    col_extra = col['Extra']
-                    col_comment = f"COMMENT '{col['Comment']}'" if col['Comment'] else ''
-                    
-                    # 组合列定义 
-                    col_def = f"{col_type} {col_null} {col_default} {col_extra} {col_comment}".strip()
-                    columns[col_name] = {
-                        'raw': col_def,
-                        'normalized': normalize_sql_definition(col_def),
-                        'details': {
-                            "Type": col['Type'],
-                            "Collation": col['Collation'],
-                            "Null": col['Null'],
-                            "Key": col['Key'],
-                            "Default": col['Default'],
-                            "Extra": col['Extra'],
-                            "Comment": col['Comment'],
-                        }
-                    }
-                
-                # 获取索引信息
-                cursor.execute(f"SHOW INDEX FROM `{table_name}`")
-                indexes = {}
-                for idx in cursor.fetchall():
-                    idx_name = idx['Key_name']
-                    if idx_name == 'PRIMARY':
-                        idx_type = 'PRIMARY KEY'
-                    elif idx['Non_unique'] == 0:
-                        idx_type = 'UNIQUE KEY'
-                    else:
-                        idx_type = 'KEY'
-                        
-                    if idx_name not in indexes:
-                        indexes[idx_name] = {
-                            'type': idx_type,
-                            'columns': idx['Column_name']
-                        }
-                    else:
-                        # 如果索引包含多个列，将它们组合起来
-                        indexes[idx_name]['columns'] += f", {idx['Column_name']}"
+            # 一次性获取所有列信息
+            cursor.execute("""
+                SELECT TABLE_NAME AS table_name, COLUMN_NAME AS `Field`, COLUMN_TYPE AS `Type`,
+                       COLLATION_NAME AS `Collation`, IS_NULLABLE AS `Null`, COLUMN_KEY AS `Key`,
+                       COLUMN_DEFAULT AS `Default`, EXTRA AS `Extra`, COLUMN_COMMENT AS `Comment`
+                FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE()""" + table_filter + """
+                ORDER BY TABLE_NAME, ORDINAL_POSITION
+            """, params)
+            for col in cursor.fetchall():
+                columns = all_columns.get(col['table_name'])
+                if columns is not None:
+                    columns[col['Field']] = self._build_column(col)
+            
+            # 一次性获取所有索引信息
+            cursor.execute("""
+                SELECT TABLE_NAME AS table_name, INDEX_NAME AS `Key_name`,
+                       NON_UNIQUE AS `Non_unique`, COLUMN_NAME AS `Column_name`
+                FROM information_schema.STATISTICS
+                WHERE TABLE_SCHEMA = DATABASE()""" + table_filter + """
+                ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+            """, params)
+            for idx in cursor.fetchall():
+                indexes = all_indexes.get(idx['table_name'])
+                if indexes is not None:
+                    self._add_index_column(indexes, idx)
+            
+            fetch_create_sql = self.config.get('fetch_create_sql', False)
+            for table_name, options in table_options.items():
+                create_table_sql = self._show_create_table(cursor, table_name) if fetch_create_sql else None
                 
                 tables[table_name] = {
-                    'columns': columns,
-                    'indexes': indexes,
-                    'raw_sql': create_table_sql
+                    'columns': all_columns[table_name],
+                    'indexes': all_indexes[table_name],
+                    'raw_sql': create_table_sql,
+                    # 表数据大小（估算值），生成在线DDL时用于判断大表
+                    'data_length': self._data_length(options['data_length'])
                 }
+                self._report_progress(table_name, tables[table_name])
                 
         finally:
             cursor.close()
             
         return tables
+        
+    def _build_column(self, col: Dict[str, Any]) -> ColumnDef:
+        """根据 SHOW FULL COLUMNS 格式的行构建列信息"""
+        col_null = 'NULL' if col['Null'] == 'YES' else 'NOT NULL'
+        col_default = f"DEFAULT {col['Default']}" if col['Default'] is not None else ''
+        col_extra = col['Extra']
+        col_comment = f"COMMENT '{col['Comment']}'" if col['Comment'] else ''
+        
+        # 组合列定义 
+        col_def = f"{col['Type']} {col_null} {col_default} {col_extra} {col_comment}".strip()
+        return ColumnDef(col_def, {
+            "Type": col['Type'],
+            "Collation": col['Collation'],
+            "Null": col['Null'],
+            "Key": col['Key'],
+            "Default": col['Default'],
+            "Extra": col['Extra'],
+            "Comment": col['Comment'],
+        })
+        
+    def _add_index_column(self, indexes: Dict[str, Dict[str, Any]], idx: Dict[str, Any]) -> None:
+        """根据 SHOW INDEX 格式的行累加索引信息"""
+        idx_name = idx['Key_name']
+        if idx_name == 'PRIMARY':
+            idx_type = 'PRIMARY KEY'
+        elif idx['Non_unique'] == 0:
+            idx_type = 'UNIQUE KEY'
+        else:
+            idx_type = 'KEY'
+            
+        if idx_name not in indexes:
+            indexes[idx_name] = {
+                'type': idx_type,
+                'columns': idx['Column_name']
+            }
+        else:
+            # 如果索引包含多个列，将它们组合起来
+            indexes[idx_name]['columns'] += f", {idx['Column_name']}"
 
 class PostgreSQLConnector(BaseDBConnector):
-    """PostgreSQL数据库连接器"""
+    """PostgreSQL数据库连接器
+    
+    默认通过一次 pg_catalog 查询获取整个模式下所有表的列，再用一次查询获取所有索引，
+    查询次数与表数量无关。连接配置中的 schema 指定模式（默认 public），
+    bulk_introspection=False 时回退到逐表查询 information_schema。
+    """
     
     def connect(self, config: Dict[str, Any]) -> None:
         """连接到PostgreSQL数据库"""
+        self.config = config
         try:
             self.connection = psycopg2.connect(
                 host=config['host'],
@@ -132,121 +536,242 @@ class PostgreSQLConnector(BaseDBConnector):
         except Exception as e:
             raise Exception(f"连接PostgreSQL数据库失败: {str(e)}")
             
+    @property
+    def schema(self) -> str:
+        """当前比较的模式名"""
+        return self.config.get('schema') or 'public'
+            
     def get_table_structure(self) -> Dict[str, Dict[str, Any]]:
         """获取所有表的结构"""
         if not self.connection:
             raise Exception("未连接到数据库")
             
+        if self.config.get('bulk_introspection', True):
+            return self._get_table_structure_bulk()
+        return super().get_table_structure()
+        
+    def get_tables(self, table_names: List[str]) -> Dict[str, Dict[str, Any]]:
+        """获取指定表的结构"""
+        if self.config.get('bulk_introspection', True):
+            return self._get_table_structure_bulk(table_names)
+        return super().get_tables(table_names)
+        
+    def _list_fingerprints(self, cursor) -> Optional[Dict[str, str]]:
+        """以表及其列、默认值、索引、注释在系统目录中的行版本（xmin）作为指纹
+        
+        任何 DDL 都会改写对应的目录行并产生新的 xmin，只查询目录，不访问表数据。
+        """
+        cursor.execute("""
+            SELECT c.relname,
+                   md5(concat_ws('|', c.xmin::text,
+                       (SELECT string_agg(a.attnum || ':' || a.xmin::text, ',' ORDER BY a.attnum)
+                        FROM pg_attribute a WHERE a.attrelid = c.oid AND a.attnum > 0),
+                       (SELECT string_agg(ad.adnum || ':' || ad.xmin::text, ',' ORDER BY ad.adnum)
+                        FROM pg_attrdef ad WHERE ad.adrelid = c.oid),
+                       (SELECT string_agg(ix.indexrelid || ':' || ix.xmin::text, ',' ORDER BY ix.indexrelid)
+                        FROM pg_index ix WHERE ix.indrelid = c.oid),
+                       (SELECT string_agg(d.objsubid || ':' || d.xmin::text, ',' ORDER BY d.objsubid)
+                        FROM pg_description d
+                        WHERE d.objoid = c.oid AND d.classoid = 'pg_class'::regclass)))
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s AND c.relkind IN ('r', 'p')
+            ORDER BY c.relname
+        """, (self.schema,))
+        return {row[0]: row[1] for row in cursor.fetchall()}
+        
+    def _list_tables(self, cursor) -> List[str]:
+        """获取模式下的所有表名（排除系统表）"""
+        cursor.execute("""
+            SELECT tablename 
+            FROM pg_tables 
+            WHERE schemaname = %s 
+            ORDER BY tablename
+        """, (self.schema,))
+        return [row[0] for row in cursor.fetchall()]
+        
+    def _get_table(self, cursor, table_name: str) -> Dict[str, Any]:
+        """逐表获取单个表的结构（两次查询）"""
+        # 获取表结构
+        cursor.execute(f"""
+            SELECT column_name, data_type, is_nullable, column_default, 
+                   character_maximum_length, numeric_precision, numeric_scale,
+                   udt_name, col_description((quote_ident(table_schema)||'.'||quote_ident(table_name))::regclass, ordinal_position) as comment
+            FROM information_schema.columns 
+            WHERE table_name = %s AND table_schema = %s
+            ORDER BY ordinal_position
+        """, (table_name, self.schema))
+        
+        columns = {}
+        for col in cursor.fetchall():
+            columns[col[0]] = self._build_column(*col[1:])
+            
+        # 获取索引信息
+        cursor.execute(f"""
+            SELECT 
+                i.relname as index_name,
+                a.attname as column_name,
+                ix.indisunique as is_unique,
+                ix.indisprimary as is_primary
+            FROM pg_class t, pg_class i, pg_index ix, pg_attribute a, pg_namespace n
+            WHERE t.oid = ix.indrelid 
+                AND i.oid = ix.indexrelid 
+                AND a.attrelid = t.oid 
+                AND a.attnum = ANY(ix.indkey)
+                AND n.oid = t.relnamespace
+                AND t.relkind = 'r'
+                AND t.relname = %s
+                AND n.nspname = %s
+            ORDER BY i.relname, a.attnum
+        """, (table_name, self.schema))
+        
+        indexes = {}
+        for idx in cursor.fetchall():
+            self._add_index_column(indexes, *idx)
+            
+        # 生成CREATE TABLE语句（简化版）
+        create_table_sql = self._generate_create_table_sql(table_name, columns, indexes)
+        
+        return {
+            'columns': columns,
+            'indexes': indexes,
+            'raw_sql': create_table_sql
+        }
+        
+    def _get_table_structure_bulk(self, table_names: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """通过pg_catalog一次性获取整个模式（或指定表）的结构，在客户端按表分组
+        
+        长度、精度和小数位由 atttypmod 解码，输出与 information_schema 路径一致。
+        """
         cursor = self.connection.cursor()
         tables = {}
         
+        # 只获取指定表时在每个查询上追加表名过滤
+        table_filter = ''
+        params = (self.schema,)
+        if table_names is not None:
+            if not table_names:
+                return tables
+            table_filter = " AND {}.relname = ANY(%s)"
+            params = (self.schema, list(table_names))
+            
         try:
-            # 获取所有表名（排除系统表）
+            # 获取所有表名（普通表和分区表）
             cursor.execute("""
-                SELECT tablename 
-                FROM pg_tables 
-                WHERE schemaname = 'public' 
-                ORDER BY tablename
-            """)
-            table_names = [row[0] for row in cursor.fetchall()]
+                SELECT c.relname
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = %s AND c.relkind IN ('r', 'p')""" + table_filter.format('c') + """
+                ORDER BY c.relname
+            """, params)
+            all_columns = {row[0]: {} for row in cursor.fetchall()}
+            all_indexes = {table_name: {} for table_name in all_columns}
+            if table_names is None:
+                self._start_progress(len(all_columns))
             
-            for table_name in table_names:
-                # 获取表结构
-                cursor.execute(f"""
-                    SELECT column_name, data_type, is_nullable, column_default, 
-                           character_maximum_length, numeric_precision, numeric_scale,
-                           udt_name, col_description((table_schema||'.'||table_name)::regclass, ordinal_position) as comment
-                    FROM information_schema.columns 
-                    WHERE table_name = %s AND table_schema = 'public'
-                    ORDER BY ordinal_position
-                """, (table_name,))
-                
-                columns = {}
-                for col in cursor.fetchall():
-                    col_name = col[0]
-                    col_type = col[1]
-                    is_nullable = col[2]
-                    col_default = col[3]
-                    char_max_length = col[4]
-                    numeric_precision = col[5]
-                    numeric_scale = col[6]
-                    udt_name = col[7]
-                    comment = col[8]
-                    
-                    # 构建完整的类型定义
-                    full_type = self._build_postgresql_type(col_type, char_max_length, numeric_precision, numeric_scale)
-                    
-                    # 构建列定义
-                    col_null = 'NULL' if is_nullable == 'YES' else 'NOT NULL'
-                    col_default_str = f"DEFAULT {col_default}" if col_default else ''
-                    col_comment = f"COMMENT '{comment}'" if comment else ''
-                    
-                    col_def = f"{full_type} {col_null} {col_default_str} {col_comment}".strip()
-                    columns[col_name] = {
-                        'raw': col_def,
-                        'normalized': normalize_sql_definition(col_def),
-                        'details': {
-                            "Type": full_type,
-                            "Null": is_nullable,
-                            "Default": col_default,
-                            "Comment": comment,
-                            "UDT": udt_name,
-                        }
-                    }
-                
-                # 获取索引信息
-                cursor.execute(f"""
-                    SELECT 
-                        i.relname as index_name,
-                        a.attname as column_name,
-                        ix.indisunique as is_unique,
-                        ix.indisprimary as is_primary
-                    FROM pg_class t, pg_class i, pg_index ix, pg_attribute a
-                    WHERE t.oid = ix.indrelid 
-                        AND i.oid = ix.indexrelid 
-                        AND a.attrelid = t.oid 
-                        AND a.attnum = ANY(ix.indkey)
-                        AND t.relkind = 'r'
-                        AND t.relname = %s
-                    ORDER BY i.relname, a.attnum
-                """, (table_name,))
-                
-                indexes = {}
-                for idx in cursor.fetchall():
-                    idx_name = idx[0]
-                    col_name = idx[1]
-                    is_unique = idx[2]
-                    is_primary = idx[3]
-                    
-                    if is_primary:
-                        idx_type = 'PRIMARY KEY'
-                    elif is_unique:
-                        idx_type = 'UNIQUE KEY'
-                    else:
-                        idx_type = 'KEY'
-                        
-                    if idx_name not in indexes:
-                        indexes[idx_name] = {
-                            'type': idx_type,
-                            'columns': col_name
-                        }
-                    else:
-                        # 如果索引包含多个列，将它们组合起来
-                        indexes[idx_name]['columns'] += f", {col_name}"
-                
-                # 生成CREATE TABLE语句（简化版）
-                create_table_sql = self._generate_create_table_sql(table_name, columns, indexes)
-                
+            # 一次性获取所有列信息（1042=bpchar, 1043=varchar, 1700=numeric）
+            cursor.execute("""
+                SELECT c.relname,
+                       a.attname,
+                       format_type(a.atttypid, NULL),
+                       CASE WHEN a.attnotnull THEN 'NO' ELSE 'YES' END,
+                       pg_get_expr(ad.adbin, ad.adrelid),
+                       CASE WHEN a.atttypid IN (1042, 1043) AND a.atttypmod > 0
+                            THEN a.atttypmod - 4 END,
+                       CASE WHEN a.atttypid = 1700 AND a.atttypmod > 0
+                            THEN ((a.atttypmod - 4) >> 16) & 65535 END,
+                       CASE WHEN a.atttypid = 1700 AND a.atttypmod > 0
+                            THEN (a.atttypmod - 4) & 65535 END,
+                       t.typname,
+                       d.description
+                FROM pg_attribute a
+                JOIN pg_class c ON c.oid = a.attrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                JOIN pg_type t ON t.oid = a.atttypid
+                LEFT JOIN pg_attrdef ad ON ad.adrelid = a.attrelid AND ad.adnum = a.attnum
+                LEFT JOIN pg_description d ON d.objoid = a.attrelid AND d.objsubid = a.attnum
+                    AND d.classoid = 'pg_class'::regclass
+                WHERE n.nspname = %s
+                    AND c.relkind IN ('r', 'p')
+                    AND a.attnum > 0
+                    AND NOT a.attisdropped""" + table_filter.format('c') + """
+                ORDER BY c.relname, a.attnum
+            """, params)
+            for col in cursor.fetchall():
+                columns = all_columns.get(col[0])
+                if columns is not None:
+                    columns[col[1]] = self._build_column(*col[2:])
+            
+            # 一次性获取所有索引信息，按索引键顺序排列
+            cursor.execute("""
+                SELECT t.relname, i.relname, a.attname, ix.indisunique, ix.indisprimary
+                FROM pg_index ix
+                JOIN pg_class t ON t.oid = ix.indrelid
+                JOIN pg_class i ON i.oid = ix.indexrelid
+                JOIN pg_namespace n ON n.oid = t.relnamespace
+                CROSS JOIN LATERAL unnest(ix.indkey::int2[]) WITH ORDINALITY AS k(attnum, ord)
+                JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = k.attnum
+                WHERE n.nspname = %s AND t.relkind IN ('r', 'p')""" + table_filter.format('t') + """
+                ORDER BY t.relname, i.relname, k.ord
+            """, params)
+            for idx in cursor.fetchall():
+                indexes = all_indexes.get(idx[0])
+                if indexes is not None:
+                    self._add_index_column(indexes, *idx[1:])
+            
+            for table_name, columns in all_columns.items():
+                indexes = all_indexes[table_name]
                 tables[table_name] = {
                     'columns': columns,
                     'indexes': indexes,
-                    'raw_sql': create_table_sql
+                    'raw_sql': self._generate_create_table_sql(table_name, columns, indexes)
                 }
+                self._report_progress(table_name, tables[table_name])
                 
         finally:
             cursor.close()
             
         return tables
+        
+    def _build_column(self, col_type: str, is_nullable: str, col_default: Optional[str],
+                      char_max_length: Optional[int], numeric_precision: Optional[int],
+                      numeric_scale: Optional[int], udt_name: str, comment: Optional[str]) -> ColumnDef:
+        """构建列信息"""
+        # 构建完整的类型定义
+        full_type = self._build_postgresql_type(col_type, char_max_length, numeric_precision, numeric_scale)
+        
+        # 构建列定义
+        col_null = 'NULL' if is_nullable == 'YES' else 'NOT NULL'
+        col_default_str = f"DEFAULT {col_default}" if col_default else ''
+        col_comment = f"COMMENT '{comment}'" if comment else ''
+        
+        col_def = f"{full_type} {col_null} {col_default_str} {col_comment}".strip()
+        return ColumnDef(col_def, {
+            "Type": full_type,
+            "Null": is_nullable,
+            "Default": col_default,
+            "Comment": comment,
+            "UDT": udt_name,
+        })
+        
+    def _add_index_column(self, indexes: Dict[str, Dict[str, Any]], idx_name: str, col_name: str,
+                          is_unique: bool, is_primary: bool) -> None:
+        """累加索引信息"""
+        if is_primary:
+            idx_type = 'PRIMARY KEY'
+        elif is_unique:
+            idx_type = 'UNIQUE KEY'
+        else:
+            idx_type = 'KEY'
+            
+        if idx_name not in indexes:
+            indexes[idx_name] = {
+                'type': idx_type,
+                'columns': col_name
+            }
+        else:
+            # 如果索引包含多个列，将它们组合起来
+            indexes[idx_name]['columns'] += f", {col_name}"
     
     def _build_postgresql_type(self, base_type: str, char_max_length: Optional[int], 
                               numeric_precision: Optional[int], numeric_scale: Optional[int]) -> str:
@@ -299,8 +824,11 @@ class PostgreSQLConnector(BaseDBConnector):
 class OracleConnector(BaseDBConnector):
     """Oracle数据库连接器"""
     
+    _ping_sql = "SELECT 1 FROM DUAL"
+    
     def connect(self, config: Dict[str, Any]) -> None:
         """连接到Oracle数据库"""
+        self.config = config
         try:
             import cx_Oracle
             # 构建连接字符串
@@ -327,113 +855,112 @@ class OracleConnector(BaseDBConnector):
         except Exception as e:
             raise Exception(f"连接Oracle数据库失败: {str(e)}")
             
-    def get_table_structure(self) -> Dict[str, Dict[str, Any]]:
-        """获取所有表的结构"""
-        if not self.connection:
-            raise Exception("未连接到数据库")
+    def _list_tables(self, cursor) -> List[str]:
+        """获取当前用户的所有表名"""
+        cursor.execute("""
+            SELECT table_name 
+            FROM user_tables 
+            ORDER BY table_name
+        """)
+        return [row[0] for row in cursor.fetchall()]
+        
+    def _list_fingerprints(self, cursor) -> Optional[Dict[str, str]]:
+        """以表和其索引的最后DDL时间作为指纹"""
+        cursor.execute("""
+            SELECT o.object_name,
+                   TO_CHAR(o.last_ddl_time, 'YYYYMMDDHH24MISS') || ':' || (
+                       SELECT COUNT(*) || ':' || TO_CHAR(MAX(io.last_ddl_time), 'YYYYMMDDHH24MISS')
+                       FROM user_indexes i
+                       JOIN user_objects io ON io.object_name = i.index_name AND io.object_type = 'INDEX'
+                       WHERE i.table_name = o.object_name)
+            FROM user_objects o
+            WHERE o.object_type = 'TABLE'
+            ORDER BY o.object_name
+        """)
+        return {row[0]: row[1] for row in cursor.fetchall()}
+        
+    def _get_table(self, cursor, table_name: str) -> Dict[str, Any]:
+        """获取单个表的结构"""
+        # 获取列信息
+        cursor.execute(f"""
+            SELECT column_name, data_type, data_length, data_precision, data_scale,
+                   nullable, data_default, comments
+            FROM user_col_comments uc
+            LEFT JOIN user_tab_columns utc ON uc.table_name = utc.table_name 
+                AND uc.column_name = utc.column_name
+            WHERE uc.table_name = :table_name
+            ORDER BY utc.column_id
+        """, table_name=table_name)
+        
+        columns = {}
+        for col in cursor.fetchall():
+            col_name = col[0]
+            col_type = col[1]
+            data_length = col[2]
+            data_precision = col[3]
+            data_scale = col[4]
+            nullable = col[5]
+            data_default = col[6]
+            comments = col[7]
             
-        cursor = self.connection.cursor()
-        tables = {}
+            # 构建类型定义
+            full_type = self._build_oracle_type(col_type, data_length, data_precision, data_scale)
+            
+            # 构建列定义
+            col_null = 'NULL' if nullable == 'Y' else 'NOT NULL'
+            col_default = f"DEFAULT {data_default}" if data_default else ''
+            col_comment = f"COMMENT '{comments}'" if comments else ''
+            
+            col_def = f"{full_type} {col_null} {col_default} {col_comment}".strip()
+            columns[col_name] = ColumnDef(col_def, {
+                "Type": full_type,
+                "Null": nullable,
+                "Default": data_default,
+                "Comment": comments,
+                "Length": data_length,
+                "Precision": data_precision,
+                "Scale": data_scale,
+            })
+            
+        # 获取索引信息
+        cursor.execute(f"""
+            SELECT index_name, uniqueness, column_name
+            FROM user_ind_columns uic
+            JOIN user_indexes ui ON uic.index_name = ui.index_name
+            WHERE uic.table_name = :table_name
+            ORDER BY uic.index_name, uic.column_position
+        """, table_name=table_name)
         
-        try:
-            # 获取当前用户的表
-            cursor.execute("""
-                SELECT table_name 
-                FROM user_tables 
-                ORDER BY table_name
-            """)
-            table_names = [row[0] for row in cursor.fetchall()]
+        indexes = {}
+        for idx in cursor.fetchall():
+            idx_name = idx[0]
+            uniqueness = idx[1]
+            col_name = idx[2]
             
-            for table_name in table_names:
-                # 获取列信息
-                cursor.execute(f"""
-                    SELECT column_name, data_type, data_length, data_precision, data_scale,
-                           nullable, data_default, comments
-                    FROM user_col_comments uc
-                    LEFT JOIN user_tab_columns utc ON uc.table_name = utc.table_name 
-                        AND uc.column_name = utc.column_name
-                    WHERE uc.table_name = :table_name
-                    ORDER BY utc.column_id
-                """, table_name=table_name)
+            if idx_name == 'SYS_C':
+                continue  # 跳过系统生成的索引
                 
-                columns = {}
-                for col in cursor.fetchall():
-                    col_name = col[0]
-                    col_type = col[1]
-                    data_length = col[2]
-                    data_precision = col[3]
-                    data_scale = col[4]
-                    nullable = col[5]
-                    data_default = col[6]
-                    comments = col[7]
-                    
-                    # 构建类型定义
-                    full_type = self._build_oracle_type(col_type, data_length, data_precision, data_scale)
-                    
-                    # 构建列定义
-                    col_null = 'NULL' if nullable == 'Y' else 'NOT NULL'
-                    col_default = f"DEFAULT {data_default}" if data_default else ''
-                    col_comment = f"COMMENT '{comments}'" if comments else ''
-                    
-                    col_def = f"{full_type} {col_null} {col_default} {col_comment}".strip()
-                    columns[col_name] = {
-                        'raw': col_def,
-                        'normalized': normalize_sql_definition(col_def),
-                        'details': {
-                            "Type": full_type,
-                            "Null": nullable,
-                            "Default": data_default,
-                            "Comment": comments,
-                            "Length": data_length,
-                            "Precision": data_precision,
-                            "Scale": data_scale,
-                        }
-                    }
-                
-                # 获取索引信息
-                cursor.execute(f"""
-                    SELECT index_name, uniqueness, column_name
-                    FROM user_ind_columns uic
-                    JOIN user_indexes ui ON uic.index_name = ui.index_name
-                    WHERE uic.table_name = :table_name
-                    ORDER BY uic.index_name, uic.column_position
-                """, table_name=table_name)
-                
-                indexes = {}
-                for idx in cursor.fetchall():
-                    idx_name = idx[0]
-                    uniqueness = idx[1]
-                    col_name = idx[2]
-                    
-                    if idx_name == 'SYS_C':
-                        continue  # 跳过系统生成的索引
-                    
-                    if 'UNIQUE' in uniqueness:
-                        idx_type = 'UNIQUE KEY'
-                    else:
-                        idx_type = 'KEY'
-                        
-                    if idx_name not in indexes:
-                        indexes[idx_name] = {
-                            'type': idx_type,
-                            'columns': col_name
-                        }
-                    else:
-                        indexes[idx_name]['columns'] += f", {col_name}"
-                
-                # 生成CREATE TABLE语句
-                create_table_sql = self._generate_create_table_sql(table_name, columns, indexes)
+            if 'UNIQUE' in uniqueness:
+                idx_type = 'UNIQUE KEY'
+            else:
+                idx_type = 'KEY'
                 
-                tables[table_name] = {
-                    'columns': columns,
-                    'indexes': indexes,
-                    'raw_sql': create_table_sql
+            if idx_name not in indexes:
+                indexes[idx_name] = {
+                    'type': idx_type,
+                    'columns': col_name
                 }
+            else:
+                indexes[idx_name]['columns'] += f", {col_name}"
                 
-        finally:
-            cursor.close()
-            
-        return tables
+        # 生成CREATE TABLE语句
+        create_table_sql = self._generate_create_table_sql(table_name, columns, indexes)
+        
+        return {
+            'columns': columns,
+            'indexes': indexes,
+            'raw_sql': create_table_sql
+        }
     
     def _build_oracle_type(self, base_type: str, data_length: Optional[int], 
                           data_precision: Optional[int], data_scale: Optional[int]) -> str:
@@ -482,6 +1009,7 @@ class SQLServerConnector(BaseDBConnector):
     
     def connect(self, config: Dict[str, Any]) -> None:
         """连接到SQL Server数据库"""
+        self.config = config
         try:
             import pyodbc
             # 构建连接字符串
@@ -496,114 +1024,108 @@ class SQLServerConnector(BaseDBConnector):
         except Exception as e:
             raise Exception(f"连接SQL Server数据库失败: {str(e)}")
             
-    def get_table_structure(self) -> Dict[str, Dict[str, Any]]:
-        """获取所有表的结构"""
-        if not self.connection:
-            raise Exception("未连接到数据库")
+    def _list_tables(self, cursor) -> List[str]:
+        """获取所有表名"""
+        cursor.execute("""
+            SELECT TABLE_NAME 
+            FROM INFORMATION_SCHEMA.TABLES 
+            WHERE TABLE_TYPE = 'BASE TABLE'
+            ORDER BY TABLE_NAME
+        """)
+        return [row[0] for row in cursor.fetchall()]
+        
+    def _list_fingerprints(self, cursor) -> Optional[Dict[str, str]]:
+        """以表的修改时间作为指纹（ALTER TABLE 以及创建、修改索引都会更新 modify_date）"""
+        cursor.execute("""
+            SELECT name, CONVERT(varchar(33), MAX(modify_date), 126)
+            FROM sys.tables
+            GROUP BY name
+            ORDER BY name
+        """)
+        return {row[0]: row[1] for row in cursor.fetchall()}
+        
+    def _get_table(self, cursor, table_name: str) -> Dict[str, Any]:
+        """获取单个表的结构"""
+        # 获取列信息
+        cursor.execute(f"""
+            SELECT COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH, 
+                   NUMERIC_PRECISION, NUMERIC_SCALE, IS_NULLABLE, 
+                   COLUMN_DEFAULT, COLUMNPROPERTY(object_id(TABLE_SCHEMA + '.' + TABLE_NAME), COLUMN_NAME, 'IsIdentity') as IS_IDENTITY
+            FROM INFORMATION_SCHEMA.COLUMNS 
+            WHERE TABLE_NAME = ?
+            ORDER BY ORDINAL_POSITION
+        """, table_name)
+        
+        columns = {}
+        for col in cursor.fetchall():
+            col_name = col[0]
+            col_type = col[1]
+            char_max_length = col[2]
+            numeric_precision = col[3]
+            numeric_scale = col[4]
+            is_nullable = col[5]
+            col_default = col[6]
+            is_identity = col[7]
             
-        cursor = self.connection.cursor()
-        tables = {}
+            # 构建类型定义
+            full_type = self._build_sqlserver_type(col_type, char_max_length, numeric_precision, numeric_scale)
+            
+            # 构建列定义
+            col_null = 'NULL' if is_nullable == 'YES' else 'NOT NULL'
+            col_default = f"DEFAULT {col_default}" if col_default else ''
+            identity = 'IDENTITY(1,1)' if is_identity else ''
+            
+            col_def = f"{full_type} {col_null} {col_default} {identity}".strip()
+            columns[col_name] = ColumnDef(col_def, {
+                "Type": full_type,
+                "Null": is_nullable,
+                "Default": col_default,
+                "Identity": is_identity,
+                "Length": char_max_length,
+                "Precision": numeric_precision,
+                "Scale": numeric_scale,
+            })
+            
+        # 获取索引信息
+        cursor.execute(f"""
+            SELECT i.name as index_name, i.is_unique, i.is_primary_key, c.name as column_name
+            FROM sys.indexes i
+            JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
+            JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
+            WHERE i.object_id = OBJECT_ID(?)
+            ORDER BY i.name, ic.key_ordinal
+        """, table_name)
         
-        try:
-            # 获取所有表名
-            cursor.execute("""
-                SELECT TABLE_NAME 
-                FROM INFORMATION_SCHEMA.TABLES 
-                WHERE TABLE_TYPE = 'BASE TABLE'
-                ORDER BY TABLE_NAME
-            """)
-            table_names = [row[0] for row in cursor.fetchall()]
+        indexes = {}
+        for idx in cursor.fetchall():
+            idx_name = idx[0]
+            is_unique = idx[1]
+            is_primary = idx[2]
+            col_name = idx[3]
             
-            for table_name in table_names:
-                # 获取列信息
-                cursor.execute(f"""
-                    SELECT COLUMN_NAME, DATA_TYPE, CHARACTER_MAXIMUM_LENGTH, 
-                           NUMERIC_PRECISION, NUMERIC_SCALE, IS_NULLABLE, 
-                           COLUMN_DEFAULT, COLUMNPROPERTY(object_id(TABLE_SCHEMA + '.' + TABLE_NAME), COLUMN_NAME, 'IsIdentity') as IS_IDENTITY
-                    FROM INFORMATION_SCHEMA.COLUMNS 
-                    WHERE TABLE_NAME = ?
-                    ORDER BY ORDINAL_POSITION
-                """, table_name)
-                
-                columns = {}
-                for col in cursor.fetchall():
-                    col_name = col[0]
-                    col_type = col[1]
-                    char_max_length = col[2]
-                    numeric_precision = col[3]
-                    numeric_scale = col[4]
-                    is_nullable = col[5]
-                    col_default = col[6]
-                    is_identity = col[7]
-                    
-                    # 构建类型定义
-                    full_type = self._build_sqlserver_type(col_type, char_max_length, numeric_precision, numeric_scale)
-                    
-                    # 构建列定义
-                    col_null = 'NULL' if is_nullable == 'YES' else 'NOT NULL'
-                    col_default = f"DEFAULT {col_default}" if col_default else ''
-                    identity = 'IDENTITY(1,1)' if is_identity else ''
-                    
-                    col_def = f"{full_type} {col_null} {col_default} {identity}".strip()
-                    columns[col_name] = {
-                        'raw': col_def,
-                        'normalized': normalize_sql_definition(col_def),
-                        'details': {
-                            "Type": full_type,
-                            "Null": is_nullable,
-                            "Default": col_default,
-                            "Identity": is_identity,
-                            "Length": char_max_length,
-                            "Precision": numeric_precision,
-                            "Scale": numeric_scale,
-                        }
-                    }
-                
-                # 获取索引信息
-                cursor.execute(f"""
-                    SELECT i.name as index_name, i.is_unique, i.is_primary_key, c.name as column_name
-                    FROM sys.indexes i
-                    JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
-                    JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
-                    WHERE i.object_id = OBJECT_ID(?)
-                    ORDER BY i.name, ic.key_ordinal
-                """, table_name)
-                
-                indexes = {}
-                for idx in cursor.fetchall():
-                    idx_name = idx[0]
-                    is_unique = idx[1]
-                    is_primary = idx[2]
-                    col_name = idx[3]
-                    
-                    if is_primary:
-                        idx_type = 'PRIMARY KEY'
-                    elif is_unique:
-                        idx_type = 'UNIQUE KEY'
-                    else:
-                        idx_type = 'KEY'
-                        
-                    if idx_name not in indexes:
-                        indexes[idx_name] = {
-                            'type': idx_type,
-                            'columns': col_name
-                        }
-                    else:
-                        indexes[idx_name]['columns'] += f", {col_name}"
-                
-                # 生成CREATE TABLE语句
-                create_table_sql = self._generate_create_table_sql(table_name, columns, indexes)
+            if is_primary:
+                idx_type = 'PRIMARY KEY'
+            elif is_unique:
+                idx_type = 'UNIQUE KEY'
+            else:
+                idx_type = 'KEY'
                 
-                tables[table_name] = {
-                    'columns': columns,
-                    'indexes': indexes,
-                    'raw_sql': create_table_sql
+            if idx_name not in indexes:
+                indexes[idx_name] = {
+                    'type': idx_type,
+                    'columns': col_name
                 }
+            else:
+                indexes[idx_name]['columns'] += f", {col_name}"
                 
-        finally:
-            cursor.close()
-            
-        return tables
+        # 生成CREATE TABLE语句
+        create_table_sql = self._generate_create_table_sql(table_name, columns, indexes)
+        
+        return {
+            'columns': columns,
+            'indexes': indexes,
+            'raw_sql': create_table_sql
+        }
     
     def _build_sqlserver_type(self, base_type: str, char_max_length: Optional[int], 
                              numeric_precision: Optional[int], numeric_scale: Optional[int]) -> str:
@@ -656,100 +1178,90 @@ class SQLiteConnector(BaseDBConnector):
     
     def connect(self, config: Dict[str, Any]) -> None:
         """连接到SQLite数据库"""
+        self.config = config
         try:
             import sqlite3
             db_path = config.get('database', config.get('file', ':memory:'))
-            self.connection = sqlite3.connect(db_path)
+            # 连接可能由连接池交给其他线程使用（同一时间只有一个使用者）
+            self.connection = sqlite3.connect(db_path, check_same_thread=False)
             self.connection.row_factory = sqlite3.Row
         except ImportError:
             raise Exception("SQLite驱动未安装，请先安装sqlite3: pip install sqlite3")
         except Exception as e:
             raise Exception(f"连接SQLite数据库失败: {str(e)}")
             
-    def get_table_structure(self) -> Dict[str, Dict[str, Any]]:
-        """获取所有表的结构"""
-        if not self.connection:
-            raise Exception("未连接到数据库")
+    def _list_tables(self, cursor) -> List[str]:
+        """获取所有表名"""
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
+        return [row[0] for row in cursor.fetchall()]
+        
+    def _list_fingerprints(self, cursor) -> Optional[Dict[str, str]]:
+        """以表及其索引在 sqlite_master 中保存的建表语句作为指纹"""
+        cursor.execute("""
+            SELECT tbl_name, group_concat(type || ':' || name || ':' || COALESCE(sql, ''), char(10))
+            FROM (SELECT * FROM sqlite_master WHERE type IN ('table', 'index') ORDER BY type DESC, name)
+            GROUP BY tbl_name
+            ORDER BY tbl_name
+        """)
+        return {row[0]: row[1] for row in cursor.fetchall()}
+        
+    def _get_table(self, cursor, table_name: str) -> Dict[str, Any]:
+        """获取单个表的结构"""
+        # 获取表结构
+        cursor.execute(f"PRAGMA table_info({table_name})")
+        columns = {}
+        
+        for col in cursor.fetchall():
+            col_name = col[1]
+            col_type = col[2]
+            not_null = col[3]
+            col_default = col[4]
+            primary_key = col[5]
             
-        cursor = self.connection.cursor()
-        tables = {}
+            # 构建列定义
+            col_null = 'NOT NULL' if not_null else 'NULL'
+            col_default_str = f"DEFAULT {col_default}" if col_default else ''
+            primary_key_str = 'PRIMARY KEY' if primary_key else ''
+            
+            col_def = f"{col_type} {col_null} {col_default_str} {primary_key_str}".strip()
+            columns[col_name] = ColumnDef(col_def, {
+                "Type": col_type,
+                "Null": 'NO' if not_null else 'YES',
+                "Default": col_default,
+                "PrimaryKey": primary_key,
+            })
+            
+        # 获取索引信息
+        cursor.execute(f"PRAGMA index_list({table_name})")
+        indexes = {}
         
-        try:
-            # 获取所有表名
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name")
-            table_names = [row[0] for row in cursor.fetchall()]
+        for idx in cursor.fetchall():
+            idx_name = idx[1]
+            is_unique = idx[2]
             
-            for table_name in table_names:
-                # 获取表结构
-                cursor.execute(f"PRAGMA table_info({table_name})")
-                columns = {}
-                
-                for col in cursor.fetchall():
-                    col_name = col[1]
-                    col_type = col[2]
-                    not_null = col[3]
-                    col_default = col[4]
-                    primary_key = col[5]
-                    
-                    # 构建列定义
-                    col_null = 'NOT NULL' if not_null else 'NULL'
-                    col_default_str = f"DEFAULT {col_default}" if col_default else ''
-                    primary_key_str = 'PRIMARY KEY' if primary_key else ''
-                    
-                    col_def = f"{col_type} {col_null} {col_default_str} {primary_key_str}".strip()
-                    columns[col_name] = {
-                        'raw': col_def,
-                        'normalized': normalize_sql_definition(col_def),
-                        'details': {
-                            "Type": col_type,
-                            "Null": 'NO' if not_null else 'YES',
-                            "Default": col_default,
-                            "PrimaryKey": primary_key,
-                        }
-                    }
-                
-                # 获取索引信息
-                cursor.execute(f"PRAGMA index_list({table_name})")
-                indexes = {}
-                
-                for idx in cursor.fetchall():
-                    idx_name = idx[1]
-                    is_unique = idx[2]
-                    
-                    # 获取索引列
-                    cursor.execute(f"PRAGMA index_info({idx_name})")
-                    idx_columns = []
-                    for col_info in cursor.fetchall():
-                        col_pos = col_info[2]
-                        cursor.execute(f"PRAGMA table_info({table_name})")
-                        table_cols = cursor.fetchall()
-                        if col_pos < len(table_cols):
-                            idx_columns.append(table_cols[col_pos][1])
+            # 获取索引列（index_info 返回 seqno, cid, name）
+            cursor.execute(f"PRAGMA index_info({idx_name})")
+            idx_columns = [col_info[2] for col_info in cursor.fetchall() if col_info[2]]
+            
+            if idx_columns:
+                if is_unique:
+                    idx_type = 'UNIQUE KEY'
+                else:
+                    idx_type = 'KEY'
                     
-                    if idx_columns:
-                        if is_unique:
-                            idx_type = 'UNIQUE KEY'
-                        else:
-                            idx_type = 'KEY'
-                        
-                        indexes[idx_name] = {
-                            'type': idx_type,
-                            'columns': ', '.join(idx_columns)
-                        }
-                
-                # 生成CREATE TABLE语句
-                create_table_sql = self._generate_create_table_sql(table_name, columns, indexes)
-                
-                tables[table_name] = {
-                    'columns': columns,
-                    'indexes': indexes,
-                    'raw_sql': create_table_sql
+                indexes[idx_name] = {
+                    'type': idx_type,
+                    'columns': ', '.join(idx_columns)
                 }
                 
-        finally:
-            cursor.close()
-            
-        return tables
+        # 生成CREATE TABLE语句
+        create_table_sql = self._generate_create_table_sql(table_name, columns, indexes)
+        
+        return {
+            'columns': columns,
+            'indexes': indexes,
+            'raw_sql': create_table_sql
+        }
     
     def _generate_create_table_sql(self, table_name: str, columns: Dict, indexes: Dict) -> str:
         """生成CREATE TABLE语句"""
@@ -776,6 +1288,7 @@ class MongoDBConnector(BaseDBConnector):
     
     def connect(self, config: Dict[str, Any]) -> None:
         """连接到MongoDB数据库"""
+        self.config = config
         try:
             from pymongo import MongoClient
             
@@ -796,6 +1309,24 @@ class MongoDBConnector(BaseDBConnector):
         except Exception as e:
             raise Exception(f"连接MongoDB数据库失败: {str(e)}")
             
+    def ping(self) -> bool:
+        """通过 ping 命令检查连接"""
+        if not self.connection:
+            return False
+        try:
+            self.connection.admin.command('ping')
+            return True
+        except Exception:
+            return False
+            
+    def reset(self) -> bool:
+        """MongoDB 连接没有需要结束的事务"""
+        return self.connection is not None
+        
+    def get_table_fingerprints(self) -> Optional[Dict[str, str]]:
+        """集合结构由样本文档推断，没有可用的结构指纹"""
+        return None
+            
     def get_table_structure(self) -> Dict[str, Dict[str, Any]]:
         """获取所有集合的结构"""
         if not self.connection:
@@ -806,6 +1337,7 @@ class MongoDBConnector(BaseDBConnector):
         try:
             # 获取所有集合名
             collection_names = self.database.list_collection_names()
+            self._start_progress(len(collection_names))
             
             for collection_name in collection_names:
                 # 获取集合的文档结构
@@ -826,7 +1358,10 @@ class MongoDBConnector(BaseDBConnector):
                     'indexes': indexes,
                     'raw_sql': create_table_sql
                 }
+                self._report_progress(collection_name, collections[collection_name])
                 
+        except LoadCancelled:
+            raise
         except Exception as e:
             raise Exception(f"获取MongoDB集合结构失败: {str(e)}")
             
@@ -847,16 +1382,12 @@ class MongoDBConnector(BaseDBConnector):
         # 为每个字段确定类型
         for field in all_fields:
             field_type = self._determine_field_type(sample_docs, field)
-            columns[field] = {
-                'raw': field_type,
-                'normalized': normalize_sql_definition(field_type),
-                'details': {
-                    "Type": field_type,
-                    "Null": "YES",  # MongoDB字段可以为空
-                    "Default": None,
-                    "Comment": f"MongoDB字段: {field}",
-                }
-            }
+            columns[field] = ColumnDef(field_type, {
+                "Type": field_type,
+                "Null": "YES",  # MongoDB字段可以为空
+                "Default": None,
+                "Comment": f"MongoDB字段: {field}",
+            })
         
         return columns
     
@@ -975,8 +1506,11 @@ class MongoDBConnector(BaseDBConnector):
 class Db2Connector(BaseDBConnector):
     """IBM Db2数据库连接器"""
     
+    _ping_sql = "SELECT 1 FROM SYSIBM.SYSDUMMY1"
+    
     def connect(self, config: Dict[str, Any]) -> None:
         """连接到IBM Db2数据库"""
+        self.config = config
         try:
             import ibm_db
             import ibm_db_dbi
@@ -999,106 +1533,105 @@ class Db2Connector(BaseDBConnector):
         except Exception as e:
             raise Exception(f"连接IBM Db2数据库失败: {str(e)}")
             
-    def get_table_structure(self) -> Dict[str, Dict[str, Any]]:
-        """获取所有表的结构"""
-        if not self.connection:
-            raise Exception("未连接到数据库")
+    def _list_tables(self, cursor) -> List[str]:
+        """获取当前模式下的所有表名"""
+        cursor.execute("""
+            SELECT TABNAME 
+            FROM SYSCAT.TABLES 
+            WHERE TABSCHEMA = CURRENT SCHEMA 
+            AND TYPE = 'T'
+            ORDER BY TABNAME
+        """)
+        return [row[0] for row in cursor.fetchall()]
+        
+    def _list_fingerprints(self, cursor) -> Optional[Dict[str, str]]:
+        """以表的修改时间和其索引的数量、最后创建时间作为指纹"""
+        cursor.execute("""
+            SELECT t.TABNAME,
+                   VARCHAR(t.ALTER_TIME) || ':' || (
+                       SELECT VARCHAR(COUNT(*)) || ':' || COALESCE(VARCHAR(MAX(i.CREATE_TIME)), '')
+                       FROM SYSCAT.INDEXES i
+                       WHERE i.TABSCHEMA = t.TABSCHEMA AND i.TABNAME = t.TABNAME)
+            FROM SYSCAT.TABLES t
+            WHERE t.TABSCHEMA = CURRENT SCHEMA 
+            AND t.TYPE = 'T'
+            ORDER BY t.TABNAME
+        """)
+        return {row[0]: row[1] for row in cursor.fetchall()}
+        
+    def _get_table(self, cursor, table_name: str) -> Dict[str, Any]:
+        """获取单个表的结构"""
+        # 获取列信息
+        cursor.execute(f"""
+            SELECT COLNAME, TYPENAME, LENGTH, SCALE, NULLS, DEFAULT, REMARKS
+            FROM SYSCAT.COLUMNS 
+            WHERE TABNAME = ? AND TABSCHEMA = CURRENT SCHEMA
+            ORDER BY COLNO
+        """, (table_name,))
+        
+        columns = {}
+        for col in cursor.fetchall():
+            col_name = col[0]
+            col_type = col[1]
+            length = col[2]
+            scale = col[3]
+            nulls = col[4]
+            default_val = col[5]
+            remarks = col[6]
             
-        cursor = self.connection.cursor()
-        tables = {}
+            # 构建类型定义
+            full_type = self._build_db2_type(col_type, length, scale)
+            
+            # 构建列定义
+            col_null = 'NULL' if nulls == 'Y' else 'NOT NULL'
+            col_default = f"DEFAULT {default_val}" if default_val else ''
+            col_comment = f"COMMENT '{remarks}'" if remarks else ''
+            
+            col_def = f"{full_type} {col_null} {col_default} {col_comment}".strip()
+            columns[col_name] = ColumnDef(col_def, {
+                "Type": full_type,
+                "Null": nulls,
+                "Default": default_val,
+                "Comment": remarks,
+                "Length": length,
+                "Scale": scale,
+            })
+            
+        # 获取索引信息
+        cursor.execute(f"""
+            SELECT IXNAME, UNIQUERULE, COLNAMES
+            FROM SYSCAT.INDEXES 
+            WHERE TABNAME = ? AND TABSCHEMA = CURRENT SCHEMA
+            ORDER BY IXNAME
+        """, (table_name,))
         
-        try:
-            # 获取所有表名
-            cursor.execute("""
-                SELECT TABNAME 
-                FROM SYSCAT.TABLES 
-                WHERE TABSCHEMA = CURRENT SCHEMA 
-                AND TYPE = 'T'
-                ORDER BY TABNAME
-            """)
-            table_names = [row[0] for row in cursor.fetchall()]
+        indexes = {}
+        for idx in cursor.fetchall():
+            idx_name = idx[0]
+            unique_rule = idx[1]
+            col_names = idx[2]
             
-            for table_name in table_names:
-                # 获取列信息
-                cursor.execute(f"""
-                    SELECT COLNAME, TYPENAME, LENGTH, SCALE, NULLS, DEFAULT, REMARKS
-                    FROM SYSCAT.COLUMNS 
-                    WHERE TABNAME = ? AND TABSCHEMA = CURRENT SCHEMA
-                    ORDER BY COLNO
-                """, (table_name,))
-                
-                columns = {}
-                for col in cursor.fetchall():
-                    col_name = col[0]
-                    col_type = col[1]
-                    length = col[2]
-                    scale = col[3]
-                    nulls = col[4]
-                    default_val = col[5]
-                    remarks = col[6]
-                    
-                    # 构建类型定义
-                    full_type = self._build_db2_type(col_type, length, scale)
-                    
-                    # 构建列定义
-                    col_null = 'NULL' if nulls == 'Y' else 'NOT NULL'
-                    col_default = f"DEFAULT {default_val}" if default_val else ''
-                    col_comment = f"COMMENT '{remarks}'" if remarks else ''
-                    
-                    col_def = f"{full_type} {col_null} {col_default} {col_comment}".strip()
-                    columns[col_name] = {
-                        'raw': col_def,
-                        'normalized': normalize_sql_definition(col_def),
-                        'details': {
-                            "Type": full_type,
-                            "Null": nulls,
-                            "Default": default_val,
-                            "Comment": remarks,
-                            "Length": length,
-                            "Scale": scale,
-                        }
-                    }
-                
-                # 获取索引信息
-                cursor.execute(f"""
-                    SELECT IXNAME, UNIQUERULE, COLNAMES
-                    FROM SYSCAT.INDEXES 
-                    WHERE TABNAME = ? AND TABSCHEMA = CURRENT SCHEMA
-                    ORDER BY IXNAME
-                """, (table_name,))
-                
-                indexes = {}
-                for idx in cursor.fetchall():
-                    idx_name = idx[0]
-                    unique_rule = idx[1]
-                    col_names = idx[2]
-                    
-                    # 确定索引类型
-                    if unique_rule == 'P':
-                        idx_type = 'PRIMARY KEY'
-                    elif unique_rule == 'U':
-                        idx_type = 'UNIQUE KEY'
-                    else:
-                        idx_type = 'KEY'
-                        
-                    indexes[idx_name] = {
-                        'type': idx_type,
-                        'columns': col_names
-                    }
-                
-                # 生成CREATE TABLE语句
-                create_table_sql = self._generate_create_table_sql(table_name, columns, indexes)
-                
-                tables[table_name] = {
-                    'columns': columns,
-                    'indexes': indexes,
-                    'raw_sql': create_table_sql
-                }
+            # 确定索引类型
+            if unique_rule == 'P':
+                idx_type = 'PRIMARY KEY'
+            elif unique_rule == 'U':
+                idx_type = 'UNIQUE KEY'
+            else:
+                idx_type = 'KEY'
                 
-        finally:
-            cursor.close()
+            indexes[idx_name] = {
+                'type': idx_type,
+                'columns': col_names
+            }
             
-        return tables
+        # 生成CREATE TABLE语句
+        create_table_sql = self._generate_create_table_sql(table_name, columns, indexes)
+        
+        return {
+            'columns': columns,
+            'indexes': indexes,
+            'raw_sql': create_table_sql
+        }
     
     def _build_db2_type(self, base_type: str, length: Optional[int], scale: Optional[int]) -> str:
         """构建Db2类型定义"""
@@ -1147,53 +1680,188 @@ class Db2Connector(BaseDBConnector):
         
         return "\n".join(sql_parts)
 
+class ConnectionPool:
+    """按连接配置复用数据库连接的连接池
+    
+    以数据库类型和完整连接配置作为键保存空闲连接。取出时先做健康检查（ping），
+    失效的连接直接丢弃；放回时结束当前事务，超过空闲上限的连接直接关闭。
+    连接配置中的 pool_size（每个键保留的空闲连接数，0 表示不复用）和
+    pool_idle_timeout（空闲超时秒数）可覆盖默认值。
+    """
+    
+    def __init__(self, max_size: int = 2, idle_timeout: float = 300.0):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._idle: Dict[str, List[tuple]] = {}
+        self._lock = threading.Lock()
+        
+    @staticmethod
+    def make_key(db_type: str, config: Dict[str, Any]) -> str:
+        """生成连接池键"""
+        return json.dumps([db_type.lower(), config], sort_keys=True, default=str)
+        
+    def acquire(self, db_type: str, config: Dict[str, Any]) -> BaseDBConnector:
+        """取出一个可用连接，没有空闲连接时新建"""
+        key = self.make_key(db_type, config)
+        while True:
+            with self._lock:
+                expired = self._pop_expired()
+                idle = self._idle.get(key)
+                connector = idle.pop()[0] if idle else None
+            self._close_all(expired)
+            if connector is None:
+                break
+            if connector.ping():
+                return connector
+            self._close_all([connector])
+            
+        connector = DBConnector.create_connector(db_type)
+        connector.connect(config)
+        connector.pool_key = key
+        return connector
+        
+    def release(self, connector: BaseDBConnector) -> None:
+        """将连接放回连接池"""
+        key = getattr(connector, 'pool_key', None)
+        max_size = int(connector.config.get('pool_size', self.max_size))
+        idle_timeout = float(connector.config.get('pool_idle_timeout', self.idle_timeout))
+        if key is None or max_size <= 0 or not connector.reset():
+            self._close_all([connector])
+            return
+            
+        with self._lock:
+            expired = self._pop_expired()
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < max_size:
+                idle.append((connector, time.monotonic() + idle_timeout))
+                connector = None
+        self._close_all(expired)
+        if connector:
+            self._close_all([connector])
+            
+    def clear(self) -> None:
+        """关闭所有空闲连接"""
+        with self._lock:
+            connectors = [entry[0] for idle in self._idle.values() for entry in idle]
+            self._idle.clear()
+        self._close_all(connectors)
+        
+    def _pop_expired(self) -> List[BaseDBConnector]:
+        """移除已超过空闲时间的连接，调用方需持有锁"""
+        now = time.monotonic()
+        expired = []
+        for key in list(self._idle):
+            idle = self._idle[key]
+            expired.extend(entry[0] for entry in idle if entry[1] <= now)
+            idle[:] = [entry for entry in idle if entry[1] > now]
+            if not idle:
+                del self._idle[key]
+        return expired
+        
+    @staticmethod
+    def _close_all(connectors: List[BaseDBConnector]) -> None:
+        """关闭连接，忽略关闭时的错误"""
+        for connector in connectors:
+            try:
+                connector.close()
+            except Exception:
+                pass
+
 class DBConnector:
-    """数据库连接器工厂类"""
+    """数据库连接器工厂类
     
-    def __init__(self):
+    连接来自进程内共享的连接池，close() 会把连接放回连接池而不是直接断开，
+    重复加载同一个保存的连接时可复用已建立的会话。
+    
+    传入 schema_cache（data.models.SchemaCache）时，以本地快照作为上一次的结果调用
+    refresh，只重新获取指纹发生变化的表。
+    """
+    
+    connector_classes = {
+        "mysql": MySQLConnector,
+        "postgresql": PostgreSQLConnector,
+        "oracle": OracleConnector,
+        "sqlserver": SQLServerConnector,
+        "sqlite": SQLiteConnector,
+        "mongodb": MongoDBConnector,
+        "db2": Db2Connector,
+    }
+    
+    pool = ConnectionPool()
+    
+    def __init__(self, schema_cache=None):
         self.connector = None
         self.connection_type = None
+        self.schema_cache = schema_cache
+        
+    @classmethod
+    def create_connector(cls, db_type: str) -> BaseDBConnector:
+        """根据类型创建相应的连接器"""
+        connector_class = cls.connector_classes.get(db_type.lower())
+        if connector_class is None:
+            raise Exception(f"不支持的数据库类型: {db_type}")
+        return connector_class()
         
     def connect(self, config: Dict[str, Any], db_type: str = "mysql") -> None:
         """连接到指定类型的数据库"""
-        # 关闭现有连接
-        if self.connector:
-            self.connector.close()
-            
-        # 根据类型创建相应的连接器
-        if db_type.lower() == "mysql":
-            self.connector = MySQLConnector()
-        elif db_type.lower() == "postgresql":
-            self.connector = PostgreSQLConnector()
-        elif db_type.lower() == "oracle":
-            self.connector = OracleConnector()
-        elif db_type.lower() == "sqlserver":
-            self.connector = SQLServerConnector()
-        elif db_type.lower() == "sqlite":
-            self.connector = SQLiteConnector()
-        elif db_type.lower() == "mongodb":
-            self.connector = MongoDBConnector()
-        elif db_type.lower() == "db2":
-            self.connector = Db2Connector()
-        else:
-            raise Exception(f"不支持的数据库类型: {db_type}")
-            
+        # 归还现有连接
+        self.close()
+        
+        self.connector = self.pool.acquire(db_type, config)
         self.connection_type = db_type.lower()
-        self.connector.connect(config)
         
-    def get_table_structure(self) -> Dict[str, Dict[str, Any]]:
-        """获取所有表的结构"""
+    def get_table_structure(self, progress_callback=None, cancel_event: Optional[threading.Event] = None) -> Dict[str, Dict[str, Any]]:
+        """获取所有表的结构
+        
+        progress_callback(done, total, table_name, structure) 在每个表获取完成后调用
+        （可能来自工作线程）；cancel_event 置位后在下一个表之前抛出 LoadCancelled。
+        """
+        if not self.connector:
+            raise Exception("未连接到数据库")
+            
+        self.connector.progress_callback = progress_callback
+        self.connector.cancel_event = cancel_event
+        try:
+            return self._get_table_structure()
+        finally:
+            self.connector.progress_callback = None
+            self.connector.cancel_event = None
+            
+    def _get_table_structure(self) -> Dict[str, Dict[str, Any]]:
+        """获取所有表的结构，启用快照缓存时增量获取"""
+        if self.schema_cache is None or not self.connector.config.get('schema_cache', True):
+            return self.connector.get_table_structure()
+            
+        conn_key = self.schema_cache.make_key(self.connection_type, self.connector.config)
+        previous_tables = self.schema_cache.load(conn_key)
+        tables = self.connector.refresh(previous_tables)
+        self.schema_cache.save(conn_key, tables, previous_tables)
+        return tables
+        
+    def refresh(self, previous_tables: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """基于上一次的结果增量刷新表结构，只重新查询新增和变更的表"""
         if not self.connector:
             raise Exception("未连接到数据库")
-        return self.connector.get_table_structure()
+        return self.connector.refresh(previous_tables)
+        
+    def get_create_table_sql(self, table_name: str) -> Optional[str]:
+        """按需获取单个表的原始建表语句"""
+        if not self.connector:
+            raise Exception("未连接到数据库")
+        return self.connector.get_create_table_sql(table_name)
         
     def close(self):
-        """关闭数据库连接"""
+        """释放数据库连接（放回连接池）"""
         if self.connector:
-            self.connector.close()
+            self.pool.release(self.connector)
             self.connector = None
             self.connection_type = None
             
+    @classmethod
+    def close_all(cls):
+        """断开连接池中的所有空闲连接，应用退出时调用"""
+        cls.pool.clear()
+        
     def get_connection_type(self) -> Optional[str]:
         """获取当前连接类型"""
-        return self.connection_type 
\ No newline at end of file
+        return self.connection_type 
@@ -0,0 +1,69 @@
+import re
+from typing import Optional, Tuple
+
+from sqlparse import keywords
+
+# CREATE [TEMPORARY] TABLE [IF NOT EXISTS] 表名 (
+_IDENTIFIER = r'(?:`[^`]+`|"[^"]+"|\[[^\]]+\]|[A-Za-z_][A-Za-z0-9_]*)'
+_CREATE_TABLE_HEAD_RE = re.compile(
+    r'\s*CREATE\s+(?:TEMPORARY\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?'
+    r'(' + _IDENTIFIER + r'(?:\.' + _IDENTIFIER + r')*)\s*\(',
+    re.IGNORECASE
+)
+_IDENTIFIER_PART_RE = re.compile(_IDENTIFIER)
+
+# 括号扫描：完整的字符串和引号标识符整体跳过，其余只关心括号
+# 注释、反斜杠和未闭合的引号交给 sqlparse 处理，保证两条路径的结果一致
+_BODY_TOKEN_RE = re.compile(r"'[^']*'|\"[^\"]*\"|`[^`]*`|[()]|--|/\*|#|\\|['\"`]")
+_FALLBACK_TOKENS = frozenset(('--', '/*', '#', '\\', "'", '"', '`'))
+
+# 未加引号时会被 sqlparse 识别为关键字（而不是标识符）的表名，交给 sqlparse 处理
+_SQLPARSE_KEYWORDS = frozenset(
+    keyword.upper()
+    for name in dir(keywords) if name.startswith('KEYWORDS')
+    for keyword in getattr(keywords, name)
+    if isinstance(getattr(keywords, name), dict)
+)
+
+def scan_create_table(statement: str) -> Optional[Tuple[str, str]]:
+    """快速解析 CREATE TABLE 语句，返回 (表名, 括号内容)
+    
+    只处理"表名 + 一个定义括号 + 不含括号的表选项"这种常见形式，表名与 sqlparse
+    Identifier.get_name() 的结果相同（最后一段、去掉反引号和双引号），括号内容与
+    Parenthesis.value 相同。其他形式（分区、AS SELECT、注释等）返回 None，由调用方
+    回退到 sqlparse。
+    """
+    match = _CREATE_TABLE_HEAD_RE.match(statement)
+    if match is None:
+        return None
+        
+    parts = _IDENTIFIER_PART_RE.findall(match.group(1))
+    for part in parts:
+        if part[0] not in '`"[' and part.upper() in _SQLPARSE_KEYWORDS:
+            return None
+    table_name = parts[-1]
+    if table_name[0] in '`"':
+        table_name = table_name[1:-1]
+        
+    body_start = match.end() - 1
+    body_end = None
+    depth = 0
+    for token in _BODY_TOKEN_RE.finditer(statement, body_start):
+        value = token.group()
+        if value in _FALLBACK_TOKENS:
+            return None
+        if value == '(':
+            if body_end is not None:
+                # 定义括号之后还有括号（如分区定义）
+                return None
+            depth += 1
+        elif value == ')':
+            if body_end is not None:
+                return None
+            depth -= 1
+            if depth == 0:
+                body_end = token.end()
+                
+    if body_end is None:
+        return None
+    return table_name, statement[body_start:body_end]
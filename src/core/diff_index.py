@@ -0,0 +1,102 @@
+from collections.abc import Mapping
+from typing import Dict, Any, List, Iterator, Tuple
+
+class DiffIndex:
+    """扁平化的逐行差异索引
+    
+    比较完成后一次性为每个表、每个字段计算显示状态，保存在并行的列表和字节数组中。
+    界面直接按状态数组过滤和着色，切换"隐藏相同行"/"仅显示缺失"只需 O(行数) 的遍历，
+    无需重新比较或重新标准化字段定义。
+    """
+    
+    # 字段行状态
+    SAME = 0
+    MODIFIED = 1
+    MISSING_LEFT = 2    # 左侧缺失（仅右侧存在）
+    MISSING_RIGHT = 3   # 右侧缺失（仅左侧存在）
+    
+    def __init__(self):
+        # 每个表：(表名, 左侧字段数, 右侧字段数, 表是否有差异, 字段起始下标, 字段结束下标)
+        self.tables: List[Tuple[str, int, int, bool, int, int]] = []
+        # 每个字段行（按表依次排列）
+        self.column_names: List[str] = []
+        self.left_defs: List[str] = []
+        self.right_defs: List[str] = []
+        self.statuses = bytearray()
+        
+    @classmethod
+    def build(cls, left_tables: Dict[str, Dict[str, Any]], right_tables: Dict[str, Dict[str, Any]],
+              differences: Dict[str, Any]) -> 'DiffIndex':
+        """根据两侧表结构和 compare_tables 的差异结果构建索引"""
+        index = cls()
+        modified_tables = differences.get('modified_tables', {})
+        added_tables = set(differences.get('added_tables', []))
+        removed_tables = set(differences.get('removed_tables', []))
+        
+        for table_name in sorted(set(left_tables) | set(right_tables)):
+            left_columns = left_tables.get(table_name, {}).get('columns', {})
+            right_columns = right_tables.get(table_name, {}).get('columns', {})
+            
+            # 该表中被比较器标记为有差异的字段
+            changed_columns = set()
+            column_changes = modified_tables.get(table_name, {}).get('columns')
+            if column_changes:
+                changed_columns.update(column_changes.get('removed_columns', {}))
+                changed_columns.update(column_changes.get('added_columns', {}))
+                changed_columns.update(column_changes.get('modified_columns', {}))
+                
+            start = len(index.statuses)
+            for col_name in sorted(set(left_columns) | set(right_columns)):
+                left_def = left_columns.get(col_name)
+                right_def = right_columns.get(col_name)
+                
+                if not left_def:
+                    status = cls.MISSING_LEFT
+                elif not right_def:
+                    status = cls.MISSING_RIGHT
+                elif col_name in changed_columns:
+                    status = cls.MODIFIED
+                else:
+                    status = cls.SAME
+                    
+                index.column_names.append(col_name)
+                index.left_defs.append(cls._display(left_def))
+                index.right_defs.append(cls._display(right_def))
+                index.statuses.append(status)
+                
+            has_differences = (
+                table_name in modified_tables or
+                table_name in added_tables or
+                table_name in removed_tables
+            )
+            index.tables.append((table_name, len(left_columns), len(right_columns),
+                                 has_differences, start, len(index.statuses)))
+            
+        return index
+        
+    @staticmethod
+    def _display(definition) -> str:
+        """字段定义的显示文本"""
+        if isinstance(definition, Mapping):
+            return definition.get('raw', '')
+        return definition or ''
+        
+    def rows(self, hide_same: bool = False, show_missing_only: bool = False) -> Iterator[tuple]:
+        """按过滤条件依次产生显示行
+        
+        表头行为 (None, 表序号, 表名, 左侧字段数, 右侧字段数)，
+        字段行为 (状态, 字段序号, 字段名, 左侧定义, 右侧定义)。
+        """
+        statuses = self.statuses
+        for table_index, (table_name, left_count, right_count, has_differences, start, end) in enumerate(self.tables, 1):
+            if hide_same and not has_differences:
+                continue
+            yield (None, table_index, table_name, left_count, right_count)
+            
+            for row in range(start, end):
+                status = statuses[row]
+                if hide_same and status == self.SAME:
+                    continue
+                if show_missing_only and status < self.MISSING_LEFT:
+                    continue
+                yield (status, row - start + 1, self.column_names[row], self.left_defs[row], self.right_defs[row])
@@ -0,0 +1,157 @@
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+# 外键引用的表名，支持 `x`、"x"、[x] 以及 schema.x 的写法
+_REFERENCES_RE = re.compile(
+    r'\bREFERENCES\s+(?:[`"\[]?[\w$#@]+[`"\]]?\s*\.\s*)*[`"\[]?([\w$#@]+)[`"\]]?',
+    re.IGNORECASE
+)
+
+def referenced_tables(raw_sql: Optional[str]) -> Set[str]:
+    """建表语句中外键引用的表（小写）"""
+    if not raw_sql:
+        return set()
+    return {name.lower() for name in _REFERENCES_RE.findall(raw_sql)}
+
+class MigrationStep:
+    """迁移计划中的一步：一个表的全部同步SQL
+    
+    operation 为 create / drop / alter，depends_on 为必须先执行的步骤。
+    同一个表内的顺序由生成器保证：MySQL 先删除索引（包括被修改的索引和主键的旧定义），
+    再修改列，最后添加索引；修改主键时删除和添加写在同一条 ALTER TABLE 中。
+    主键、唯一键变化对其他表的影响通过外键引用体现在步骤之间的依赖上。
+    """
+    
+    __slots__ = ('operation', 'table_name', 'lines', 'depends_on')
+    
+    def __init__(self, operation: str, table_name: str, lines: List[str]):
+        self.operation = operation
+        self.table_name = table_name
+        self.lines = lines
+        self.depends_on: List['MigrationStep'] = []
+        
+    @property
+    def sql(self) -> str:
+        """该步骤的SQL文本"""
+        return "\n".join(self.lines)
+        
+    def __repr__(self):
+        return f"MigrationStep({self.operation}, {self.table_name})"
+
+class MigrationPlan:
+    """按依赖关系分批的迁移计划
+    
+    waves 中每一批的步骤互不依赖，可以在不同的连接上并行执行，批与批之间按顺序执行。
+    cyclic_steps 为存在循环依赖、无法排序的步骤，需要在所有批次之后依次执行。
+    """
+    
+    def __init__(self, waves: List[List[MigrationStep]], cyclic_steps: List[MigrationStep]):
+        self.waves = waves
+        self.cyclic_steps = cyclic_steps
+        
+    @property
+    def steps(self) -> List[MigrationStep]:
+        """按执行顺序排列的全部步骤"""
+        return [step for wave in self.waves for step in wave] + self.cyclic_steps
+        
+    def iter_lines(self, separator: Tuple[str, ...] = ("",)):
+        """逐行产生分批的同步SQL，每批前输出一行批次说明"""
+        for number, wave in enumerate(self.waves, 1):
+            yield f"-- ===== 第 {number} 批：{len(wave)} 个表，可并行执行 ====="
+            yield from separator
+            for step in wave:
+                yield from step.lines
+                yield from separator
+                
+        if self.cyclic_steps:
+            yield f"-- ===== 循环依赖：{len(self.cyclic_steps)} 个表，需要依次执行（必要时先临时禁用外键检查） ====="
+            yield from separator
+            for step in self.cyclic_steps:
+                yield from step.lines
+                yield from separator
+
+def _lower_index(tables: Dict[str, Any]) -> Dict[str, str]:
+    """表名（小写）-> 表名"""
+    index = {}
+    for name in tables:
+        index.setdefault(name.lower(), name)
+    return index
+
+def _table_raw_sql(tables: Dict[str, Any], table_name: str) -> Optional[str]:
+    """表结构中已有的建表语句"""
+    return tables[table_name].get('raw_sql')
+
+def build_migration_plan(changes: Iterable[Tuple[str, str, Iterable[str]]],
+                         left_tables: Dict[str, Any], right_tables: Dict[str, Any],
+                         raw_sql: Callable[[Dict[str, Any], str], Optional[str]] = _table_raw_sql) -> MigrationPlan:
+    """根据 (操作, 表名, SQL行) 形式的每表修改和外键引用生成迁移计划
+    
+    依赖关系从建表语句中的 REFERENCES 子句得到（表名不区分大小写）：
+    - 新增的表、或修改后新增了引用的表，在被引用的新增或修改的表之后执行；
+    - 被删除的表在所有原来引用它的表（修改或删除）之后删除；
+    - 修改后不再引用另一个被修改的表时，先去掉引用再修改被引用的表（如修改主键）。
+    按拓扑层次分批，同一批内保持原来的输出顺序。
+    raw_sql(tables, table_name) 返回表的建表语句，只对计划中的表调用，可以按需从数据库获取。
+    """
+    steps = [MigrationStep(operation, table_name, list(lines)) for operation, table_name, lines in changes]
+    by_name: Dict[str, MigrationStep] = {}
+    for step in steps:
+        by_name.setdefault(step.table_name.lower(), step)
+        
+    lower_left = _lower_index(left_tables)
+    lower_right = _lower_index(right_tables)
+    
+    def create_sql(tables, lower_tables, table_name):
+        # 表名不区分大小写
+        name = table_name if table_name in tables else lower_tables.get(table_name.lower())
+        return raw_sql(tables, name) if name is not None else None
+    
+    def add_dependency(step, dependency):
+        if dependency is not step and dependency not in step.depends_on:
+            step.depends_on.append(dependency)
+            
+    for step in steps:
+        old_references = set()
+        new_references = set()
+        if step.operation in ('alter', 'drop'):
+            old_references = referenced_tables(create_sql(left_tables, lower_left, step.table_name))
+        if step.operation in ('create', 'alter'):
+            new_references = referenced_tables(create_sql(right_tables, lower_right, step.table_name))
+            
+        for name in new_references:
+            target = by_name.get(name)
+            if not target or target.operation == 'drop':
+                continue
+            # 修改前已经存在的引用不受执行顺序影响
+            if target.operation == 'create' or name not in old_references:
+                add_dependency(step, target)
+                
+        for name in old_references:
+            target = by_name.get(name)
+            if not target:
+                continue
+            if target.operation == 'drop' or (target.operation == 'alter' and name not in new_references):
+                add_dependency(target, step)
+                
+    # 按层次拓扑排序：没有未完成依赖的步骤组成一批
+    position = {id(step): index for index, step in enumerate(steps)}
+    remaining = {id(step): len(step.depends_on) for step in steps}
+    dependents: Dict[int, List[MigrationStep]] = {id(step): [] for step in steps}
+    for step in steps:
+        for dependency in step.depends_on:
+            dependents[id(dependency)].append(step)
+            
+    waves = []
+    ready = [step for step in steps if not step.depends_on]
+    while ready:
+        waves.append(ready)
+        next_ready = []
+        for step in ready:
+            for dependent in dependents[id(step)]:
+                remaining[id(dependent)] -= 1
+                if remaining[id(dependent)] == 0:
+                    next_ready.append(dependent)
+        ready = sorted(next_ready, key=lambda item: position[id(item)])
+        
+    cyclic_steps = [step for step in steps if remaining[id(step)] > 0]
+    return MigrationPlan(waves, cyclic_steps)
@@ -0,0 +1,269 @@
+import re
+import shlex
+from typing import Any, Iterable, List, Optional, Tuple
+
+from .column_parser import MYSQL_COLUMNS
+
+# MySQL 在线DDL算法，按代价从低到高排列
+INSTANT = 'INSTANT'
+INPLACE = 'INPLACE'
+COPY = 'COPY'
+_ALGORITHM_ORDER = {INSTANT: 0, INPLACE: 1, COPY: 2}
+
+# 需要复制表的修改，表大小（字节）达到该值时改为输出 gh-ost / pt-online-schema-change 命令
+ONLINE_DDL_MIN_TABLE_SIZE = 1 << 30
+
+# 字符集每个字符最多占用的字节数，用于判断 VARCHAR 长度前缀是否变化
+_CHARSET_MAX_BYTES = {
+    'ascii': 1, 'latin1': 1, 'binary': 1,
+    'gbk': 2, 'gb2312': 2, 'big5': 2, 'ucs2': 2,
+    'utf8': 3, 'utf8mb3': 3, 'gb18030': 4, 'utf8mb4': 4, 'utf16': 4, 'utf32': 4,
+}
+_VARCHAR_RE = re.compile(r'^(varchar|varbinary)\((\d+)\)$')
+_ENUM_RE = re.compile(r'^(enum|set)\((.*)\)$', re.DOTALL)
+_ENUM_MEMBER_RE = re.compile(r"'((?:[^'\\]|\\.|'')*)'")
+
+class DDLClassification:
+    """一个 ALTER 子句（或整条语句）的在线DDL分类
+    
+    algorithm 为 MySQL 可以使用的代价最低的算法，concurrent_dml 表示执行期间是否
+    允许并发读写（可以指定 LOCK=NONE），rebuild 表示是否需要重建表。
+    inplace_rebuild 表示 INSTANT 的修改和其他修改写在同一条语句中、只能使用 INPLACE 时
+    是否需要重建表（如加列、删列）。
+    """
+    
+    __slots__ = ('algorithm', 'concurrent_dml', 'rebuild', 'inplace_rebuild')
+    
+    def __init__(self, algorithm: str, concurrent_dml: bool = True, rebuild: bool = False,
+                 inplace_rebuild: bool = False):
+        self.algorithm = algorithm
+        self.concurrent_dml = concurrent_dml if algorithm != COPY else False
+        self.rebuild = rebuild or algorithm == COPY
+        self.inplace_rebuild = inplace_rebuild
+        
+    @property
+    def hint(self) -> str:
+        """追加到 ALTER TABLE 末尾的 ALGORITHM / LOCK 子句
+        
+        ALGORITHM=INSTANT 不允许同时指定 LOCK；指定后 MySQL 无法按该方式执行时会直接
+        报错，而不是退回到阻塞的方式。
+        """
+        if self.algorithm == INSTANT:
+            return "ALGORITHM=INSTANT"
+        lock = 'NONE' if self.concurrent_dml else 'SHARED'
+        return f"ALGORITHM={self.algorithm}, LOCK={lock}"
+        
+    def __repr__(self):
+        return f"DDLClassification({self.algorithm}, concurrent_dml={self.concurrent_dml}, rebuild={self.rebuild})"
+
+def _type_of(definition: str) -> str:
+    """列定义中的数据类型（小写，去掉空白）"""
+    return re.sub(r'\s+', '', MYSQL_COLUMNS.parse(definition)['Type'] or '').lower()
+
+def _max_bytes_per_char(charset: Optional[str]) -> Tuple[int, int]:
+    """字符集每个字符的最大字节数范围，未知字符集时取可能的最小和最大值"""
+    if charset:
+        size = _CHARSET_MAX_BYTES.get(charset.lower())
+        if size:
+            return size, size
+    return 1, 4
+
+def _length_prefix_unchanged(old_length: int, new_length: int, bytes_per_char: Iterable[int]) -> bool:
+    """VARCHAR 扩展长度时长度前缀字节数（255 字节以内为 1 字节，否则为 2 字节）是否不变"""
+    return all((old_length * size < 256) == (new_length * size < 256) for size in bytes_per_char)
+
+def _enum_members(column_type: str) -> Optional[Tuple[str, List[str]]]:
+    """解析 ENUM / SET 类型的成员列表"""
+    match = _ENUM_RE.match(column_type)
+    if not match:
+        return None
+    return match.group(1), _ENUM_MEMBER_RE.findall(match.group(2))
+
+def _enum_storage_size(kind: str, count: int) -> int:
+    """ENUM / SET 的存储字节数"""
+    if kind == 'enum':
+        return 1 if count <= 255 else 2
+    return 8 if count > 32 else (count + 7) // 8
+
+def _generated_column(definition: str) -> Optional[str]:
+    """生成列的类型：'STORED' / 'VIRTUAL'，普通列为 None
+    
+    同时识别 DDL 中的 GENERATED ALWAYS AS (...) STORED 和
+    information_schema 中 Extra 为 STORED GENERATED 的写法。
+    """
+    upper = definition.upper()
+    if 'GENERATED' not in upper and not re.search(r'\bAS\s*\(', upper):
+        return None
+    return 'STORED' if 'STORED' in upper else 'VIRTUAL'
+
+def classify_add_column(definition: str) -> DDLClassification:
+    """ADD COLUMN（追加到最后）"""
+    upper = definition.upper()
+    generated = _generated_column(definition)
+    if generated:
+        # 存储生成列需要复制表，虚拟生成列只修改元数据
+        return DDLClassification(COPY if generated == 'STORED' else INSTANT)
+    if 'AUTO_INCREMENT' in upper:
+        return DDLClassification(INPLACE, concurrent_dml=False, rebuild=True)
+    if re.search(r'\b(PRIMARY\s+KEY|UNIQUE)\b', upper):
+        # 同时创建索引，不能使用 INSTANT，原地加列需要重建表
+        return DDLClassification(INPLACE, rebuild=True)
+    return DDLClassification(INSTANT, inplace_rebuild=True)
+
+def classify_drop_column(definition: Optional[str], indexed: bool) -> DDLClassification:
+    """DROP COLUMN
+    
+    列上有索引时需要同时修改索引、删除存储生成列时需要重建表，都不能使用 INSTANT；
+    删除虚拟生成列只修改元数据。definition 为删除前的列定义，未知时按普通列处理。
+    """
+    generated = _generated_column(definition or '')
+    if indexed or generated == 'STORED':
+        return DDLClassification(INPLACE, rebuild=True)
+    if generated == 'VIRTUAL':
+        return DDLClassification(INSTANT)
+    return DDLClassification(INSTANT, inplace_rebuild=True)
+
+def classify_modify_column(old_definition: str, new_definition: str) -> DDLClassification:
+    """MODIFY COLUMN，根据修改前后的定义判断
+    
+    - 只修改默认值：INSTANT
+    - ENUM / SET 在末尾追加成员且存储大小不变：INSTANT
+    - VARCHAR 扩展长度且长度前缀字节数不变、只修改注释：INPLACE，不重建表
+    - 修改 NULL / NOT NULL：INPLACE，需要重建表
+    - 其他类型、字符集、排序规则、UNSIGNED、AUTO_INCREMENT 等修改：COPY
+    """
+    old = MYSQL_COLUMNS.parse(old_definition)
+    new = MYSQL_COLUMNS.parse(new_definition)
+    old_type = _type_of(old_definition)
+    new_type = _type_of(new_definition)
+    
+    def changed(key):
+        old_value = old.get(key)
+        new_value = new.get(key)
+        if isinstance(old_value, str) and isinstance(new_value, str):
+            return old_value.lower() != new_value.lower()
+        return old_value != new_value
+        
+    if any(changed(key) for key in ('Charset', 'Collation', 'Attributes', 'Extra')):
+        return DDLClassification(COPY)
+        
+    results = []
+    if old_type != new_type:
+        old_varchar = _VARCHAR_RE.match(old_type)
+        new_varchar = _VARCHAR_RE.match(new_type)
+        old_enum = _enum_members(old_type)
+        new_enum = _enum_members(new_type)
+        if old_varchar and new_varchar and old_varchar.group(1) == new_varchar.group(1):
+            old_length = int(old_varchar.group(2))
+            new_length = int(new_varchar.group(2))
+            bytes_per_char = (1,) if old_varchar.group(1) == 'varbinary' else _max_bytes_per_char(new.get('Charset'))
+            if new_length < old_length or not _length_prefix_unchanged(old_length, new_length, bytes_per_char):
+                return DDLClassification(COPY)
+            results.append(DDLClassification(INPLACE))
+        elif (old_enum and new_enum and old_enum[0] == new_enum[0]
+              and new_enum[1][:len(old_enum[1])] == old_enum[1]
+              and _enum_storage_size(old_enum[0], len(old_enum[1])) == _enum_storage_size(new_enum[0], len(new_enum[1]))):
+            results.append(DDLClassification(INSTANT))
+        else:
+            return DDLClassification(COPY)
+            
+    if changed('Null'):
+        results.append(DDLClassification(INPLACE, rebuild=True))
+    if changed('Comment'):
+        results.append(DDLClassification(INPLACE))
+    if changed('Default'):
+        results.append(DDLClassification(INSTANT))
+    if not results:
+        # 只有写法不同，交给 MySQL 判断，INPLACE 总是可用
+        return DDLClassification(INPLACE)
+    return combine_classifications(results)
+
+def classify_add_index(index_type: str) -> DDLClassification:
+    """ADD PRIMARY KEY / UNIQUE KEY / KEY"""
+    if index_type == 'PRIMARY KEY':
+        return DDLClassification(INPLACE, rebuild=True)
+    return DDLClassification(INPLACE)
+
+def classify_drop_index(index_name: str) -> DDLClassification:
+    """DROP PRIMARY KEY / DROP KEY，只删除主键而不同时添加新主键时需要复制表"""
+    if index_name == 'PRIMARY':
+        return DDLClassification(COPY)
+    return DDLClassification(INPLACE)
+
+def classify_change(change: Tuple[Any, ...]) -> DDLClassification:
+    """根据 (操作, 参数...) 形式的修改描述分类"""
+    operation, args = change[0], change[1:]
+    if operation == 'add_column':
+        return classify_add_column(*args)
+    if operation == 'drop_column':
+        return classify_drop_column(*args)
+    if operation == 'modify_column':
+        return classify_modify_column(*args)
+    if operation == 'add_index':
+        return classify_add_index(*args)
+    if operation == 'drop_index':
+        return classify_drop_index(*args)
+    raise ValueError(f"未知的表结构修改: {operation}")
+
+def combine_classifications(classifications: Iterable[DDLClassification]) -> DDLClassification:
+    """同一条 ALTER TABLE 中多个子句的分类
+    
+    取代价最高的算法，任一子句不允许并发读写时整条语句都不允许；
+    不能整体使用 INSTANT 时，原本可以 INSTANT 加列、删列的子句也会重建表。
+    """
+    classifications = list(classifications)
+    algorithm = max((item.algorithm for item in classifications), key=_ALGORITHM_ORDER.__getitem__, default=INPLACE)
+    return DDLClassification(
+        algorithm,
+        concurrent_dml=all(item.concurrent_dml for item in classifications),
+        rebuild=any(item.rebuild or (algorithm != INSTANT and item.inplace_rebuild) for item in classifications),
+        inplace_rebuild=any(item.inplace_rebuild for item in classifications),
+    )
+
+def classify_statement(changes: Iterable[Tuple[Any, ...]]) -> DDLClassification:
+    """一条 ALTER TABLE 语句的分类
+    
+    同一条语句中删除并添加主键时 MySQL 可以原地重建，不需要复制表
+    （生成器修改主键时总是把 DROP PRIMARY KEY 和 ADD PRIMARY KEY 放在同一条语句中）。
+    """
+    changes = list(changes)
+    operations = {(change[0], change[1]) for change in changes}
+    replaces_primary_key = ('drop_index', 'PRIMARY') in operations and ('add_index', 'PRIMARY KEY') in operations
+    classifications = []
+    for change in changes:
+        if replaces_primary_key and change[:2] == ('drop_index', 'PRIMARY'):
+            classifications.append(DDLClassification(INPLACE, rebuild=True))
+        else:
+            classifications.append(classify_change(change))
+    return combine_classifications(classifications)
+
+def format_size(size: Optional[int]) -> str:
+    """表大小的显示文本"""
+    if size is None:
+        return "未知"
+    value = float(size)
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} TB"
+
+def _escape_double_quoted(value: str) -> str:
+    """转义放在 shell 双引号中的文本"""
+    return re.sub(r'(["\\$`])', r'\\\1', value)
+
+def online_schema_change_commands(table_name: str, clauses: List[str], database: Optional[str] = None) -> List[str]:
+    """生成等价的 gh-ost 和 pt-online-schema-change 命令行
+    
+    主机、用户（以及未指定时的库名）从环境变量 MYSQL_HOST、MYSQL_USER、MYSQL_DATABASE 读取，
+    密码通过 --ask-pass 交互输入，不写入输出。
+    """
+    database = _escape_double_quoted(database) if database else '$MYSQL_DATABASE'
+    table = _escape_double_quoted(table_name)
+    alter = shlex.quote(", ".join(clauses))
+    return [
+        f'gh-ost --host="$MYSQL_HOST" --user="$MYSQL_USER" --ask-pass '
+        f'--database="{database}" --table="{table}" --alter={alter} --execute',
+        f'pt-online-schema-change --ask-pass --alter={alter} '
+        f'"h=$MYSQL_HOST,u=$MYSQL_USER,D={database},t={table}" --execute',
+    ]
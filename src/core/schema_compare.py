@@ -0,0 +1,380 @@
+import hashlib
+import os
+from collections import deque
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional
+
+from utils.util import normalize_sql_definition
+from .schema_model import pack_columns, unpack_columns
+
+# 未指定进程数时，需要逐表比较的表达到该数量才使用多进程比较
+PARALLEL_COMPARE_MIN_TABLES = 5000
+# 多进程比较时每批发送的表数量
+COMPARE_BATCH_SIZE = 500
+
+_get_raw = attrgetter('raw')
+
+def _digest_table_batch(comparator, tables):
+    """在子进程中计算一批表的结构摘要（模块级函数，便于进程池序列化）"""
+    return [comparator._digest_packed(packed) for packed in tables]
+    
+def _compare_table_batch(comparator, pairs):
+    """在子进程中逐列比较一批表，返回每个表的差异"""
+    return [
+        comparator.compare_table(SchemaComparator._unpack_table(left), SchemaComparator._unpack_table(right))
+        for left, right in pairs
+    ]
+    
+class ComparisonRules:
+    """方言的比较等价规则
+    
+    empty_values 中的字符串视为与 None 相同（如数据库返回的空字符串默认值），
+    ignored_details 中的属性不参与列详细信息的比较。
+    """
+    
+    def __init__(self, empty_values: Iterable[str] = ('',), ignored_details: Iterable[str] = ()):
+        self.empty_values = frozenset(empty_values)
+        self.ignored_details = frozenset(ignored_details)
+        
+# 各方言目前使用相同的等价规则
+DEFAULT_RULES = ComparisonRules()
+
+class SchemaComparator:
+    """与方言无关的表结构比较引擎
+    
+    比较 {表名: {'columns', 'indexes', ...}} 形式的表结构，方言之间的差别只通过
+    ComparisonRules 提供。结构摘要、逐表比较等优化只在这里实现一次。
+    """
+    
+    def __init__(self, ignore_case: bool = True, rules: Optional[ComparisonRules] = None):
+        self.ignore_case = ignore_case
+        self.rules = rules or DEFAULT_RULES
+        
+    def _normalize_name(self, name):
+        """标准化名称，根据ignore_case设置决定是否转换为小写"""
+        if self.ignore_case:
+            return name.lower()
+        return name
+        
+    def compare_tables(self, left_tables, right_tables, workers=None):
+        """比较两个表结构的差异
+        
+        workers 为比较进程数，大于 1 时需要逐表比较的表按批分发到进程池并行比较；
+        为 None 时这类表达到 PARALLEL_COMPARE_MIN_TABLES 个才使用全部 CPU 核心。
+        两侧都已有相同摘要的表直接跳过，不会发送到子进程。
+        """
+        differences = {
+            'added_tables': [],
+            'removed_tables': [],
+            'modified_tables': {}
+        }
+        
+        # 检查新增和删除的表
+        if self.ignore_case:
+            left_table_names = {self._normalize_name(name) for name in left_tables.keys()}
+            right_table_names = {self._normalize_name(name) for name in right_tables.keys()}
+            # 创建名称映射
+            left_name_map = {self._normalize_name(name): name for name in left_tables.keys()}
+            right_name_map = {self._normalize_name(name): name for name in right_tables.keys()}
+        else:
+            left_table_names = set(left_tables.keys())
+            right_table_names = set(right_tables.keys())
+            left_name_map = {name: name for name in left_tables.keys()}
+            right_name_map = {name: name for name in right_tables.keys()}
+        
+        differences['added_tables'] = [right_name_map[name] for name in (right_table_names - left_table_names)]
+        differences['removed_tables'] = [left_name_map[name] for name in (left_table_names - right_table_names)]
+        
+        # 检查修改的表
+        common_tables = left_table_names & right_table_names
+        pairs = []
+        for normalized_table_name in common_tables:
+            # 获取原始表名
+            left_original_name = left_name_map[normalized_table_name]
+            right_original_name = right_name_map[normalized_table_name]
+            left_table = left_tables[left_original_name]
+            right_table = right_tables[right_original_name]
+            
+            # 摘要已缓存且相同时无需比较
+            left_digest = self._cached_digest(left_table)
+            if left_digest is not None and left_digest == self._cached_digest(right_table):
+                continue
+            pairs.append((left_original_name, left_table, right_table))
+            
+        if workers is None:
+            workers = (os.cpu_count() or 1) if len(pairs) >= PARALLEL_COMPARE_MIN_TABLES else 1
+        if workers > 1 and len(pairs) > COMPARE_BATCH_SIZE:
+            results = self._compare_pairs_parallel(pairs, workers)
+        else:
+            results = ((name, self.compare_table(left_table, right_table))
+                       for name, left_table, right_table in pairs)
+            
+        for left_original_name, table_diffs in results:
+            if table_diffs:
+                # 使用左侧的表名作为标准
+                differences['modified_tables'][left_original_name] = table_diffs
+                
+        return differences
+        
+    def _compare_pairs_parallel(self, pairs, workers):
+        """多进程比较，按 pairs 的顺序产生 (左侧表名, 差异)
+        
+        第一步把缺少摘要的表（只发送列名、原始定义和索引）分批交给子进程计算摘要，
+        摘要写回原来的表字典；第二步只比较摘要不同的表，数量较多时连同列详细信息
+        一起发送到子进程逐列比较，否则在当前进程中比较。
+        """
+        mode = self._digest_mode()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            missing = {}
+            for _, left_table, right_table in pairs:
+                for table in (left_table, right_table):
+                    if self._cached_digest(table) is None:
+                        missing[id(table)] = table
+            missing = list(missing.values())
+            digests = self._map_batches(executor, _digest_table_batch, missing, self._pack_for_digest, workers)
+            for table, digest in zip(missing, digests):
+                table.setdefault('digests', {})[mode] = digest
+                
+            changed = [pair for pair in pairs if self._cached_digest(pair[1]) != self._cached_digest(pair[2])]
+            if len(changed) > COMPARE_BATCH_SIZE:
+                packed = lambda pair: (self._pack_table(pair[1]), self._pack_table(pair[2]))
+                results = self._map_batches(executor, _compare_table_batch, changed, packed, workers)
+                yield from zip((name for name, _, _ in changed), results)
+            else:
+                for name, left_table, right_table in changed:
+                    yield name, self.compare_table(left_table, right_table)
+                    
+    def _map_batches(self, executor, func, items, pack, workers):
+        """把 items 打包后按批交给进程池执行 func(self, 批次)，按提交顺序逐个产生结果
+        
+        批次在提交时才打包，同时在途的批次数有上限，不会一次性序列化全部表结构。
+        """
+        pending = deque()
+        for start in range(0, len(items), COMPARE_BATCH_SIZE):
+            batch = [pack(item) for item in items[start:start + COMPARE_BATCH_SIZE]]
+            pending.append(executor.submit(func, self, batch))
+            if len(pending) >= workers * 2:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+            
+    @staticmethod
+    def _pack_for_digest(table):
+        """计算摘要需要的内容：列名、原始定义和索引"""
+        columns = table['columns']
+        try:
+            raws = tuple(map(_get_raw, columns.values()))
+        except AttributeError:
+            # 普通字典形式的字段定义
+            raws = tuple(defn['raw'] for defn in columns.values())
+        return tuple(columns), raws, table['indexes']
+        
+    def _digest_packed(self, packed):
+        """根据 _pack_for_digest 的结果计算摘要，与 table_digest 的结果相同"""
+        names, raws, indexes = packed
+        if self.ignore_case:
+            columns = {self._normalize_name(name): normalize_sql_definition(raw) for name, raw in zip(names, raws)}
+        else:
+            columns = dict(zip(names, raws))
+        return self._digest(columns, indexes)
+        
+    @staticmethod
+    def _pack_table(table):
+        """发送到子进程的表结构：打包后的列、索引和已有的摘要"""
+        return pack_columns(table['columns']), table['indexes'], table.get('digests')
+        
+    @staticmethod
+    def _unpack_table(packed):
+        """在子进程中还原 _pack_table 打包的表结构"""
+        columns, indexes, digests = packed
+        table = {'columns': unpack_columns(columns), 'indexes': indexes}
+        if digests:
+            table['digests'] = digests
+        return table
+        
+    def _digest_mode(self):
+        """当前大小写设置对应的摘要缓存键"""
+        return 'ignore_case' if self.ignore_case else 'exact'
+        
+    def _cached_digest(self, table):
+        """已缓存的表结构摘要，没有时返回 None"""
+        digests = table.get('digests')
+        return digests.get(self._digest_mode()) if digests else None
+        
+    def table_digest(self, table):
+        """计算表结构摘要，摘要相同的两个表比较结果一定没有差异
+        
+        摘要覆盖比较时使用的内容：忽略大小写时为小写列名和标准化定义，否则为原始列名
+        和原始定义，再加上全部索引。结果按模式缓存在表字典的 digests 中，解析文件时
+        预先计算，同一份表结构再次比较时直接复用。
+        """
+        mode = self._digest_mode()
+        digests = table.get('digests')
+        if digests is None:
+            digests = table['digests'] = {}
+        digest = digests.get(mode)
+        if digest is not None:
+            return digest
+            
+        if self.ignore_case:
+            columns = {self._normalize_name(col): defn['normalized'] for col, defn in table['columns'].items()}
+        else:
+            columns = {col: defn['raw'] for col, defn in table['columns'].items()}
+        digest = digests[mode] = self._digest(columns, table['indexes'])
+        return digest
+        
+    @staticmethod
+    def _digest(columns, indexes):
+        """对 {列名: 定义} 和索引计算摘要"""
+        # 列名和定义以 \0 连接；含 \0 时连接结果可能有歧义，改用 repr
+        content = '\0'.join([part for item in sorted(columns.items()) for part in item])
+        if content.count('\0') > 2 * len(columns) - 1:
+            content = repr(sorted(columns.items()))
+        indexes = repr(sorted(
+            (name, sorted(defn.items()) if isinstance(defn, dict) else defn)
+            for name, defn in indexes.items()
+        ))
+        
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(content.encode('utf-8', 'surrogatepass'))
+        # UTF-8 编码中不会出现 0xFF，用作列和索引两部分的分隔
+        hasher.update(b'\xff')
+        hasher.update(indexes.encode('utf-8', 'surrogatepass'))
+        return hasher.hexdigest()
+        
+    def compare_table(self, left_table, right_table):
+        """比较同名的两个表，返回该表的差异（无差异时返回空字典）"""
+        empty_values = self.rules.empty_values
+        ignored_details = self.rules.ignored_details
+        
+        def normalize_value(value):
+            """统一处理空值"""
+            if isinstance(value, str) and value in empty_values:
+                return None
+            return value
+            
+        def normalize_details(details):
+            """统一处理details中的空值，去掉不参与比较的属性"""
+            if not details:
+                return details
+            normalized = {}
+            for key, value in details.items():
+                if key in ignored_details:
+                    continue
+                if isinstance(value, dict):
+                    normalized[key] = normalize_details(value)
+                else:
+                    normalized[key] = normalize_value(value)
+            return normalized
+        
+        # 结构摘要相同的表没有差异，跳过逐列比较
+        if self.table_digest(left_table) == self.table_digest(right_table):
+            return {}
+            
+        left_cols = left_table['columns']
+        right_cols = right_table['columns']
+        left_indexes = left_table['indexes']
+        right_indexes = right_table['indexes']
+        
+        table_diffs = {}
+        
+        # 比较列定义
+        if self.ignore_case:
+            left_col_names = {self._normalize_name(col): col for col in left_cols.keys()}
+            right_col_names = {self._normalize_name(col): col for col in right_cols.keys()}
+            # 在忽略大小写模式下，使用标准化后的定义进行比较
+            left_col_normalized = {self._normalize_name(col): defn for col, defn in left_cols.items()}
+            right_col_normalized = {self._normalize_name(col): defn for col, defn in right_cols.items()}
+        else:
+            left_col_names = {col: col for col in left_cols.keys()}
+            right_col_names = {col: col for col in right_cols.keys()}
+            left_col_normalized = left_cols
+            right_col_normalized = right_cols
+        
+        # 检查列名差异（即使定义相同，列名大小写不同也算差异）
+        left_col_set = set(left_col_normalized.keys())
+        right_col_set = set(right_col_normalized.keys())
+        
+        # 在忽略大小写模式下，比较标准化后的定义
+        if self.ignore_case:
+            # 比较标准化后的定义
+            left_normalized_defs = {col: defn['normalized'] for col, defn in left_col_normalized.items()}
+            right_normalized_defs = {col: defn['normalized'] for col, defn in right_col_normalized.items()}
+            definitions_different = left_normalized_defs != right_normalized_defs
+        else:
+            # 比较原始定义
+            left_raw_defs = {col: defn['raw'] for col, defn in left_col_normalized.items()}
+            right_raw_defs = {col: defn['raw'] for col, defn in right_col_normalized.items()}
+            definitions_different = left_raw_defs != right_raw_defs
+            
+        if left_col_set != right_col_set or definitions_different:
+            table_diffs['columns'] = {
+                'added_columns': {right_col_names[col]: defn['raw'] for col, defn in right_col_normalized.items() if col not in left_col_normalized},
+                'removed_columns': {left_col_names[col]: defn['raw'] for col, defn in left_col_normalized.items() if col not in right_col_normalized},
+                'modified_columns': {}
+            }
+            
+            # 比较共同列的details
+            common_cols = set(left_col_normalized.keys()) & set(right_col_normalized.keys())
+            for normalized_col in common_cols:
+                left_original_col = left_col_names[normalized_col]
+                right_original_col = right_col_names[normalized_col]
+                
+                # 在区分大小写模式下，如果原始定义不同，直接标记为修改
+                if not self.ignore_case:
+                    left_raw = left_cols[left_original_col]['raw']
+                    right_raw = right_cols[right_original_col]['raw']
+                    if left_raw != right_raw:
+                        table_diffs['columns']['modified_columns'][left_original_col] = {
+                            'raw': {
+                                'left': left_raw,
+                                'right': right_raw
+                            },
+                            'details': {
+                                'Definition': {
+                                    'left': left_raw,
+                                    'right': right_raw
+                                }
+                            }
+                        }
+                        continue
+                
+                # 在忽略大小写模式下，比较details
+                left_details = normalize_details(left_cols[left_original_col]['details'])
+                right_details = normalize_details(right_cols[right_original_col]['details'])
+                
+                if left_details != right_details:
+                    # 找出具体哪些属性发生了变化
+                    changed_attrs = {}
+                    for key in set(left_details.keys()) | set(right_details.keys()):
+                        if left_details.get(key) != right_details.get(key):
+                            changed_attrs[key] = {
+                                'left': left_details.get(key),
+                                'right': right_details.get(key)
+                            }
+                    
+                    if changed_attrs:
+                        # 使用左侧的列名作为标准
+                        table_diffs['columns']['modified_columns'][left_original_col] = {
+                            'raw': {
+                                'left': left_cols[left_original_col]['raw'],
+                                'right': right_cols[right_original_col]['raw']
+                            },
+                            'details': changed_attrs
+                        }
+                        # 列修改信息已记录
+        
+        # 比较索引定义
+        if left_indexes != right_indexes:
+            table_diffs['indexes'] = {
+                'added_indexes': {idx: defn for idx, defn in right_indexes.items() if idx not in left_indexes},
+                'removed_indexes': {idx: defn for idx, defn in left_indexes.items() if idx not in right_indexes},
+                'modified_indexes': {
+                    idx: {'left': left_indexes[idx], 'right': right_indexes[idx]}
+                    for idx in set(left_indexes.keys()) & set(right_indexes.keys())
+                    if left_indexes[idx] != right_indexes[idx]
+                }
+            }
+        
+        return table_diffs
@@ -0,0 +1,182 @@
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Tuple
+
+from utils.util import normalize_sql_definition
+
+_intern = sys.intern
+
+def _intern_value(value: Any) -> Any:
+    """字符串值驻留，相同的类型、NULL 标记、默认值等只保留一份"""
+    return _intern(value) if type(value) is str else value
+
+class _Layout:
+    """一组字段名及其下标，字段集合相同的 ColumnDetails 共享同一个实例"""
+    
+    __slots__ = ('keys', 'index')
+    
+    def __init__(self, keys: Tuple[str, ...]):
+        self.keys = keys
+        self.index = {key: position for position, key in enumerate(keys)}
+        
+    def __reduce__(self):
+        return _get_layout, (self.keys,)
+
+# 字段名元组 -> _Layout
+_LAYOUTS: Dict[Tuple[str, ...], _Layout] = {}
+
+def _get_layout(keys: Tuple[str, ...]) -> _Layout:
+    """取得字段名元组对应的共享布局"""
+    layout = _LAYOUTS.get(keys)
+    if layout is None:
+        keys = tuple(_intern(key) for key in keys)
+        layout = _LAYOUTS.setdefault(keys, _Layout(keys))
+    return layout
+
+def _restore_details(layout: _Layout, values: Tuple[Any, ...]) -> 'ColumnDetails':
+    """反序列化 ColumnDetails"""
+    details = ColumnDetails.__new__(ColumnDetails)
+    details._layout = layout
+    details._values = values
+    return details
+
+class ColumnDetails(Mapping):
+    """字段详细信息（Type、Null、Default 等）的紧凑只读映射
+    
+    字段名按布局共享，每列只保存一个值元组，字符串值经过驻留。
+    支持 dict 的读取接口，可以和普通 dict 比较相等。
+    """
+    
+    __slots__ = ('_layout', '_values')
+    
+    def __init__(self, details: Mapping = None):
+        details = details or {}
+        self._layout = _get_layout(tuple(details))
+        self._values = tuple(_intern_value(value) for value in details.values())
+        
+    def __getitem__(self, key):
+        return self._values[self._layout.index[key]]
+        
+    def get(self, key, default=None):
+        position = self._layout.index.get(key)
+        return default if position is None else self._values[position]
+        
+    def __contains__(self, key):
+        return key in self._layout.index
+        
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layout.keys)
+        
+    def __len__(self):
+        return len(self._values)
+        
+    def __eq__(self, other):
+        if isinstance(other, ColumnDetails) and other._layout is self._layout:
+            return self._values == other._values
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+        
+    __hash__ = None
+    
+    def __repr__(self):
+        return repr(dict(self.items()))
+        
+    def __reduce__(self):
+        return _restore_details, (self._layout, self._values)
+
+class ColumnDef(Mapping):
+    """单个字段的定义，兼容原来的 {'raw', 'normalized', 'details'} 字典
+    
+    raw 为原始定义，normalized 在首次读取时由 raw 计算并缓存，details 为 ColumnDetails。
+    """
+    
+    __slots__ = ('raw', 'details', '_normalized')
+    
+    KEYS = ('raw', 'normalized', 'details')
+    
+    def __init__(self, raw: str, details: Mapping = None):
+        self.raw = _intern_value(raw)
+        self.details = details if isinstance(details, ColumnDetails) else ColumnDetails(details)
+        self._normalized = None
+        
+    @property
+    def normalized(self) -> str:
+        """标准化后的定义"""
+        if self._normalized is None:
+            self._normalized = _intern(normalize_sql_definition(self.raw))
+        return self._normalized
+        
+    def __getitem__(self, key):
+        if key == 'raw':
+            return self.raw
+        if key == 'normalized':
+            return self.normalized
+        if key == 'details':
+            return self.details
+        raise KeyError(key)
+        
+    def __contains__(self, key):
+        return key in self.KEYS
+        
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+        
+    def __len__(self):
+        return len(self.KEYS)
+        
+    def __eq__(self, other):
+        if isinstance(other, ColumnDef):
+            return self.raw == other.raw and self.details == other.details
+        if isinstance(other, Mapping):
+            return dict(self.items()) == dict(other.items())
+        return NotImplemented
+        
+    __hash__ = None
+    
+    def __repr__(self):
+        return f"ColumnDef(raw={self.raw!r}, details={self.details!r})"
+        
+    def __reduce__(self):
+        return ColumnDef, (self.raw, self.details)
+
+def compact_columns(columns: Dict[str, Any]) -> Dict[str, ColumnDef]:
+    """把 {'raw', 'normalized', 'details'} 字典形式的字段定义转换为 ColumnDef"""
+    return {
+        _intern(name): column if isinstance(column, ColumnDef)
+        else ColumnDef(column.get('raw', ''), column.get('details'))
+        for name, column in columns.items()
+    }
+
+def pack_columns(columns: Dict[str, Any]) -> Tuple[tuple, tuple, tuple, tuple]:
+    """把字段定义打包为 (字段名, 原始定义, 详细信息字段名, 详细信息值) 四个元组
+    
+    打包结果只包含元组和基本类型，pickle 时不必对每个字段调用 __reduce__，
+    用于向子进程发送大量表结构。
+    """
+    definitions = [
+        column if isinstance(column, ColumnDef) else ColumnDef(column.get('raw', ''), column.get('details'))
+        for column in columns.values()
+    ]
+    return (
+        tuple(columns),
+        tuple(column.raw for column in definitions),
+        tuple(column.details._layout.keys for column in definitions),
+        tuple(column.details._values for column in definitions),
+    )
+    
+def unpack_columns(packed: Tuple[tuple, tuple, tuple, tuple]) -> Dict[str, ColumnDef]:
+    """还原 pack_columns 打包的字段定义"""
+    names, raws, layout_keys, detail_values = packed
+    columns = {}
+    last_keys = layout = None
+    for name, raw, keys, values in zip(names, raws, layout_keys, detail_values):
+        if keys is not last_keys:
+            layout = _get_layout(keys)
+            last_keys = keys
+        column = ColumnDef.__new__(ColumnDef)
+        column.raw = raw
+        column.details = _restore_details(layout, values)
+        column._normalized = None
+        columns[name] = column
+    return columns
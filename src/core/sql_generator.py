@@ -1,5 +1,13 @@
+import re
+
 from .sql_parser import SQLParser
-from utils.util import extract_default_value_enhanced
+from .sql_output import write_sql_lines
+from .migration_plan import build_migration_plan
+from .online_ddl import COPY, ONLINE_DDL_MIN_TABLE_SIZE, classify_statement, format_size, online_schema_change_commands
+from utils.util import extract_default_value_enhanced, smart_split_sql_definitions
+
+# 索引列定义中的列名，如 `name`(10) DESC 中的 name
+_INDEX_COLUMN_RE = re.compile(r'\s*[`"]?([^`"\s(),]+)[`"]?')
 
 class BaseSQLGenerator:
     """
@@ -10,14 +18,90 @@ class BaseSQLGenerator:
     不支持跨数据库类型的转换和迁移
     """
     
+    # 每个表的同步SQL之后输出的分隔行
+    table_separator = ("",)
+    
     def __init__(self, db_type):
         self.parser = SQLParser()
         self.db_type = db_type.lower()
+        # 是否按表之间的依赖关系分批输出
+        self.dependency_order = False
+        # create_sql_loader(tables, table_name)：按需获取加载时未获取的建表语句
+        self.create_sql_loader = None
         
-    def generate_sync_sql(self, left_tables, right_tables):
-        """生成同步SQL语句，子类必须实现"""
+    def iter_sync_sql(self, left_tables, right_tables):
+        """逐行产生同步SQL（注释、语句和分隔用的空行）
+        
+        默认依次输出新增、删除和修改的表；dependency_order 为 True 时按依赖关系
+        分批输出，同一批中的表互不依赖，可以并行执行。
+        """
+        yield from self._iter_header_lines()
+        if self.dependency_order:
+            yield from self.build_migration_plan(left_tables, right_tables).iter_lines(self.table_separator)
+            return
+            
+        for _, _, lines in self.iter_table_changes(left_tables, right_tables):
+            yield from lines
+            yield from self.table_separator
+            
+    def iter_table_changes(self, left_tables, right_tables):
+        """逐个产生 (操作, 表名, 该表的同步SQL行)，操作为 create / drop / alter"""
+        # 获取表结构差异
+        differences = self.parser.compare_tables(left_tables, right_tables)
+        
+        # 处理新增的表
+        for table_name in differences['added_tables']:
+            yield 'create', table_name, self._iter_create_table_lines(table_name, right_tables)
+            
+        # 处理删除的表
+        for table_name in differences['removed_tables']:
+            yield 'drop', table_name, self._iter_drop_table_lines(table_name)
+            
+        # 处理修改的表
+        for table_name, changes in differences['modified_tables'].items():
+            yield 'alter', table_name, self._iter_alter_table_lines(table_name, changes, left_tables, right_tables)
+            
+    def build_migration_plan(self, left_tables, right_tables):
+        """按外键依赖关系把每个表的同步SQL排成分批执行的迁移计划"""
+        return build_migration_plan(self.iter_table_changes(left_tables, right_tables),
+                                    left_tables, right_tables, self._create_sql)
+        
+    def _create_sql(self, tables, table_name):
+        """表的原始建表语句，加载时未获取的通过 create_sql_loader 按需获取并保存到表结构中"""
+        table = tables[table_name]
+        raw_sql = table.get('raw_sql')
+        if raw_sql is None and self.create_sql_loader is not None:
+            raw_sql = self.create_sql_loader(tables, table_name)
+            table['raw_sql'] = raw_sql
+        return raw_sql
+        
+    def _iter_header_lines(self):
+        """同步SQL开头的说明行"""
+        return ()
+        
+    def _iter_create_table_lines(self, table_name, right_tables):
+        """新增表"""
+        yield f"-- 创建新表: {table_name}"
+        raw_sql = self._create_sql(right_tables, table_name)
+        if raw_sql is None:
+            # 没有建表语句，也无法从数据库获取
+            yield f"-- 未获取 {table_name} 的建表语句，请从源库导出后执行"
+        else:
+            yield raw_sql
+        
+    def _iter_drop_table_lines(self, table_name):
+        """删除表"""
+        yield f"-- 删除表: {table_name}"
+        yield f"DROP TABLE {table_name};"
+        
+    def _iter_alter_table_lines(self, table_name, changes, left_tables, right_tables):
+        """修改表，子类必须实现"""
         raise NotImplementedError
         
+    def generate_sync_sql(self, left_tables, right_tables):
+        """生成同步SQL语句，返回完整文本"""
+        return "\n".join(self.iter_sync_sql(left_tables, right_tables))
+        
     def validate_same_database_type(self, left_db_type, right_db_type):
         """验证左右两侧是否为相同的数据库类型"""
         if left_db_type.lower() != right_db_type.lower():
@@ -33,88 +117,169 @@ class MySQLSQLGenerator(BaseSQLGenerator):
     用于生成MySQL数据库之间的结构同步SQL
     """
     
-    def __init__(self):
+    def __init__(self, combine_alters=False, online_ddl=False):
         super().__init__('mysql')
+        # 是否把同一个表的所有修改合并为一条 ALTER TABLE
+        # InnoDB 每条 ALTER 都可能重建整张表，合并后每个表只重建一次
+        self.combine_alters = combine_alters
+        # 在线DDL模式：按 MySQL 在线DDL规则标注 ALGORITHM / LOCK，
+        # 大表上需要复制表的修改改为输出 gh-ost / pt-online-schema-change 命令
+        self.online_ddl = online_ddl
+        self.online_ddl_min_table_size = ONLINE_DDL_MIN_TABLE_SIZE
+        # 在线工具命令中使用的库名，为空时从环境变量读取
+        self.database = None
     
-    def generate_sync_sql(self, left_tables, right_tables):
-        """生成MySQL同步SQL语句"""
-        sql_statements = []
+    def _iter_drop_table_lines(self, table_name):
+        """删除表"""
+        yield f"-- 删除表: {table_name}"
+        yield f"DROP TABLE IF EXISTS `{table_name}`;"
         
-        # 获取表结构差异
-        differences = self.parser.compare_tables(left_tables, right_tables)
+    def _iter_alter_table_lines(self, table_name, changes, left_tables, right_tables):
+        """修改表：逐条产生MySQL的 ALTER TABLE 语句"""
+        yield f"-- 修改表: {table_name}"
         
-        # 处理新增的表
-        for table_name in differences['added_tables']:
-            sql_statements.append(f"-- 创建新表: {table_name}")
-            sql_statements.append(right_tables[table_name]['raw_sql'])
-            sql_statements.append("")
+        left_table = left_tables.get(table_name, {})
+        clauses = self._alter_clauses(changes, left_table)
+        if self.online_ddl:
+            table_size = self._table_size(left_table, right_tables.get(table_name, {}))
+            yield from self._iter_online_alters(table_name, clauses, table_size)
+        else:
+            for group in self._group_clauses(clauses):
+                yield self._alter_statement(table_name, [clause for clause, _ in group])
             
-        # 处理删除的表
-        for table_name in differences['removed_tables']:
-            sql_statements.append(f"-- 删除表: {table_name}")
-            sql_statements.append(f"DROP TABLE IF EXISTS `{table_name}`;")
-            sql_statements.append("")
+    def _group_clauses(self, clauses):
+        """按 combine_alters 设置把子句分组，每组生成一条 ALTER TABLE
+        
+        不合并时每个子句一条语句，但删除主键和添加新主键放在同一条语句中（位于添加主键处），
+        避免表在两条语句之间没有主键，MySQL 也可以原地重建而不必复制表。
+        """
+        if self.combine_alters and clauses:
+            return [clauses]
             
-        # 处理修改的表
-        for table_name, changes in differences['modified_tables'].items():
-            sql_statements.append(f"-- 修改表: {table_name}")
+        drop_primary = next((clause for clause in clauses if clause[1][:2] == ('drop_index', 'PRIMARY')), None)
+        add_primary = next((clause for clause in clauses if clause[1][:2] == ('add_index', 'PRIMARY KEY')), None)
+        groups = []
+        for clause in clauses:
+            if drop_primary and add_primary and clause is drop_primary:
+                continue
+            if drop_primary and add_primary and clause is add_primary:
+                groups.append([drop_primary, add_primary])
+            else:
+                groups.append([clause])
+        return groups
+        
+    def _alter_statement(self, table_name, clauses, hint=None):
+        """生成一条 ALTER TABLE，多个子句时每个子句一行，hint 为 ALGORITHM / LOCK 子句"""
+        multiline = self.combine_alters and len(clauses) > 1
+        if hint:
+            clauses = clauses + [hint]
+        if multiline:
+            return f"ALTER TABLE `{table_name}`\n  " + ",\n  ".join(clauses) + ";"
+        return f"ALTER TABLE `{table_name}` " + ", ".join(clauses) + ";"
+        
+    def _table_size(self, *tables):
+        """表的数据大小（information_schema.TABLES.DATA_LENGTH），取两侧已知的较大值，都未知时返回 None"""
+        sizes = [table.get('data_length') for table in tables]
+        sizes = [size for size in sizes if size is not None]
+        return max(sizes) if sizes else None
+        
+    def _iter_online_alters(self, table_name, clauses, table_size):
+        """在线DDL模式下逐行产生一个表的修改"""
+        groups = self._group_clauses(clauses)
+        classifications = [classify_statement(change for _, change in group) for group in groups]
+        size_text = f"，表大小约 {format_size(table_size)}" if table_size is not None else ""
+        
+        # 大表上需要复制表时交给在线工具，所有修改在一次复制中完成
+        if (table_size is not None and table_size >= self.online_ddl_min_table_size
+                and any(item.algorithm == COPY for item in classifications)):
+            yield f"-- 在线DDL: 需要复制表（COPY）{size_text}，请使用以下任一工具执行："
+            for command in online_schema_change_commands(table_name, [clause for clause, _ in clauses], self.database):
+                yield f"-- {command}"
+            return
             
-            # 添加新列
-            if 'columns' in changes and 'added_columns' in changes['columns']:
-                for col_name, col_def in changes['columns']['added_columns'].items():
-                    sql_statements.append(
-                        f"ALTER TABLE `{table_name}` ADD COLUMN `{col_name}` {col_def};"
-                    )
-                
-            # 删除列
-            if 'columns' in changes and 'removed_columns' in changes['columns']:
-                for col_name in changes['columns']['removed_columns']:
-                    sql_statements.append(
-                        f"ALTER TABLE `{table_name}` DROP COLUMN `{col_name}`;"
-                    )
-                
-            # 修改列
-            if 'columns' in changes and 'modified_columns' in changes['columns']:
-                for col_name, col_changes in changes['columns']['modified_columns'].items():
-                    # 获取右侧的列定义
-                    right_def = col_changes['raw']['right']
-                    sql_statements.append(
-                        f"ALTER TABLE `{table_name}` MODIFY COLUMN `{col_name}` {right_def};"
-                    )
+        for group, classification in zip(groups, classifications):
+            notes = [classification.algorithm]
+            if classification.rebuild:
+                notes.append("重建表")
+            if not classification.concurrent_dml:
+                notes.append("执行期间阻塞写入")
+            yield f"-- 在线DDL: {'，'.join(notes)}{size_text}"
+            yield self._alter_statement(table_name, [clause for clause, _ in group], classification.hint)
             
-            # 处理索引变化
-            if 'indexes' in changes:
-                # 添加新索引
-                if 'added_indexes' in changes['indexes']:
-                    for idx_name, idx_def in changes['indexes']['added_indexes'].items():
-                        if idx_def['type'] == 'PRIMARY KEY':
-                            sql_statements.append(
-                                f"ALTER TABLE `{table_name}` ADD PRIMARY KEY ({idx_def['columns']});"
-                            )
-                        elif idx_def['type'] == 'UNIQUE':
-                            sql_statements.append(
-                                f"ALTER TABLE `{table_name}` ADD UNIQUE KEY `{idx_name}` ({idx_def['columns']});"
-                            )
-                        else:
-                            sql_statements.append(
-                                f"ALTER TABLE `{table_name}` ADD KEY `{idx_name}` ({idx_def['columns']});"
-                            )
-                
-                # 删除索引
-                if 'removed_indexes' in changes['indexes']:
-                    for idx_name in changes['indexes']['removed_indexes']:
-                        if idx_name == 'PRIMARY':
-                            sql_statements.append(
-                                f"ALTER TABLE `{table_name}` DROP PRIMARY KEY;"
-                            )
-                        else:
-                            sql_statements.append(
-                                f"ALTER TABLE `{table_name}` DROP KEY `{idx_name}`;"
-                            )
-            
-            sql_statements.append("")
-                
-        return "\n".join(sql_statements)
+    @staticmethod
+    def _index_column_names(columns):
+        """索引列定义中的列名（小写），去掉引号、前缀长度和 ASC / DESC"""
+        names = set()
+        for column in smart_split_sql_definitions(str(columns)):
+            match = _INDEX_COLUMN_RE.match(column)
+            if match:
+                names.add(match.group(1).lower())
+        return names
+        
+    def _alter_clauses(self, changes, left_table=None):
+        """把一个表的差异转换为 (ALTER TABLE 子句, 修改描述) 列表
+        
+        子句不含表名和分号；修改描述为 online_ddl.classify_change 使用的 (操作, 参数...)。
+        先删除索引（包括被修改索引的旧定义），再修改列，最后添加索引（包括被修改索引的新定义），
+        删除列之前其上的索引已经删除，新索引创建时新增的列已经存在。
+        """
+        clauses = []
+        left_table = left_table or {}
+        left_columns = left_table.get('columns', {})
+        
+        index_changes = changes.get('indexes', {})
+        modified_indexes = index_changes.get('modified_indexes', {})
+        
+        # 左侧表中出现在索引里的列
+        indexed_columns = set()
+        for idx_def in left_table.get('indexes', {}).values():
+            indexed_columns.update(self._index_column_names(idx_def.get('columns', '')))
+            
+        # 删除索引，被修改的索引先删除旧定义
+        for idx_name in list(index_changes.get('removed_indexes', {})) + list(modified_indexes):
+            if idx_name == 'PRIMARY':
+                clause = "DROP PRIMARY KEY"
+            else:
+                clause = f"DROP KEY `{idx_name}`"
+            clauses.append((clause, ('drop_index', idx_name)))
+        
+        # 添加新列
+        if 'columns' in changes and 'added_columns' in changes['columns']:
+            for col_name, col_def in changes['columns']['added_columns'].items():
+                clauses.append((f"ADD COLUMN `{col_name}` {col_def}", ('add_column', col_def)))
+            
+        # 删除列
+        if 'columns' in changes and 'removed_columns' in changes['columns']:
+            for col_name in changes['columns']['removed_columns']:
+                left_column = left_columns.get(col_name)
+                clauses.append((
+                    f"DROP COLUMN `{col_name}`",
+                    ('drop_column', left_column['raw'] if left_column else None, col_name.lower() in indexed_columns)
+                ))
+            
+        # 修改列
+        if 'columns' in changes and 'modified_columns' in changes['columns']:
+            for col_name, col_changes in changes['columns']['modified_columns'].items():
+                # 获取右侧的列定义
+                right_def = col_changes['raw']['right']
+                clauses.append((
+                    f"MODIFY COLUMN `{col_name}` {right_def}",
+                    ('modify_column', col_changes['raw']['left'], right_def)
+                ))
+        
+        # 添加索引，被修改的索引添加新定义
+        added_indexes = list(index_changes.get('added_indexes', {}).items())
+        added_indexes += [(idx_name, idx_change['right']) for idx_name, idx_change in modified_indexes.items()]
+        for idx_name, idx_def in added_indexes:
+            if idx_def['type'] == 'PRIMARY KEY':
+                clause = f"ADD PRIMARY KEY ({idx_def['columns']})"
+            elif idx_def['type'] in ('UNIQUE', 'UNIQUE KEY'):
+                clause = f"ADD UNIQUE KEY `{idx_name}` ({idx_def['columns']})"
+            else:
+                clause = f"ADD KEY `{idx_name}` ({idx_def['columns']})"
+            clauses.append((clause, ('add_index', idx_def['type'])))
+            
+        return clauses
 
 class PostgreSQLSQLGenerator(BaseSQLGenerator):
     """
@@ -125,75 +290,57 @@ class PostgreSQLSQLGenerator(BaseSQLGenerator):
     def __init__(self):
         super().__init__('postgresql')
     
-    def generate_sync_sql(self, left_tables, right_tables):
-        """生成PostgreSQL同步SQL语句"""
-        sql_statements = []
+    def _iter_drop_table_lines(self, table_name):
+        """删除表"""
+        yield f"-- 删除表: {table_name}"
+        yield f"DROP TABLE IF EXISTS {table_name};"
         
-        # 获取表结构差异
-        differences = self.parser.compare_tables(left_tables, right_tables)
+    def _iter_alter_table_lines(self, table_name, changes, left_tables, right_tables):
+        """修改表：逐条产生PostgreSQL的 ALTER TABLE 语句"""
+        yield f"-- 修改表: {table_name}"
         
-        # 处理新增的表
-        for table_name in differences['added_tables']:
-            sql_statements.append(f"-- 创建新表: {table_name}")
-            sql_statements.append(right_tables[table_name]['raw_sql'])
-            sql_statements.append("")
+        # 添加新列
+        if 'columns' in changes and 'added_columns' in changes['columns']:
+            for col_name, col_def in changes['columns']['added_columns'].items():
+                yield (
+                    f"ALTER TABLE {table_name} ADD COLUMN {col_name} {col_def};"
+                )
             
-        # 处理删除的表
-        for table_name in differences['removed_tables']:
-            sql_statements.append(f"-- 删除表: {table_name}")
-            sql_statements.append(f"DROP TABLE IF EXISTS {table_name};")
-            sql_statements.append("")
+        # 删除列
+        if 'columns' in changes and 'removed_columns' in changes['columns']:
+            for col_name in changes['columns']['removed_columns']:
+                yield (
+                    f"ALTER TABLE {table_name} DROP COLUMN {col_name};"
+                )
             
-        # 处理修改的表
-        for table_name, changes in differences['modified_tables'].items():
-            sql_statements.append(f"-- 修改表: {table_name}")
-            
-            # 添加新列
-            if 'columns' in changes and 'added_columns' in changes['columns']:
-                for col_name, col_def in changes['columns']['added_columns'].items():
-                    sql_statements.append(
-                        f"ALTER TABLE {table_name} ADD COLUMN {col_name} {col_def};"
-                    )
+        # 修改列（PostgreSQL需要分步骤修改）
+        if 'columns' in changes and 'modified_columns' in changes['columns']:
+            for col_name, col_changes in changes['columns']['modified_columns'].items():
+                right_def = col_changes['raw']['right']
                 
-            # 删除列
-            if 'columns' in changes and 'removed_columns' in changes['columns']:
-                for col_name in changes['columns']['removed_columns']:
-                    sql_statements.append(
-                        f"ALTER TABLE {table_name} DROP COLUMN {col_name};"
+                # 提取类型信息
+                type_part = self._extract_column_type(right_def)
+                if type_part:
+                    yield (
+                        f"ALTER TABLE {table_name} ALTER COLUMN {col_name} TYPE {type_part};"
                     )
                 
-            # 修改列（PostgreSQL需要分步骤修改）
-            if 'columns' in changes and 'modified_columns' in changes['columns']:
-                for col_name, col_changes in changes['columns']['modified_columns'].items():
-                    right_def = col_changes['raw']['right']
-                    
-                    # 提取类型信息
-                    type_part = self._extract_column_type(right_def)
-                    if type_part:
-                        sql_statements.append(
-                            f"ALTER TABLE {table_name} ALTER COLUMN {col_name} TYPE {type_part};"
-                        )
-                    
-                    # 处理NULL约束
-                    if 'NOT NULL' in right_def.upper():
-                        sql_statements.append(
-                            f"ALTER TABLE {table_name} ALTER COLUMN {col_name} SET NOT NULL;"
-                        )
-                    elif 'NULL' in right_def.upper():
-                        sql_statements.append(
-                            f"ALTER TABLE {table_name} ALTER COLUMN {col_name} DROP NOT NULL;"
-                        )
-                    
-                    # 处理默认值
-                    default_value = extract_default_value_enhanced(right_def)
-                    if default_value:
-                        sql_statements.append(
-                            f"ALTER TABLE {table_name} ALTER COLUMN {col_name} SET DEFAULT {default_value};"
-                        )
-            
-            sql_statements.append("")
+                # 处理NULL约束
+                if 'NOT NULL' in right_def.upper():
+                    yield (
+                        f"ALTER TABLE {table_name} ALTER COLUMN {col_name} SET NOT NULL;"
+                    )
+                elif 'NULL' in right_def.upper():
+                    yield (
+                        f"ALTER TABLE {table_name} ALTER COLUMN {col_name} DROP NOT NULL;"
+                    )
                 
-        return "\n".join(sql_statements)
+                # 处理默认值
+                default_value = extract_default_value_enhanced(right_def)
+                if default_value:
+                    yield (
+                        f"ALTER TABLE {table_name} ALTER COLUMN {col_name} SET DEFAULT {default_value};"
+                    )
     
     def _extract_column_type(self, col_def: str) -> str:
         """从列定义中提取类型部分"""
@@ -212,51 +359,33 @@ class SQLiteSQLGenerator(BaseSQLGenerator):
     def __init__(self):
         super().__init__('sqlite')
     
-    def generate_sync_sql(self, left_tables, right_tables):
-        """生成SQLite同步SQL语句"""
-        sql_statements = []
+    def _iter_drop_table_lines(self, table_name):
+        """删除表"""
+        yield f"-- 删除表: {table_name}"
+        yield f"DROP TABLE IF EXISTS {table_name};"
         
-        # 获取表结构差异
-        differences = self.parser.compare_tables(left_tables, right_tables)
+    def _iter_alter_table_lines(self, table_name, changes, left_tables, right_tables):
+        """修改表：逐条产生SQLite的 ALTER TABLE 语句"""
+        yield f"-- 修改表: {table_name}"
         
-        # 处理新增的表
-        for table_name in differences['added_tables']:
-            sql_statements.append(f"-- 创建新表: {table_name}")
-            sql_statements.append(right_tables[table_name]['raw_sql'])
-            sql_statements.append("")
+        # 添加新列（SQLite支持）
+        if 'columns' in changes and 'added_columns' in changes['columns']:
+            for col_name, col_def in changes['columns']['added_columns'].items():
+                yield (
+                    f"ALTER TABLE {table_name} ADD COLUMN {col_name} {col_def};"
+                )
             
-        # 处理删除的表
-        for table_name in differences['removed_tables']:
-            sql_statements.append(f"-- 删除表: {table_name}")
-            sql_statements.append(f"DROP TABLE IF EXISTS {table_name};")
-            sql_statements.append("")
+        # 删除列（SQLite不支持，需要重建表）
+        if 'columns' in changes and 'removed_columns' in changes['columns']:
+            yield f"-- SQLite不支持DROP COLUMN，需要手动重建表: {table_name}"
+            for col_name in changes['columns']['removed_columns']:
+                yield f"-- 需要删除的列: {col_name}"
             
-        # 处理修改的表
-        for table_name, changes in differences['modified_tables'].items():
-            sql_statements.append(f"-- 修改表: {table_name}")
-            
-            # 添加新列（SQLite支持）
-            if 'columns' in changes and 'added_columns' in changes['columns']:
-                for col_name, col_def in changes['columns']['added_columns'].items():
-                    sql_statements.append(
-                        f"ALTER TABLE {table_name} ADD COLUMN {col_name} {col_def};"
-                    )
-                
-            # 删除列（SQLite不支持，需要重建表）
-            if 'columns' in changes and 'removed_columns' in changes['columns']:
-                sql_statements.append(f"-- SQLite不支持DROP COLUMN，需要手动重建表: {table_name}")
-                for col_name in changes['columns']['removed_columns']:
-                    sql_statements.append(f"-- 需要删除的列: {col_name}")
-                
-            # 修改列（SQLite不支持，需要重建表）
-            if 'columns' in changes and 'modified_columns' in changes['columns']:
-                sql_statements.append(f"-- SQLite不支持MODIFY COLUMN，需要手动重建表: {table_name}")
-                for col_name in changes['columns']['modified_columns']:
-                    sql_statements.append(f"-- 需要修改的列: {col_name}")
-            
-            sql_statements.append("")
-                
-        return "\n".join(sql_statements)
+        # 修改列（SQLite不支持，需要重建表）
+        if 'columns' in changes and 'modified_columns' in changes['columns']:
+            yield f"-- SQLite不支持MODIFY COLUMN，需要手动重建表: {table_name}"
+            for col_name in changes['columns']['modified_columns']:
+                yield f"-- 需要修改的列: {col_name}"
 
 class OracleSQLGenerator(BaseSQLGenerator):
     """
@@ -267,55 +396,32 @@ class OracleSQLGenerator(BaseSQLGenerator):
     def __init__(self):
         super().__init__('oracle')
     
-    def generate_sync_sql(self, left_tables, right_tables):
-        """生成Oracle同步SQL语句"""
-        sql_statements = []
-        
-        # 获取表结构差异
-        differences = self.parser.compare_tables(left_tables, right_tables)
+    def _iter_alter_table_lines(self, table_name, changes, left_tables, right_tables):
+        """修改表：逐条产生Oracle的 ALTER TABLE 语句"""
+        yield f"-- 修改表: {table_name}"
         
-        # 处理新增的表
-        for table_name in differences['added_tables']:
-            sql_statements.append(f"-- 创建新表: {table_name}")
-            sql_statements.append(right_tables[table_name]['raw_sql'])
-            sql_statements.append("")
-            
-        # 处理删除的表
-        for table_name in differences['removed_tables']:
-            sql_statements.append(f"-- 删除表: {table_name}")
-            sql_statements.append(f"DROP TABLE {table_name};")
-            sql_statements.append("")
+        # 添加新列
+        if 'columns' in changes and 'added_columns' in changes['columns']:
+            for col_name, col_def in changes['columns']['added_columns'].items():
+                yield (
+                    f"ALTER TABLE {table_name} ADD {col_name} {col_def};"
+                )
             
-        # 处理修改的表
-        for table_name, changes in differences['modified_tables'].items():
-            sql_statements.append(f"-- 修改表: {table_name}")
-            
-            # 添加新列
-            if 'columns' in changes and 'added_columns' in changes['columns']:
-                for col_name, col_def in changes['columns']['added_columns'].items():
-                    sql_statements.append(
-                        f"ALTER TABLE {table_name} ADD {col_name} {col_def};"
-                    )
-                
-            # 删除列
-            if 'columns' in changes and 'removed_columns' in changes['columns']:
-                for col_name in changes['columns']['removed_columns']:
-                    sql_statements.append(
-                        f"ALTER TABLE {table_name} DROP COLUMN {col_name};"
-                    )
-                
-            # 修改列
-            if 'columns' in changes and 'modified_columns' in changes['columns']:
-                for col_name, col_changes in changes['columns']['modified_columns'].items():
-                    right_def = col_changes['raw']['right']
-                    # Oracle的MODIFY语法
-                    sql_statements.append(
-                        f"ALTER TABLE {table_name} MODIFY {col_name} {right_def};"
-                    )
+        # 删除列
+        if 'columns' in changes and 'removed_columns' in changes['columns']:
+            for col_name in changes['columns']['removed_columns']:
+                yield (
+                    f"ALTER TABLE {table_name} DROP COLUMN {col_name};"
+                )
             
-            sql_statements.append("")
-                
-        return "\n".join(sql_statements)
+        # 修改列
+        if 'columns' in changes and 'modified_columns' in changes['columns']:
+            for col_name, col_changes in changes['columns']['modified_columns'].items():
+                right_def = col_changes['raw']['right']
+                # Oracle的MODIFY语法
+                yield (
+                    f"ALTER TABLE {table_name} MODIFY {col_name} {right_def};"
+                )
 
 class SQLServerSQLGenerator(BaseSQLGenerator):
     """
@@ -326,54 +432,31 @@ class SQLServerSQLGenerator(BaseSQLGenerator):
     def __init__(self):
         super().__init__('sqlserver')
     
-    def generate_sync_sql(self, left_tables, right_tables):
-        """生成SQL Server同步SQL语句"""
-        sql_statements = []
-        
-        # 获取表结构差异
-        differences = self.parser.compare_tables(left_tables, right_tables)
+    def _iter_alter_table_lines(self, table_name, changes, left_tables, right_tables):
+        """修改表：逐条产生SQL Server的 ALTER TABLE 语句"""
+        yield f"-- 修改表: {table_name}"
         
-        # 处理新增的表
-        for table_name in differences['added_tables']:
-            sql_statements.append(f"-- 创建新表: {table_name}")
-            sql_statements.append(right_tables[table_name]['raw_sql'])
-            sql_statements.append("")
+        # 添加新列
+        if 'columns' in changes and 'added_columns' in changes['columns']:
+            for col_name, col_def in changes['columns']['added_columns'].items():
+                yield (
+                    f"ALTER TABLE [{table_name}] ADD [{col_name}] {col_def};"
+                )
             
-        # 处理删除的表
-        for table_name in differences['removed_tables']:
-            sql_statements.append(f"-- 删除表: {table_name}")
-            sql_statements.append(f"DROP TABLE {table_name};")
-            sql_statements.append("")
-            
-        # 处理修改的表
-        for table_name, changes in differences['modified_tables'].items():
-            sql_statements.append(f"-- 修改表: {table_name}")
+        # 删除列
+        if 'columns' in changes and 'removed_columns' in changes['columns']:
+            for col_name in changes['columns']['removed_columns']:
+                yield (
+                    f"ALTER TABLE [{table_name}] DROP COLUMN [{col_name}];"
+                )
             
-            # 添加新列
-            if 'columns' in changes and 'added_columns' in changes['columns']:
-                for col_name, col_def in changes['columns']['added_columns'].items():
-                    sql_statements.append(
-                        f"ALTER TABLE [{table_name}] ADD [{col_name}] {col_def};"
-                    )
-                
-            # 删除列
-            if 'columns' in changes and 'removed_columns' in changes['columns']:
-                for col_name in changes['columns']['removed_columns']:
-                    sql_statements.append(
-                        f"ALTER TABLE [{table_name}] DROP COLUMN [{col_name}];"
-                    )
-                
-            # 修改列
-            if 'columns' in changes and 'modified_columns' in changes['columns']:
-                for col_name, col_changes in changes['columns']['modified_columns'].items():
-                    right_def = col_changes['raw']['right']
-                    sql_statements.append(
-                        f"ALTER TABLE [{table_name}] ALTER COLUMN [{col_name}] {right_def};"
-                    )
-            
-            sql_statements.append("")
-                
-        return "\n".join(sql_statements)
+        # 修改列
+        if 'columns' in changes and 'modified_columns' in changes['columns']:
+            for col_name, col_changes in changes['columns']['modified_columns'].items():
+                right_def = col_changes['raw']['right']
+                yield (
+                    f"ALTER TABLE [{table_name}] ALTER COLUMN [{col_name}] {right_def};"
+                )
 
 class MongoDBSQLGenerator(BaseSQLGenerator):
     """
@@ -385,33 +468,29 @@ class MongoDBSQLGenerator(BaseSQLGenerator):
     def __init__(self):
         super().__init__('mongodb')
     
-    def generate_sync_sql(self, left_tables, right_tables):
-        """生成MongoDB同步信息"""
-        statements = []
+    # 集合之间不输出空行
+    table_separator = ()
+    
+    def _iter_header_lines(self):
+        """MongoDB同步信息的说明"""
+        yield "-- MongoDB是NoSQL数据库，不使用SQL"
+        yield "-- 以下是集合（Collection）结构差异信息："
+        yield ""
         
-        statements.append("-- MongoDB是NoSQL数据库，不使用SQL")
-        statements.append("-- 以下是集合（Collection）结构差异信息：")
-        statements.append("")
+    def _iter_create_table_lines(self, collection_name, right_tables):
+        """新增的集合"""
+        yield f"-- 新增集合: {collection_name}"
+        yield f"db.createCollection('{collection_name}')"
         
-        # 获取集合结构差异
-        differences = self.parser.compare_tables(left_tables, right_tables)
+    def _iter_drop_table_lines(self, collection_name):
+        """删除的集合"""
+        yield f"-- 删除集合: {collection_name}"
+        yield f"db.{collection_name}.drop()"
         
-        # 处理新增的集合
-        for collection_name in differences['added_tables']:
-            statements.append(f"-- 新增集合: {collection_name}")
-            statements.append(f"db.createCollection('{collection_name}')")
-            
-        # 处理删除的集合
-        for collection_name in differences['removed_tables']:
-            statements.append(f"-- 删除集合: {collection_name}")
-            statements.append(f"db.{collection_name}.drop()")
-            
-        # 处理修改的集合
-        for collection_name, changes in differences['modified_tables'].items():
-            statements.append(f"-- 集合 {collection_name} 有结构变化")
-            statements.append(f"-- 请手动检查文档结构并进行相应调整")
-                
-        return "\n".join(statements)
+    def _iter_alter_table_lines(self, collection_name, changes, left_tables, right_tables):
+        """修改的集合"""
+        yield f"-- 集合 {collection_name} 有结构变化"
+        yield f"-- 请手动检查文档结构并进行相应调整"
 
 class Db2SQLGenerator(BaseSQLGenerator):
     """
@@ -422,75 +501,52 @@ class Db2SQLGenerator(BaseSQLGenerator):
     def __init__(self):
         super().__init__('db2')
     
-    def generate_sync_sql(self, left_tables, right_tables):
-        """生成Db2同步SQL语句"""
-        sql_statements = []
-        
-        # 获取表结构差异
-        differences = self.parser.compare_tables(left_tables, right_tables)
+    def _iter_alter_table_lines(self, table_name, changes, left_tables, right_tables):
+        """修改表：逐条产生Db2的 ALTER TABLE 语句"""
+        yield f"-- 修改表: {table_name}"
         
-        # 处理新增的表
-        for table_name in differences['added_tables']:
-            sql_statements.append(f"-- 创建新表: {table_name}")
-            sql_statements.append(right_tables[table_name]['raw_sql'])
-            sql_statements.append("")
+        # 添加新列
+        if 'columns' in changes and 'added_columns' in changes['columns']:
+            for col_name, col_def in changes['columns']['added_columns'].items():
+                yield (
+                    f"ALTER TABLE {table_name} ADD COLUMN {col_name} {col_def};"
+                )
             
-        # 处理删除的表
-        for table_name in differences['removed_tables']:
-            sql_statements.append(f"-- 删除表: {table_name}")
-            sql_statements.append(f"DROP TABLE {table_name};")
-            sql_statements.append("")
-            
-        # 处理修改的表
-        for table_name, changes in differences['modified_tables'].items():
-            sql_statements.append(f"-- 修改表: {table_name}")
+        # 删除列
+        if 'columns' in changes and 'removed_columns' in changes['columns']:
+            for col_name in changes['columns']['removed_columns']:
+                yield (
+                    f"ALTER TABLE {table_name} DROP COLUMN {col_name};"
+                )
             
-            # 添加新列
-            if 'columns' in changes and 'added_columns' in changes['columns']:
-                for col_name, col_def in changes['columns']['added_columns'].items():
-                    sql_statements.append(
-                        f"ALTER TABLE {table_name} ADD COLUMN {col_name} {col_def};"
-                    )
+        # 修改列（Db2的特殊语法）
+        if 'columns' in changes and 'modified_columns' in changes['columns']:
+            for col_name, col_changes in changes['columns']['modified_columns'].items():
+                right_def = col_changes['raw']['right']
                 
-            # 删除列
-            if 'columns' in changes and 'removed_columns' in changes['columns']:
-                for col_name in changes['columns']['removed_columns']:
-                    sql_statements.append(
-                        f"ALTER TABLE {table_name} DROP COLUMN {col_name};"
+                # 提取类型信息
+                type_part = self._extract_column_type(right_def)
+                if type_part:
+                    yield (
+                        f"ALTER TABLE {table_name} ALTER COLUMN {col_name} SET DATA TYPE {type_part};"
                     )
                 
-            # 修改列（Db2的特殊语法）
-            if 'columns' in changes and 'modified_columns' in changes['columns']:
-                for col_name, col_changes in changes['columns']['modified_columns'].items():
-                    right_def = col_changes['raw']['right']
-                    
-                    # 提取类型信息
-                    type_part = self._extract_column_type(right_def)
-                    if type_part:
-                        sql_statements.append(
-                            f"ALTER TABLE {table_name} ALTER COLUMN {col_name} SET DATA TYPE {type_part};"
-                        )
-                    
-                    # 处理NOT NULL约束
-                    if 'NOT NULL' in right_def.upper():
-                        sql_statements.append(
-                            f"ALTER TABLE {table_name} ALTER COLUMN {col_name} SET NOT NULL;"
-                        )
-                    elif 'NULL' in right_def.upper():
-                        sql_statements.append(
-                            f"ALTER TABLE {table_name} ALTER COLUMN {col_name} DROP NOT NULL;"
-                        )
-                    
-                    # 处理默认值
-                    default_value = extract_default_value_enhanced(right_def)
-                    if default_value:
-                        sql_statements.append(
-                            f"ALTER TABLE {table_name} ALTER COLUMN {col_name} SET DEFAULT {default_value};"
-                        )
-            
-            sql_statements.append("")
+                # 处理NOT NULL约束
+                if 'NOT NULL' in right_def.upper():
+                    yield (
+                        f"ALTER TABLE {table_name} ALTER COLUMN {col_name} SET NOT NULL;"
+                    )
+                elif 'NULL' in right_def.upper():
+                    yield (
+                        f"ALTER TABLE {table_name} ALTER COLUMN {col_name} DROP NOT NULL;"
+                    )
                 
-        return "\n".join(sql_statements)
+                # 处理默认值
+                default_value = extract_default_value_enhanced(right_def)
+                if default_value:
+                    yield (
+                        f"ALTER TABLE {table_name} ALTER COLUMN {col_name} SET DEFAULT {default_value};"
+                    )
     
     def _extract_column_type(self, col_def: str) -> str:
         """从列定义中提取类型部分"""
@@ -506,9 +562,9 @@ class SQLGenerator:
     注意：仅支持同类型数据库之间的比较和同步
     """
     
-    def __init__(self):
+    def __init__(self, combine_alters=False):
         self.generators = {
-            'mysql': MySQLSQLGenerator(),
+            'mysql': MySQLSQLGenerator(combine_alters),
             'postgresql': PostgreSQLSQLGenerator(),
             'oracle': OracleSQLGenerator(),
             'sqlserver': SQLServerSQLGenerator(),
@@ -517,6 +573,95 @@ class SQLGenerator:
             'db2': Db2SQLGenerator()
         }
         
+    @property
+    def combine_alters(self):
+        """MySQL 是否把同一个表的修改合并为一条 ALTER TABLE"""
+        return self.generators['mysql'].combine_alters
+        
+    @combine_alters.setter
+    def combine_alters(self, value):
+        self.generators['mysql'].combine_alters = value
+        
+    @property
+    def online_ddl(self):
+        """MySQL 是否使用在线DDL模式"""
+        return self.generators['mysql'].online_ddl
+        
+    @online_ddl.setter
+    def online_ddl(self, value):
+        self.generators['mysql'].online_ddl = value
+        
+    @property
+    def create_sql_loader(self):
+        """按需获取建表语句的回调 create_sql_loader(tables, table_name)"""
+        return self.generators['mysql'].create_sql_loader
+        
+    @create_sql_loader.setter
+    def create_sql_loader(self, value):
+        for generator in self.generators.values():
+            generator.create_sql_loader = value
+            
+    @property
+    def dependency_order(self):
+        """是否按表之间的依赖关系分批输出"""
+        return self.generators['mysql'].dependency_order
+        
+    @dependency_order.setter
+    def dependency_order(self, value):
+        for generator in self.generators.values():
+            generator.dependency_order = value
+            
+    def _get_generator(self, db_type):
+        """取得数据库类型对应的生成器
+        
+        Raises:
+            ValueError: 当数据库类型不受支持时
+        """
+        db_type = db_type.lower()
+        
+        if db_type not in self.generators:
+            supported_types = ', '.join(self.generators.keys())
+            raise ValueError(
+                f"不支持的数据库类型: {db_type}\n"
+                f"支持的类型: {supported_types}"
+            )
+            
+        return self.generators[db_type]
+        
+    def iter_sync_sql(self, left_tables, right_tables, db_type="mysql"):
+        """
+        逐行产生同步SQL，不在内存中拼接完整文本
+        
+        Args:
+            left_tables: 左侧数据库表结构
+            right_tables: 右侧数据库表结构  
+            db_type: 数据库类型（左右两侧必须相同）
+            
+        Returns:
+            同步SQL的行迭代器
+            
+        Raises:
+            ValueError: 当数据库类型不受支持时
+        """
+        return self._get_generator(db_type).iter_sync_sql(left_tables, right_tables)
+        
+    def build_migration_plan(self, left_tables, right_tables, db_type="mysql"):
+        """
+        生成按依赖关系分批的迁移计划，同一批中的表可以在不同连接上并行执行
+        
+        Args:
+            left_tables: 左侧数据库表结构
+            right_tables: 右侧数据库表结构  
+            db_type: 数据库类型（左右两侧必须相同）
+            
+        Returns:
+            MigrationPlan
+            
+        Raises:
+            ValueError: 当数据库类型不受支持时
+        """
+        return self._get_generator(db_type).build_migration_plan(left_tables, right_tables)
+        
     def generate_sync_sql(self, left_tables, right_tables, db_type="mysql"):
         """
         生成同步SQL语句
@@ -532,14 +677,19 @@ class SQLGenerator:
         Raises:
             ValueError: 当数据库类型不受支持时
         """
-        db_type = db_type.lower()
+        return "\n".join(self.iter_sync_sql(left_tables, right_tables, db_type))
         
-        if db_type not in self.generators:
-            supported_types = ', '.join(self.generators.keys())
-            raise ValueError(
-                f"不支持的数据库类型: {db_type}\n"
-                f"支持的类型: {supported_types}"
-            )
+    def write_sync_sql(self, left_tables, right_tables, output, db_type="mysql"):
+        """
+        把同步SQL逐行写入文件或管道
+        
+        Args:
+            left_tables: 左侧数据库表结构
+            right_tables: 右侧数据库表结构
+            output: 文件路径，或已打开的文本流（如 sys.stdout、管道）
+            db_type: 数据库类型（左右两侧必须相同）
             
-        generator = self.generators[db_type]
-        return generator.generate_sync_sql(left_tables, right_tables)
\ No newline at end of file
+        Returns:
+            写入的行数
+        """
+        return write_sql_lines(self.iter_sync_sql(left_tables, right_tables, db_type), output)
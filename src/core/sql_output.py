@@ -0,0 +1,103 @@
+import os
+import shutil
+import tempfile
+from typing import Iterable, List, TextIO, Union
+
+# 分页查看同步SQL时每页的大致行数（不会在一条语句中间分页）
+SQL_PAGE_LINES = 2000
+
+def write_sql_lines(lines: Iterable[str], output: Union[str, os.PathLike, TextIO]) -> int:
+    """把逐行产生的SQL写入文件路径或已打开的文本流（如管道），返回写入的行数"""
+    if isinstance(output, (str, os.PathLike)):
+        try:
+            with open(output, 'w', encoding='utf-8', newline='\n') as file:
+                return write_sql_lines(lines, file)
+        except OSError as e:
+            raise Exception(f"写入SQL文件失败: {str(e)}")
+            
+    count = 0
+    write = output.write
+    for line in lines:
+        write(line)
+        write('\n')
+        count += 1
+    output.flush()
+    return count
+
+class PagedSQLFile:
+    """写入临时文件、按页读取的同步SQL
+    
+    生成的SQL逐行写入临时文件，内存中只保留每页在文件中的起始位置，
+    查看时每次只读取一页。每页在行数达到 page_lines 后的下一条语句处结束，
+    多行的 CREATE TABLE 语句不会被拆到两页。
+    """
+    
+    def __init__(self, lines: Iterable[str], page_lines: int = SQL_PAGE_LINES):
+        self.page_lines = page_lines
+        self.line_count = 0
+        self._file = tempfile.TemporaryFile()
+        self._page_offsets: List[int] = [0]
+        self._size = 0
+        
+        try:
+            page_line_count = 0
+            write = self._file.write
+            for line in lines:
+                if page_line_count >= page_lines:
+                    self._page_offsets.append(self._size)
+                    page_line_count = 0
+                data = (line + '\n').encode('utf-8', 'surrogatepass')
+                write(data)
+                self._size += len(data)
+                line_count = line.count('\n') + 1
+                page_line_count += line_count
+                self.line_count += line_count
+            self._file.flush()
+        except Exception:
+            self._file.close()
+            raise
+            
+    @property
+    def page_count(self) -> int:
+        """页数，没有内容时为 1"""
+        return len(self._page_offsets)
+        
+    @property
+    def size(self) -> int:
+        """SQL文本的字节数（UTF-8）"""
+        return self._size
+        
+    def _read(self, start: int, end: int) -> str:
+        """读取文件中 [start, end) 的内容，去掉最后一个换行"""
+        self._file.seek(start)
+        text = self._file.read(end - start).decode('utf-8', 'surrogatepass')
+        return text[:-1] if text.endswith('\n') else text
+        
+    def read_page(self, index: int) -> str:
+        """读取第 index 页（从 0 开始）"""
+        start = self._page_offsets[index]
+        end = self._page_offsets[index + 1] if index + 1 < len(self._page_offsets) else self._size
+        return self._read(start, end)
+        
+    def read_all(self) -> str:
+        """读取全部SQL文本"""
+        return self._read(0, self._size)
+        
+    def save(self, file_path: str) -> None:
+        """把全部SQL复制到文件"""
+        try:
+            self._file.seek(0)
+            with open(file_path, 'wb') as file:
+                shutil.copyfileobj(self._file, file)
+        except OSError as e:
+            raise Exception(f"保存SQL文件失败: {str(e)}")
+            
+    def close(self) -> None:
+        """关闭并删除临时文件"""
+        self._file.close()
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
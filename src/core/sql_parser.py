@@ -1,11 +1,49 @@
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import sqlparse
 from sqlparse.sql import Identifier, IdentifierList, Parenthesis
 from sqlparse.tokens import Keyword, DML, Whitespace
-from utils.util import normalize_sql_definition, smart_split_sql_definitions, parse_complex_column_definition
+from utils.util import smart_split_sql_definitions, parse_complex_column_definition
+from .sql_stream import (
+    SQLStatementSplitter, iter_sql_statements, is_create_table,
+    open_sql_binary, detect_file_encoding, iter_text_chunks
+)
+from .ddl_tokenizer import scan_create_table
+from .schema_model import ColumnDef
+from .schema_compare import SchemaComparator, DEFAULT_RULES
+from .column_parser import (
+    MYSQL_COLUMNS, POSTGRESQL_COLUMNS, ORACLE_COLUMNS, SQLSERVER_COLUMNS,
+    SQLITE_COLUMNS, MONGODB_COLUMNS, DB2_COLUMNS
+)
+
+# 多进程解析时每批语句的总字符数，按批提交以摊薄进程间序列化的开销
+PARSE_BATCH_SIZE = 256 << 10
+# 未指定进程数时，文件达到该大小才使用多进程解析
+PARALLEL_PARSE_MIN_SIZE = 16 << 20
+
+def _parse_statement_batch(parser, statements):
+    """在子进程中解析一批 CREATE TABLE 语句（模块级函数，便于进程池序列化）"""
+    tables = {}
+    for statement in statements:
+        tables.update(parser._parse_statement(statement))
+    return tables
 
 class BaseSQLParser:
     """SQL解析器基类"""
     
+    # 流式切分语句时是否把 # 视为行注释、字符串中的反斜杠是否为转义字符
+    hash_comments = False
+    backslash_escapes = False
+    # 表名两侧的引用符号
+    identifier_quotes = '"'
+    # 是否使用快速 CREATE TABLE 解析，无法处理的语句仍回退到 sqlparse
+    fast_path = True
+    # 列定义解析器（各方言的关键字表见 column_parser）
+    column_parser = None
+    # 比较时的等价规则（见 schema_compare）
+    comparison_rules = DEFAULT_RULES
+    
     def __init__(self, ignore_case=True):
         self.ignore_case = ignore_case
         
@@ -17,15 +55,32 @@ class BaseSQLParser:
         
     def parse_sql(self, sql_content):
         """解析SQL字符串，返回表结构字典"""
-        # 解析SQL语句
-        statements = sqlparse.parse(sql_content)
-        return self._parse_statements(statements)
+        splitter = SQLStatementSplitter(is_create_table, self.hash_comments, self.backslash_escapes)
+        tables = {}
+        for statement in splitter.feed(sql_content, final=True):
+            tables.update(self._parse_statement(statement))
+        return tables
+        
+    def parse_file(self, file_path, workers=None):
+        """解析SQL文件，返回表结构字典
         
-    def parse_file(self, file_path):
-        """解析SQL文件，返回表结构字典"""
+        文件按块流式读取并逐条切分语句，只有 CREATE TABLE 语句交给 sqlparse 和列解析器，
+        INSERT/LOCK/SET 等语句在切分时直接跳过，内存占用只与最大的单条语句有关。
+        支持 .gz / .xz / .zst 压缩文件（按文件头识别，流式解压），普通文件使用 mmap 读取。
+        workers 为解析进程数，大于 1 时语句按批分发到进程池并行解析；
+        为 None 时文件达到 PARALLEL_PARSE_MIN_SIZE 才使用全部 CPU 核心。
+        """
+        if workers is None:
+            try:
+                large_file = os.path.getsize(file_path) >= PARALLEL_PARSE_MIN_SIZE
+            except OSError:
+                large_file = False
+            workers = (os.cpu_count() or 1) if large_file else 1
+            
+        # 只根据文件开头检测一次编码，解码失败时才依次尝试后面的编码
+        encodings = ['utf-8', 'gbk', 'latin-1']
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                content = file.read()
+            detected = detect_file_encoding(file_path)
         except FileNotFoundError:
             # 文件不存在时返回空字典
             print(f"错误：文件 '{file_path}' 不存在")
@@ -33,158 +88,151 @@ class BaseSQLParser:
         except PermissionError:
             print(f"错误：没有权限读取文件 '{file_path}'")
             return {}
-        except UnicodeDecodeError as e:
-            print(f"错误：文件 '{file_path}' 编码错误：{e}")
-            # 尝试其他编码
-            try:
-                with open(file_path, 'r', encoding='gbk') as file:
-                    content = file.read()
-                print(f"使用 GBK 编码成功读取文件")
-            except Exception:
-                try:
-                    with open(file_path, 'r', encoding='latin-1') as file:
-                        content = file.read()
-                    print(f"使用 Latin-1 编码成功读取文件")
-                except Exception:
-                    print(f"错误：无法使用任何编码读取文件 '{file_path}'")
-                    return {}
         except Exception as e:
-            # 其他错误时提供更具体的错误信息
             print(f"错误：读取文件 '{file_path}' 时出错：{type(e).__name__}: {e}")
             return {}
+        if detected in encodings:
+            encodings = encodings[encodings.index(detected):]
+        else:
+            encodings.insert(0, detected)
             
-        # 解析SQL语句
-        try:
-            statements = sqlparse.parse(content)
-            return self._parse_statements(statements)
-        except Exception as e:
-            print(f"错误：解析SQL文件 '{file_path}' 内容时出错：{type(e).__name__}: {e}")
-            return {}
+        for encoding in encodings:
+            try:
+                if workers > 1:
+                    tables = self._parse_file_parallel(file_path, encoding, workers)
+                else:
+                    tables = self._parse_file_stream(file_path, encoding)
+                if not encoding.startswith('utf-8'):
+                    print(f"使用 {encoding.upper()} 编码成功读取文件")
+                return tables
+            except FileNotFoundError:
+                # 文件不存在时返回空字典
+                print(f"错误：文件 '{file_path}' 不存在")
+                return {}
+            except PermissionError:
+                print(f"错误：没有权限读取文件 '{file_path}'")
+                return {}
+            except UnicodeDecodeError as e:
+                # 尝试其他编码
+                print(f"错误：文件 '{file_path}' 编码错误：{e}")
+            except Exception as e:
+                print(f"错误：解析SQL文件 '{file_path}' 内容时出错：{type(e).__name__}: {e}")
+                return {}
+                
+        print(f"错误：无法使用任何编码读取文件 '{file_path}'")
+        return {}
+        
+    def _iter_file_statements(self, stream, encoding):
+        """从文件流中逐条产生 CREATE TABLE 语句"""
+        return iter_sql_statements(
+            iter_text_chunks(stream, encoding),
+            keep=is_create_table,
+            hash_comments=self.hash_comments,
+            backslash_escapes=self.backslash_escapes
+        )
+        
+    def _parse_file_stream(self, file_path, encoding):
+        """以指定编码流式解析SQL文件"""
+        tables = {}
+        with open_sql_binary(file_path) as stream:
+            for statement in self._iter_file_statements(stream, encoding):
+                tables.update(self._parse_statement(statement))
+        return tables
+        
+    def _parse_file_parallel(self, file_path, encoding, workers):
+        """以指定编码流式切分SQL文件，语句按批交给进程池解析
+        
+        切分仍在当前进程中进行，同时在途的批次数有上限，内存占用不会随文件大小增长；
+        结果按提交顺序合并，同名表与串行解析一样以后出现的定义为准。
+        """
+        tables = {}
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=workers) as executor, \
+                open_sql_binary(file_path) as stream:
+            batch = []
+            batch_size = 0
+            for statement in self._iter_file_statements(stream, encoding):
+                batch.append(statement)
+                batch_size += len(statement)
+                if batch_size < PARSE_BATCH_SIZE:
+                    continue
+                pending.append(executor.submit(_parse_statement_batch, self, batch))
+                batch = []
+                batch_size = 0
+                if len(pending) >= workers * 2:
+                    tables.update(pending.popleft().result())
+            if batch:
+                pending.append(executor.submit(_parse_statement_batch, self, batch))
+            while pending:
+                tables.update(pending.popleft().result())
+        return tables
+        
+    def _parse_statement(self, statement):
+        """解析单条 CREATE TABLE 语句，优先使用快速解析，无法处理时回退到 sqlparse"""
+        table = scan_create_table(statement) if self.fast_path else None
+        if table is None:
+            tables = self._parse_statements(sqlparse.parse(statement))
+        else:
+            table_name, body = table
+            table_name = table_name.strip(self.identifier_quotes)
+            if not table_name:
+                return {}
+            columns = {}
+            indexes = {}
+            self._parse_definitions(body.strip('()'), columns, indexes)
+            tables = {
+                table_name: {
+                    'columns': columns,
+                    'indexes': indexes,
+                    'raw_sql': statement
+                }
+            }
+            
+        # 预先计算结构摘要（多进程解析时在子进程中完成），比较时相同的表直接跳过
+        for table in tables.values():
+            self.table_digest(table)
+        return tables
+        
+    def _parse_column_definition(self, definition):
+        """解析列定义，返回详细信息"""
+        return self.column_parser.parse(definition)
+        
+    def _parse_definitions(self, content, columns, indexes):
+        """解析括号内的列定义和索引，子类必须实现"""
+        raise NotImplementedError
         
     def _parse_statements(self, statements):
         """解析SQL语句列表，返回表结构字典，子类必须实现"""
         raise NotImplementedError
         
-    def compare_tables(self, left_tables, right_tables):
-        """比较两个表结构的差异，子类必须实现"""
-        raise NotImplementedError
+    @property
+    def comparator(self):
+        """当前大小写设置下的比较引擎"""
+        comparator = getattr(self, '_comparator', None)
+        if comparator is None or comparator.ignore_case != self.ignore_case:
+            comparator = self._comparator = SchemaComparator(self.ignore_case, self.comparison_rules)
+        return comparator
+        
+    def compare_tables(self, left_tables, right_tables, workers=None):
+        """比较两个表结构的差异，workers 为比较进程数（None 表示按表数量自动选择）"""
+        return self.comparator.compare_tables(left_tables, right_tables, workers)
+        
+    def compare_table(self, left_table, right_table):
+        """比较同名的两个表，返回该表的差异（无差异时返回空字典）"""
+        return self.comparator.compare_table(left_table, right_table)
+        
+    def table_digest(self, table):
+        """计算表结构摘要，摘要相同的两个表比较结果一定没有差异"""
+        return self.comparator.table_digest(table)
 
 class MySQLParser(BaseSQLParser):
     """MySQL SQL解析器"""
     
-    def _parse_column_definition(self, definition):
-        """解析MySQL列定义，返回详细信息
-        
-        支持的列定义格式示例：
-        - INT NOT NULL AUTO_INCREMENT
-        - VARCHAR(255) CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci NOT NULL DEFAULT ''
-        - DECIMAL(10,2) UNSIGNED NOT NULL DEFAULT 0.00
-        - TIMESTAMP NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
-        """
-        details = {
-            'Type': None,           # 数据类型
-            'Null': 'YES',          # YES/NO
-            'Default': None,        # 默认值
-            'Comment': None,        # 注释
-            'Extra': None,          # 额外信息（如 AUTO_INCREMENT）
-            'Charset': None,        # 字符集
-            'Collation': None,      # 排序规则
-            'Attributes': set(),    # 其他属性（如 UNSIGNED, ZEROFILL 等）
-            'Key': None,            # 键类型
-        }
-        
-        # 分割定义字符串
-        parts = definition.split()
-        if not parts:
-            return details
-            
-        # 解析类型（包括长度/精度）
-        type_parts = []
-        i = 0
-        while i < len(parts):
-            current = parts[i].upper()
-            # 如果遇到属性关键字，停止类型解析
-            if current in ('UNSIGNED', 'ZEROFILL', 'NOT', 'NULL', 'DEFAULT', 'COMMENT', 
-                         'CHARACTER', 'COLLATE', 'AUTO_INCREMENT', 'UNIQUE', 'PRIMARY',
-                         'STORAGE', 'MEMORY', 'ON'):
-                break
-            type_parts.append(parts[i])
-            i += 1
-        details['Type'] = ' '.join(type_parts)
-        
-        # 解析剩余属性
-        while i < len(parts):
-            current = parts[i].upper()
-            
-            # 处理 NULL/NOT NULL
-            if current == 'NOT' and i + 1 < len(parts) and parts[i + 1].upper() == 'NULL':
-                details['Null'] = 'NO'
-                i += 2
-            elif current == 'NULL':
-                details['Null'] = 'YES'
-                i += 1
-                
-            # 处理 DEFAULT
-            elif current == 'DEFAULT':
-                if i + 1 < len(parts):
-                    default_value = parts[i + 1]
-                    # 处理带引号的默认值
-                    if default_value.startswith("'") and default_value.endswith("'"):
-                        default_value = default_value[1:-1]
-                    # 处理特殊默认值
-                    elif default_value.upper() in ('CURRENT_TIMESTAMP', 'NULL'):
-                        default_value = default_value
-                    details['Default'] = default_value
-                i += 2
-                
-            # 处理 COMMENT
-            elif current == 'COMMENT':
-                if i + 1 < len(parts):
-                    comment = parts[i + 1]
-                    if comment.startswith("'") and comment.endswith("'"):
-                        comment = comment[1:-1]
-                    details['Comment'] = comment
-                i += 2
-                
-            # 处理字符集
-            elif current == 'CHARACTER' and i + 2 < len(parts) and parts[i + 1].upper() == 'SET':
-                details['Charset'] = parts[i + 2]
-                i += 3
-                
-            # 处理排序规则
-            elif current == 'COLLATE':
-                if i + 1 < len(parts):
-                    details['Collation'] = parts[i + 1]
-                i += 2
-                
-            # 处理 AUTO_INCREMENT
-            elif current == 'AUTO_INCREMENT':
-                details['Extra'] = 'auto_increment'
-                i += 1
-                
-            # 处理其他属性
-            elif current in ('UNSIGNED', 'ZEROFILL', 'STORAGE', 'MEMORY'):
-                details['Attributes'].add(current.lower())
-                i += 1
-                
-            # 处理 ON UPDATE CURRENT_TIMESTAMP
-            elif current == 'ON' and i + 2 < len(parts):
-                if ' '.join(parts[i:i+3]).upper() == 'ON UPDATE CURRENT_TIMESTAMP':
-                    details['Extra'] = 'on update CURRENT_TIMESTAMP'
-                    i += 3
-                else:
-                    i += 1
-            else:
-                i += 1
-                
-        # 将属性集合转换为字符串
-        if details['Attributes']:
-            details['Attributes'] = ' '.join(sorted(details['Attributes']))
-        else:
-            details['Attributes'] = None
-            
-        return details
-        
+    hash_comments = True
+    backslash_escapes = True
+    identifier_quotes = '`'
+    column_parser = MYSQL_COLUMNS
+    
     def _parse_statements(self, statements):
         """解析SQL语句列表，返回表结构字典"""
         tables = {}
@@ -211,71 +259,8 @@ class MySQLParser(BaseSQLParser):
                 if isinstance(item, Parenthesis):
                     # 获取括号内的内容
                     content = item.value.strip('()')
-                    # 使用智能分割方法分割每个定义（仅限MySQLParser）
-                    defs = smart_split_sql_definitions(content)
+                    self._parse_definitions(content, columns, indexes)
                     
-                    for definition in defs:
-                        if not definition:
-                            continue
-                            
-                        # 处理索引定义
-                        if definition.upper().startswith(('PRIMARY KEY', 'KEY', 'UNIQUE KEY', 'FOREIGN KEY')):
-                            index_type = None
-                            index_name = None
-                            index_columns = None
-                            
-                            # 解析索引类型和名称
-                            parts = definition.split(None, 2)
-                            if len(parts) >= 2:
-                                if parts[0].upper() == 'PRIMARY':
-                                    index_type = 'PRIMARY KEY'
-                                    index_name = 'PRIMARY'
-                                    if len(parts) > 2:
-                                        index_columns = parts[2].strip('()')
-                                    else:
-                                        continue  # 没有列定义，跳过
-                                elif parts[0].upper() in ('KEY', 'UNIQUE'):
-                                    index_type = parts[0].upper()
-                                    if len(parts) > 2:
-                                        # 有索引名称
-                                        index_name = parts[1].strip('`"[]')
-                                        index_columns = parts[2].strip('()')
-                                    elif len(parts) == 2:
-                                        # 没有索引名称，使用默认名称
-                                        index_name = f"auto_{index_type.lower()}_{len(indexes)}"
-                                        index_columns = parts[1].strip('()')
-                                    else:
-                                        continue  # 不完整的定义，跳过
-                                elif parts[0].upper() == 'FOREIGN':
-                                    index_type = 'FOREIGN KEY'
-                                    if len(parts) > 2:
-                                        index_name = f"fk_{len(indexes)}"
-                                        index_columns = parts[2].strip('()')
-                                    else:
-                                        continue
-                                else:
-                                    continue  # 未知的索引类型
-                                        
-                                # 确保索引名称和列都不为空
-                                if index_name and index_columns and index_name.strip() and index_columns.strip():
-                                    indexes[index_name] = {
-                                        'type': index_type,
-                                        'columns': index_columns
-                                    }
-                            continue
-                            
-                        # 处理列定义
-                        parts = definition.split(None, 1)
-                        if len(parts) >= 2:
-                            col_name = parts[0].strip('`')
-                            col_definition = parts[1].strip()
-                            # 存储原始定义和标准化后的定义
-                            columns[col_name] = {
-                                'raw': col_definition,
-                                'normalized': normalize_sql_definition(col_definition),
-                                'details': self._parse_column_definition(col_definition)
-                            }
-                            
             if table_name:
                 tables[table_name] = {
                     'columns': columns,
@@ -285,243 +270,74 @@ class MySQLParser(BaseSQLParser):
                 
         return tables
         
-    def compare_tables(self, left_tables, right_tables):
-        """比较两个表结构的差异"""
-        differences = {
-            'added_tables': [],
-            'removed_tables': [],
-            'modified_tables': {}
-        }
-        
-        def normalize_value(value):
-            """统一处理空值"""
-            if value == '':
-                return None
-            return value
-            
-        def normalize_details(details):
-            """统一处理details中的空值"""
-            if not details:
-                return details
-            normalized = {}
-            for key, value in details.items():
-                if isinstance(value, dict):
-                    normalized[key] = normalize_details(value)
-                else:
-                    normalized[key] = normalize_value(value)
-            return normalized
-        
-        # 检查新增和删除的表
-        if self.ignore_case:
-            left_table_names = {self._normalize_name(name) for name in left_tables.keys()}
-            right_table_names = {self._normalize_name(name) for name in right_tables.keys()}
-            # 创建名称映射
-            left_name_map = {self._normalize_name(name): name for name in left_tables.keys()}
-            right_name_map = {self._normalize_name(name): name for name in right_tables.keys()}
-        else:
-            left_table_names = set(left_tables.keys())
-            right_table_names = set(right_tables.keys())
-            left_name_map = {name: name for name in left_tables.keys()}
-            right_name_map = {name: name for name in right_tables.keys()}
+    def _parse_definitions(self, content, columns, indexes):
+        """解析括号内的列定义和索引，结果写入 columns 和 indexes"""
+        # 使用智能分割方法分割每个定义（仅限MySQLParser）
+        defs = smart_split_sql_definitions(content, backslash_escapes=self.backslash_escapes)
         
-        differences['added_tables'] = [right_name_map[name] for name in (right_table_names - left_table_names)]
-        differences['removed_tables'] = [left_name_map[name] for name in (left_table_names - right_table_names)]
-        
-        # 检查修改的表
-        common_tables = left_table_names & right_table_names
-        for normalized_table_name in common_tables:
-            # 获取原始表名
-            left_original_name = left_name_map[normalized_table_name]
-            right_original_name = right_name_map[normalized_table_name]
-            
-            left_cols = left_tables[left_original_name]['columns']
-            right_cols = right_tables[right_original_name]['columns']
-            left_indexes = left_tables[left_original_name]['indexes']
-            right_indexes = right_tables[right_original_name]['indexes']
-            
-            table_diffs = {}
-            
-            # 比较列定义
-            if self.ignore_case:
-                left_col_names = {self._normalize_name(col): col for col in left_cols.keys()}
-                right_col_names = {self._normalize_name(col): col for col in right_cols.keys()}
-                # 在忽略大小写模式下，使用标准化后的定义进行比较
-                left_col_normalized = {self._normalize_name(col): {
-                    'raw': defn['raw'],
-                    'normalized': defn['normalized'],
-                    'details': defn['details']
-                } for col, defn in left_cols.items()}
-                right_col_normalized = {self._normalize_name(col): {
-                    'raw': defn['raw'],
-                    'normalized': defn['normalized'],
-                    'details': defn['details']
-                } for col, defn in right_cols.items()}
-            else:
-                left_col_names = {col: col for col in left_cols.keys()}
-                right_col_names = {col: col for col in right_cols.keys()}
-                left_col_normalized = left_cols
-                right_col_normalized = right_cols
-            
-            # 检查列名差异（即使定义相同，列名大小写不同也算差异）
-            left_col_set = set(left_col_normalized.keys())
-            right_col_set = set(right_col_normalized.keys())
-            
-            # 在忽略大小写模式下，比较标准化后的定义
-            if self.ignore_case:
-                # 比较标准化后的定义
-                left_normalized_defs = {col: defn['normalized'] for col, defn in left_col_normalized.items()}
-                right_normalized_defs = {col: defn['normalized'] for col, defn in right_col_normalized.items()}
-                definitions_different = left_normalized_defs != right_normalized_defs
-            else:
-                # 比较原始定义
-                left_raw_defs = {col: defn['raw'] for col, defn in left_col_normalized.items()}
-                right_raw_defs = {col: defn['raw'] for col, defn in right_col_normalized.items()}
-                definitions_different = left_raw_defs != right_raw_defs
-                
-            if left_col_set != right_col_set or definitions_different:
-                table_diffs['columns'] = {
-                    'added_columns': {right_col_names[col]: defn['raw'] for col, defn in right_col_normalized.items() if col not in left_col_normalized},
-                    'removed_columns': {left_col_names[col]: defn['raw'] for col, defn in left_col_normalized.items() if col not in right_col_normalized},
-                    'modified_columns': {}
-                }
+        for definition in defs:
+            if not definition:
+                continue
                 
-                # 比较共同列的details
-                common_cols = set(left_col_normalized.keys()) & set(right_col_normalized.keys())
-                for normalized_col in common_cols:
-                    left_original_col = left_col_names[normalized_col]
-                    right_original_col = right_col_names[normalized_col]
-                    
-                    # 在区分大小写模式下，如果原始定义不同，直接标记为修改
-                    if not self.ignore_case:
-                        left_raw = left_cols[left_original_col]['raw']
-                        right_raw = right_cols[right_original_col]['raw']
-                        if left_raw != right_raw:
-                            table_diffs['columns']['modified_columns'][left_original_col] = {
-                                'raw': {
-                                    'left': left_raw,
-                                    'right': right_raw
-                                },
-                                'details': {
-                                    'Definition': {
-                                        'left': left_raw,
-                                        'right': right_raw
-                                    }
-                                }
-                            }
+            # 处理索引定义
+            if definition.upper().startswith(('PRIMARY KEY', 'KEY', 'UNIQUE KEY', 'FOREIGN KEY')):
+                index_type = None
+                index_name = None
+                index_columns = None
+                
+                # 解析索引类型和名称
+                parts = definition.split(None, 2)
+                if len(parts) >= 2:
+                    if parts[0].upper() == 'PRIMARY':
+                        index_type = 'PRIMARY KEY'
+                        index_name = 'PRIMARY'
+                        if len(parts) > 2:
+                            index_columns = parts[2].strip('()')
+                        else:
+                            continue  # 没有列定义，跳过
+                    elif parts[0].upper() in ('KEY', 'UNIQUE'):
+                        index_type = parts[0].upper()
+                        if len(parts) > 2:
+                            # 有索引名称
+                            index_name = parts[1].strip('`"[]')
+                            index_columns = parts[2].strip('()')
+                        elif len(parts) == 2:
+                            # 没有索引名称，使用默认名称
+                            index_name = f"auto_{index_type.lower()}_{len(indexes)}"
+                            index_columns = parts[1].strip('()')
+                        else:
+                            continue  # 不完整的定义，跳过
+                    elif parts[0].upper() == 'FOREIGN':
+                        index_type = 'FOREIGN KEY'
+                        if len(parts) > 2:
+                            index_name = f"fk_{len(indexes)}"
+                            index_columns = parts[2].strip('()')
+                        else:
                             continue
-                    
-                    # 在忽略大小写模式下，比较details
-                    left_details = normalize_details(left_cols[left_original_col]['details'])
-                    right_details = normalize_details(right_cols[right_original_col]['details'])
-                    
-                    if left_details != right_details:
-                        # 找出具体哪些属性发生了变化
-                        changed_attrs = {}
-                        for key in set(left_details.keys()) | set(right_details.keys()):
-                            if left_details.get(key) != right_details.get(key):
-                                changed_attrs[key] = {
-                                    'left': left_details.get(key),
-                                    'right': right_details.get(key)
-                                }
-                        
-                        if changed_attrs:
-                            # 使用左侧的列名作为标准
-                            table_diffs['columns']['modified_columns'][left_original_col] = {
-                                'raw': {
-                                    'left': left_cols[left_original_col]['raw'],
-                                    'right': right_cols[right_original_col]['raw']
-                                },
-                                'details': changed_attrs
-                            }
-                            # 列修改信息已记录
-            
-            # 比较索引定义
-            if left_indexes != right_indexes:
-                table_diffs['indexes'] = {
-                    'added_indexes': {idx: defn for idx, defn in right_indexes.items() if idx not in left_indexes},
-                    'removed_indexes': {idx: defn for idx, defn in left_indexes.items() if idx not in right_indexes},
-                    'modified_indexes': {
-                        idx: {'left': left_indexes[idx], 'right': right_indexes[idx]}
-                        for idx in set(left_indexes.keys()) & set(right_indexes.keys())
-                        if left_indexes[idx] != right_indexes[idx]
-                    }
-                }
-            
-            if table_diffs:
-                # 使用左侧的表名作为标准
-                differences['modified_tables'][left_original_name] = table_diffs
+                    else:
+                        continue  # 未知的索引类型
+                            
+                    # 确保索引名称和列都不为空
+                    if index_name and index_columns and index_name.strip() and index_columns.strip():
+                        indexes[index_name] = {
+                            'type': index_type,
+                            'columns': index_columns
+                        }
+                continue
                 
-        return differences
+            # 处理列定义
+            parts = definition.split(None, 1)
+            if len(parts) >= 2:
+                col_name = parts[0].strip('`')
+                col_definition = parts[1].strip()
+                # 存储原始定义和解析后的详细信息，标准化后的定义在首次使用时计算
+                columns[col_name] = ColumnDef(col_definition, self._parse_column_definition(col_definition))
 
 class PostgreSQLParser(BaseSQLParser):
     """PostgreSQL SQL解析器"""
     
-    def _parse_column_definition(self, definition):
-        """解析PostgreSQL列定义，返回详细信息"""
-        details = {
-            'Type': None,           # 数据类型
-            'Null': 'YES',          # YES/NO
-            'Default': None,        # 默认值
-            'Comment': None,        # 注释
-            'Extra': None,          # 额外信息
-            'UDT': None,            # 用户定义类型
-        }
-        
-        # 分割定义字符串
-        parts = definition.split()
-        if not parts:
-            return details
-            
-        # 解析类型（包括长度/精度）
-        type_parts = []
-        i = 0
-        while i < len(parts):
-            current = parts[i].upper()
-            # 如果遇到属性关键字，停止类型解析
-            if current in ('NOT', 'NULL', 'DEFAULT', 'COMMENT'):
-                break
-            type_parts.append(parts[i])
-            i += 1
-        details['Type'] = ' '.join(type_parts)
-        
-        # 解析剩余属性
-        while i < len(parts):
-            current = parts[i].upper()
-            
-            # 处理 NULL/NOT NULL
-            if current == 'NOT' and i + 1 < len(parts) and parts[i + 1].upper() == 'NULL':
-                details['Null'] = 'NO'
-                i += 2
-            elif current == 'NULL':
-                details['Null'] = 'YES'
-                i += 1
-                
-            # 处理 DEFAULT
-            elif current == 'DEFAULT':
-                if i + 1 < len(parts):
-                    default_value = parts[i + 1]
-                    # 处理带引号的默认值
-                    if default_value.startswith("'") and default_value.endswith("'"):
-                        default_value = default_value[1:-1]
-                    # 处理特殊默认值
-                    elif default_value.upper() in ('CURRENT_TIMESTAMP', 'NULL'):
-                        default_value = default_value
-                    details['Default'] = default_value
-                i += 2
-                
-            # 处理 COMMENT
-            elif current == 'COMMENT':
-                if i + 1 < len(parts):
-                    comment = parts[i + 1]
-                    if comment.startswith("'") and comment.endswith("'"):
-                        comment = comment[1:-1]
-                    details['Comment'] = comment
-                i += 2
-            else:
-                i += 1
-                
-        return details
-        
+    column_parser = POSTGRESQL_COLUMNS
+    
     def _parse_statements(self, statements):
         """解析SQL语句列表，返回表结构字典"""
         tables = {}
@@ -548,65 +364,8 @@ class PostgreSQLParser(BaseSQLParser):
                 if isinstance(item, Parenthesis):
                     # 获取括号内的内容
                     content = item.value.strip('()')
-                    # 使用智能分割方法分割每个定义
-                    defs = smart_split_sql_definitions(content)
+                    self._parse_definitions(content, columns, indexes)
                     
-                    for definition in defs:
-                        if not definition:
-                            continue
-                            
-                        # 处理约束定义
-                        if definition.upper().startswith(('PRIMARY KEY', 'UNIQUE', 'FOREIGN KEY')):
-                            index_type = None
-                            index_name = None
-                            index_columns = None
-                            
-                            # 解析约束类型和名称
-                            parts = definition.split(None, 2)
-                            if len(parts) >= 2:
-                                if parts[0].upper() == 'PRIMARY':
-                                    index_type = 'PRIMARY KEY'
-                                    index_name = 'PRIMARY'
-                                    if len(parts) > 2:
-                                        index_columns = parts[2].strip('()')
-                                    else:
-                                        continue  # 没有列定义，跳过
-                                elif parts[0].upper() in ('UNIQUE', 'FOREIGN'):
-                                    if parts[0].upper() == 'FOREIGN':
-                                        index_type = 'FOREIGN KEY'
-                                        index_name = f"fk_{len(indexes)}"
-                                    else:
-                                        index_type = parts[0].upper()
-                                        index_name = f"unique_{len(indexes)}"
-                                    if len(parts) > 2:
-                                        index_columns = parts[2].strip('()')
-                                    elif len(parts) == 2:
-                                        index_columns = parts[1].strip('()')
-                                    else:
-                                        continue
-                                else:
-                                    continue  # 未知的约束类型
-                                        
-                                # 确保索引名称和列都不为空
-                                if index_name and index_columns and index_name.strip() and index_columns.strip():
-                                    indexes[index_name] = {
-                                        'type': index_type,
-                                        'columns': index_columns
-                                    }
-                            continue
-                            
-                        # 处理列定义
-                        parts = definition.split(None, 1)
-                        if len(parts) >= 2:
-                            col_name = parts[0].strip('"')
-                            col_definition = parts[1].strip()
-                            # 存储原始定义和标准化后的定义
-                            columns[col_name] = {
-                                'raw': col_definition,
-                                'normalized': normalize_sql_definition(col_definition),
-                                'details': self._parse_column_definition(col_definition)
-                            }
-                            
             if table_name:
                 tables[table_name] = {
                     'columns': columns,
@@ -616,83 +375,68 @@ class PostgreSQLParser(BaseSQLParser):
                 
         return tables
         
-    def compare_tables(self, left_tables, right_tables):
-        """比较两个表结构的差异（与MySQL相同）"""
-        # 使用与MySQL相同的比较逻辑
-        mysql_parser = MySQLParser(ignore_case=self.ignore_case)
-        return mysql_parser.compare_tables(left_tables, right_tables)
+    def _parse_definitions(self, content, columns, indexes):
+        """解析括号内的列定义和索引，结果写入 columns 和 indexes"""
+        # 使用智能分割方法分割每个定义
+        defs = smart_split_sql_definitions(content, backslash_escapes=self.backslash_escapes)
+        
+        for definition in defs:
+            if not definition:
+                continue
+                
+            # 处理约束定义
+            if definition.upper().startswith(('PRIMARY KEY', 'UNIQUE', 'FOREIGN KEY')):
+                index_type = None
+                index_name = None
+                index_columns = None
+                
+                # 解析约束类型和名称
+                parts = definition.split(None, 2)
+                if len(parts) >= 2:
+                    if parts[0].upper() == 'PRIMARY':
+                        index_type = 'PRIMARY KEY'
+                        index_name = 'PRIMARY'
+                        if len(parts) > 2:
+                            index_columns = parts[2].strip('()')
+                        else:
+                            continue  # 没有列定义，跳过
+                    elif parts[0].upper() in ('UNIQUE', 'FOREIGN'):
+                        if parts[0].upper() == 'FOREIGN':
+                            index_type = 'FOREIGN KEY'
+                            index_name = f"fk_{len(indexes)}"
+                        else:
+                            index_type = parts[0].upper()
+                            index_name = f"unique_{len(indexes)}"
+                        if len(parts) > 2:
+                            index_columns = parts[2].strip('()')
+                        elif len(parts) == 2:
+                            index_columns = parts[1].strip('()')
+                        else:
+                            continue
+                    else:
+                        continue  # 未知的约束类型
+                            
+                    # 确保索引名称和列都不为空
+                    if index_name and index_columns and index_name.strip() and index_columns.strip():
+                        indexes[index_name] = {
+                            'type': index_type,
+                            'columns': index_columns
+                        }
+                continue
+                
+            # 处理列定义
+            parts = definition.split(None, 1)
+            if len(parts) >= 2:
+                col_name = parts[0].strip('"')
+                col_definition = parts[1].strip()
+                # 存储原始定义和解析后的详细信息，标准化后的定义在首次使用时计算
+                columns[col_name] = ColumnDef(col_definition, self._parse_column_definition(col_definition))
 
 class OracleParser(BaseSQLParser):
     """Oracle SQL解析器"""
     
-    def _parse_column_definition(self, definition):
-        """解析Oracle列定义，返回详细信息"""
-        details = {
-            'Type': None,           # 数据类型
-            'Null': 'YES',          # YES/NO
-            'Default': None,        # 默认值
-            'Comment': None,        # 注释
-            'Extra': None,          # 额外信息
-            'Length': None,         # 长度
-            'Precision': None,      # 精度
-            'Scale': None,          # 小数位数
-        }
-        
-        # 分割定义字符串
-        parts = definition.split()
-        if not parts:
-            return details
-            
-        # 解析类型（包括长度/精度）
-        type_parts = []
-        i = 0
-        while i < len(parts):
-            current = parts[i].upper()
-            # 如果遇到属性关键字，停止类型解析
-            if current in ('NOT', 'NULL', 'DEFAULT', 'COMMENT'):
-                break
-            type_parts.append(parts[i])
-            i += 1
-        details['Type'] = ' '.join(type_parts)
-        
-        # 解析剩余属性
-        while i < len(parts):
-            current = parts[i].upper()
-            
-            # 处理 NULL/NOT NULL
-            if current == 'NOT' and i + 1 < len(parts) and parts[i + 1].upper() == 'NULL':
-                details['Null'] = 'NO'
-                i += 2
-            elif current == 'NULL':
-                details['Null'] = 'YES'
-                i += 1
-                
-            # 处理 DEFAULT
-            elif current == 'DEFAULT':
-                if i + 1 < len(parts):
-                    default_value = parts[i + 1]
-                    # 处理带引号的默认值
-                    if default_value.startswith("'") and default_value.endswith("'"):
-                        default_value = default_value[1:-1]
-                    # 处理特殊默认值
-                    elif default_value.upper() in ('CURRENT_TIMESTAMP', 'NULL'):
-                        default_value = default_value
-                    details['Default'] = default_value
-                i += 2
-                
-            # 处理 COMMENT
-            elif current == 'COMMENT':
-                if i + 1 < len(parts):
-                    comment = parts[i + 1]
-                    if comment.startswith("'") and comment.endswith("'"):
-                        comment = comment[1:-1]
-                    details['Comment'] = comment
-                i += 2
-            else:
-                i += 1
-                
-        return details
-        
+    column_parser = ORACLE_COLUMNS
+    
     def _parse_statements(self, statements):
         """解析SQL语句列表，返回表结构字典"""
         tables = {}
@@ -719,65 +463,8 @@ class OracleParser(BaseSQLParser):
                 if isinstance(item, Parenthesis):
                     # 获取括号内的内容
                     content = item.value.strip('()')
-                    # 使用智能分割方法分割每个定义
-                    defs = smart_split_sql_definitions(content)
+                    self._parse_definitions(content, columns, indexes)
                     
-                    for definition in defs:
-                        if not definition:
-                            continue
-                            
-                        # 处理约束定义
-                        if definition.upper().startswith(('PRIMARY KEY', 'UNIQUE', 'FOREIGN KEY')):
-                            index_type = None
-                            index_name = None
-                            index_columns = None
-                            
-                            # 解析约束类型和名称
-                            parts = definition.split(None, 2)
-                            if len(parts) >= 2:
-                                if parts[0].upper() == 'PRIMARY':
-                                    index_type = 'PRIMARY KEY'
-                                    index_name = 'PRIMARY'
-                                    if len(parts) > 2:
-                                        index_columns = parts[2].strip('()')
-                                    else:
-                                        continue  # 没有列定义，跳过
-                                elif parts[0].upper() in ('UNIQUE', 'FOREIGN'):
-                                    if parts[0].upper() == 'FOREIGN':
-                                        index_type = 'FOREIGN KEY'
-                                        index_name = f"fk_{len(indexes)}"
-                                    else:
-                                        index_type = parts[0].upper()
-                                        index_name = f"unique_{len(indexes)}"
-                                    if len(parts) > 2:
-                                        index_columns = parts[2].strip('()')
-                                    elif len(parts) == 2:
-                                        index_columns = parts[1].strip('()')
-                                    else:
-                                        continue
-                                else:
-                                    continue  # 未知的约束类型
-                                        
-                                # 确保索引名称和列都不为空
-                                if index_name and index_columns and index_name.strip() and index_columns.strip():
-                                    indexes[index_name] = {
-                                        'type': index_type,
-                                        'columns': index_columns
-                                    }
-                            continue
-                            
-                        # 处理列定义
-                        parts = definition.split(None, 1)
-                        if len(parts) >= 2:
-                            col_name = parts[0].strip('"')
-                            col_definition = parts[1].strip()
-                            # 存储原始定义和标准化后的定义
-                            columns[col_name] = {
-                                'raw': col_definition,
-                                'normalized': normalize_sql_definition(col_definition),
-                                'details': self._parse_column_definition(col_definition)
-                            }
-                            
             if table_name:
                 tables[table_name] = {
                     'columns': columns,
@@ -787,89 +474,69 @@ class OracleParser(BaseSQLParser):
                 
         return tables
         
-    def compare_tables(self, left_tables, right_tables):
-        """比较两个表结构的差异（与MySQL相同）"""
-        # 使用与MySQL相同的比较逻辑
-        mysql_parser = MySQLParser(ignore_case=self.ignore_case)
-        return mysql_parser.compare_tables(left_tables, right_tables)
+    def _parse_definitions(self, content, columns, indexes):
+        """解析括号内的列定义和索引，结果写入 columns 和 indexes"""
+        # 使用智能分割方法分割每个定义
+        defs = smart_split_sql_definitions(content, backslash_escapes=self.backslash_escapes)
+        
+        for definition in defs:
+            if not definition:
+                continue
+                
+            # 处理约束定义
+            if definition.upper().startswith(('PRIMARY KEY', 'UNIQUE', 'FOREIGN KEY')):
+                index_type = None
+                index_name = None
+                index_columns = None
+                
+                # 解析约束类型和名称
+                parts = definition.split(None, 2)
+                if len(parts) >= 2:
+                    if parts[0].upper() == 'PRIMARY':
+                        index_type = 'PRIMARY KEY'
+                        index_name = 'PRIMARY'
+                        if len(parts) > 2:
+                            index_columns = parts[2].strip('()')
+                        else:
+                            continue  # 没有列定义，跳过
+                    elif parts[0].upper() in ('UNIQUE', 'FOREIGN'):
+                        if parts[0].upper() == 'FOREIGN':
+                            index_type = 'FOREIGN KEY'
+                            index_name = f"fk_{len(indexes)}"
+                        else:
+                            index_type = parts[0].upper()
+                            index_name = f"unique_{len(indexes)}"
+                        if len(parts) > 2:
+                            index_columns = parts[2].strip('()')
+                        elif len(parts) == 2:
+                            index_columns = parts[1].strip('()')
+                        else:
+                            continue
+                    else:
+                        continue  # 未知的约束类型
+                            
+                    # 确保索引名称和列都不为空
+                    if index_name and index_columns and index_name.strip() and index_columns.strip():
+                        indexes[index_name] = {
+                            'type': index_type,
+                            'columns': index_columns
+                        }
+                continue
+                
+            # 处理列定义
+            parts = definition.split(None, 1)
+            if len(parts) >= 2:
+                col_name = parts[0].strip('"')
+                col_definition = parts[1].strip()
+                # 存储原始定义和解析后的详细信息，标准化后的定义在首次使用时计算
+                columns[col_name] = ColumnDef(col_definition, self._parse_column_definition(col_definition))
 
 class SQLServerParser(BaseSQLParser):
     """SQL Server SQL解析器"""
     
-    def _parse_column_definition(self, definition):
-        """解析SQL Server列定义，返回详细信息"""
-        details = {
-            'Type': None,           # 数据类型
-            'Null': 'YES',          # YES/NO
-            'Default': None,        # 默认值
-            'Comment': None,        # 注释
-            'Extra': None,          # 额外信息
-            'Identity': None,       # 自增属性
-            'Length': None,         # 长度
-            'Precision': None,      # 精度
-            'Scale': None,          # 小数位数
-        }
-        
-        # 分割定义字符串
-        parts = definition.split()
-        if not parts:
-            return details
-            
-        # 解析类型（包括长度/精度）
-        type_parts = []
-        i = 0
-        while i < len(parts):
-            current = parts[i].upper()
-            # 如果遇到属性关键字，停止类型解析
-            if current in ('NOT', 'NULL', 'DEFAULT', 'COMMENT', 'IDENTITY'):
-                break
-            type_parts.append(parts[i])
-            i += 1
-        details['Type'] = ' '.join(type_parts)
-        
-        # 解析剩余属性
-        while i < len(parts):
-            current = parts[i].upper()
-            
-            # 处理 NULL/NOT NULL
-            if current == 'NOT' and i + 1 < len(parts) and parts[i + 1].upper() == 'NULL':
-                details['Null'] = 'NO'
-                i += 2
-            elif current == 'NULL':
-                details['Null'] = 'YES'
-                i += 1
-                
-            # 处理 DEFAULT
-            elif current == 'DEFAULT':
-                if i + 1 < len(parts):
-                    default_value = parts[i + 1]
-                    # 处理带引号的默认值
-                    if default_value.startswith("'") and default_value.endswith("'"):
-                        default_value = default_value[1:-1]
-                    # 处理特殊默认值
-                    elif default_value.upper() in ('CURRENT_TIMESTAMP', 'NULL'):
-                        default_value = default_value
-                    details['Default'] = default_value
-                i += 2
-                
-            # 处理 IDENTITY
-            elif current == 'IDENTITY':
-                details['Identity'] = True
-                i += 1
-                
-            # 处理 COMMENT
-            elif current == 'COMMENT':
-                if i + 1 < len(parts):
-                    comment = parts[i + 1]
-                    if comment.startswith("'") and comment.endswith("'"):
-                        comment = comment[1:-1]
-                    details['Comment'] = comment
-                i += 2
-            else:
-                i += 1
-                
-        return details
-        
+    identifier_quotes = '[]'
+    column_parser = SQLSERVER_COLUMNS
+    
     def _parse_statements(self, statements):
         """解析SQL语句列表，返回表结构字典"""
         tables = {}
@@ -896,65 +563,8 @@ class SQLServerParser(BaseSQLParser):
                 if isinstance(item, Parenthesis):
                     # 获取括号内的内容
                     content = item.value.strip('()')
-                    # 使用智能分割方法分割每个定义
-                    defs = smart_split_sql_definitions(content)
+                    self._parse_definitions(content, columns, indexes)
                     
-                    for definition in defs:
-                        if not definition:
-                            continue
-                            
-                        # 处理约束定义
-                        if definition.upper().startswith(('PRIMARY KEY', 'UNIQUE', 'FOREIGN KEY')):
-                            index_type = None
-                            index_name = None
-                            index_columns = None
-                            
-                            # 解析约束类型和名称
-                            parts = definition.split(None, 2)
-                            if len(parts) >= 2:
-                                if parts[0].upper() == 'PRIMARY':
-                                    index_type = 'PRIMARY KEY'
-                                    index_name = 'PRIMARY'
-                                    if len(parts) > 2:
-                                        index_columns = parts[2].strip('()')
-                                    else:
-                                        continue  # 没有列定义，跳过
-                                elif parts[0].upper() in ('UNIQUE', 'FOREIGN'):
-                                    if parts[0].upper() == 'FOREIGN':
-                                        index_type = 'FOREIGN KEY'
-                                        index_name = f"fk_{len(indexes)}"
-                                    else:
-                                        index_type = parts[0].upper()
-                                        index_name = f"unique_{len(indexes)}"
-                                    if len(parts) > 2:
-                                        index_columns = parts[2].strip('()')
-                                    elif len(parts) == 2:
-                                        index_columns = parts[1].strip('()')
-                                    else:
-                                        continue
-                                else:
-                                    continue  # 未知的约束类型
-                                        
-                                # 确保索引名称和列都不为空
-                                if index_name and index_columns and index_name.strip() and index_columns.strip():
-                                    indexes[index_name] = {
-                                        'type': index_type,
-                                        'columns': index_columns
-                                    }
-                            continue
-                            
-                        # 处理列定义
-                        parts = definition.split(None, 1)
-                        if len(parts) >= 2:
-                            col_name = parts[0].strip('[]')
-                            col_definition = parts[1].strip()
-                            # 存储原始定义和标准化后的定义
-                            columns[col_name] = {
-                                'raw': col_definition,
-                                'normalized': normalize_sql_definition(col_definition),
-                                'details': self._parse_column_definition(col_definition)
-                            }
-                            
             if table_name:
                 tables[table_name] = {
                     'columns': columns,
@@ -964,86 +574,68 @@ class SQLServerParser(BaseSQLParser):
                 
         return tables
         
-    def compare_tables(self, left_tables, right_tables):
-        """比较两个表结构的差异（与MySQL相同）"""
-        # 使用与MySQL相同的比较逻辑
-        mysql_parser = MySQLParser(ignore_case=self.ignore_case)
-        return mysql_parser.compare_tables(left_tables, right_tables)
+    def _parse_definitions(self, content, columns, indexes):
+        """解析括号内的列定义和索引，结果写入 columns 和 indexes"""
+        # 使用智能分割方法分割每个定义
+        defs = smart_split_sql_definitions(content, backslash_escapes=self.backslash_escapes)
+        
+        for definition in defs:
+            if not definition:
+                continue
+                
+            # 处理约束定义
+            if definition.upper().startswith(('PRIMARY KEY', 'UNIQUE', 'FOREIGN KEY')):
+                index_type = None
+                index_name = None
+                index_columns = None
+                
+                # 解析约束类型和名称
+                parts = definition.split(None, 2)
+                if len(parts) >= 2:
+                    if parts[0].upper() == 'PRIMARY':
+                        index_type = 'PRIMARY KEY'
+                        index_name = 'PRIMARY'
+                        if len(parts) > 2:
+                            index_columns = parts[2].strip('()')
+                        else:
+                            continue  # 没有列定义，跳过
+                    elif parts[0].upper() in ('UNIQUE', 'FOREIGN'):
+                        if parts[0].upper() == 'FOREIGN':
+                            index_type = 'FOREIGN KEY'
+                            index_name = f"fk_{len(indexes)}"
+                        else:
+                            index_type = parts[0].upper()
+                            index_name = f"unique_{len(indexes)}"
+                        if len(parts) > 2:
+                            index_columns = parts[2].strip('()')
+                        elif len(parts) == 2:
+                            index_columns = parts[1].strip('()')
+                        else:
+                            continue
+                    else:
+                        continue  # 未知的约束类型
+                            
+                    # 确保索引名称和列都不为空
+                    if index_name and index_columns and index_name.strip() and index_columns.strip():
+                        indexes[index_name] = {
+                            'type': index_type,
+                            'columns': index_columns
+                        }
+                continue
+                
+            # 处理列定义
+            parts = definition.split(None, 1)
+            if len(parts) >= 2:
+                col_name = parts[0].strip('[]')
+                col_definition = parts[1].strip()
+                # 存储原始定义和解析后的详细信息，标准化后的定义在首次使用时计算
+                columns[col_name] = ColumnDef(col_definition, self._parse_column_definition(col_definition))
 
 class SQLiteParser(BaseSQLParser):
     """SQLite SQL解析器"""
     
-    def _parse_column_definition(self, definition):
-        """解析SQLite列定义，返回详细信息"""
-        details = {
-            'Type': None,           # 数据类型
-            'Null': 'YES',          # YES/NO
-            'Default': None,        # 默认值
-            'Comment': None,        # 注释
-            'Extra': None,          # 额外信息
-            'PrimaryKey': False,    # 主键
-        }
-        
-        # 分割定义字符串
-        parts = definition.split()
-        if not parts:
-            return details
-            
-        # 解析类型（包括长度/精度）
-        type_parts = []
-        i = 0
-        while i < len(parts):
-            current = parts[i].upper()
-            # 如果遇到属性关键字，停止类型解析
-            if current in ('NOT', 'NULL', 'DEFAULT', 'COMMENT', 'PRIMARY', 'KEY'):
-                break
-            type_parts.append(parts[i])
-            i += 1
-        details['Type'] = ' '.join(type_parts)
-        
-        # 解析剩余属性
-        while i < len(parts):
-            current = parts[i].upper()
-            
-            # 处理 NULL/NOT NULL
-            if current == 'NOT' and i + 1 < len(parts) and parts[i + 1].upper() == 'NULL':
-                details['Null'] = 'NO'
-                i += 2
-            elif current == 'NULL':
-                details['Null'] = 'YES'
-                i += 1
-                
-            # 处理 DEFAULT
-            elif current == 'DEFAULT':
-                if i + 1 < len(parts):
-                    default_value = parts[i + 1]
-                    # 处理带引号的默认值
-                    if default_value.startswith("'") and default_value.endswith("'"):
-                        default_value = default_value[1:-1]
-                    # 处理特殊默认值
-                    elif default_value.upper() in ('CURRENT_TIMESTAMP', 'NULL'):
-                        default_value = default_value
-                    details['Default'] = default_value
-                i += 2
-                
-            # 处理 PRIMARY KEY
-            elif current == 'PRIMARY' and i + 1 < len(parts) and parts[i + 1].upper() == 'KEY':
-                details['PrimaryKey'] = True
-                i += 2
-                
-            # 处理 COMMENT
-            elif current == 'COMMENT':
-                if i + 1 < len(parts):
-                    comment = parts[i + 1]
-                    if comment.startswith("'") and comment.endswith("'"):
-                        comment = comment[1:-1]
-                    details['Comment'] = comment
-                i += 2
-            else:
-                i += 1
-                
-        return details
-        
+    column_parser = SQLITE_COLUMNS
+    
     def _parse_statements(self, statements):
         """解析SQL语句列表，返回表结构字典"""
         tables = {}
@@ -1070,65 +662,8 @@ class SQLiteParser(BaseSQLParser):
                 if isinstance(item, Parenthesis):
                     # 获取括号内的内容
                     content = item.value.strip('()')
-                    # 使用智能分割方法分割每个定义
-                    defs = smart_split_sql_definitions(content)
+                    self._parse_definitions(content, columns, indexes)
                     
-                    for definition in defs:
-                        if not definition:
-                            continue
-                            
-                        # 处理约束定义
-                        if definition.upper().startswith(('PRIMARY KEY', 'UNIQUE', 'FOREIGN KEY')):
-                            index_type = None
-                            index_name = None
-                            index_columns = None
-                            
-                            # 解析约束类型和名称
-                            parts = definition.split(None, 2)
-                            if len(parts) >= 2:
-                                if parts[0].upper() == 'PRIMARY':
-                                    index_type = 'PRIMARY KEY'
-                                    index_name = 'PRIMARY'
-                                    if len(parts) > 2:
-                                        index_columns = parts[2].strip('()')
-                                    else:
-                                        continue  # 没有列定义，跳过
-                                elif parts[0].upper() in ('UNIQUE', 'FOREIGN'):
-                                    if parts[0].upper() == 'FOREIGN':
-                                        index_type = 'FOREIGN KEY'
-                                        index_name = f"fk_{len(indexes)}"
-                                    else:
-                                        index_type = parts[0].upper()
-                                        index_name = f"unique_{len(indexes)}"
-                                    if len(parts) > 2:
-                                        index_columns = parts[2].strip('()')
-                                    elif len(parts) == 2:
-                                        index_columns = parts[1].strip('()')
-                                    else:
-                                        continue
-                                else:
-                                    continue  # 未知的约束类型
-                                        
-                                # 确保索引名称和列都不为空
-                                if index_name and index_columns and index_name.strip() and index_columns.strip():
-                                    indexes[index_name] = {
-                                        'type': index_type,
-                                        'columns': index_columns
-                                    }
-                            continue
-                            
-                        # 处理列定义
-                        parts = definition.split(None, 1)
-                        if len(parts) >= 2:
-                            col_name = parts[0].strip('"')
-                            col_definition = parts[1].strip()
-                            # 存储原始定义和标准化后的定义
-                            columns[col_name] = {
-                                'raw': col_definition,
-                                'normalized': normalize_sql_definition(col_definition),
-                                'details': self._parse_column_definition(col_definition)
-                            }
-                            
             if table_name:
                 tables[table_name] = {
                     'columns': columns,
@@ -1138,81 +673,68 @@ class SQLiteParser(BaseSQLParser):
                 
         return tables
         
-    def compare_tables(self, left_tables, right_tables):
-        """比较两个表结构的差异（与MySQL相同）"""
-        # 使用与MySQL相同的比较逻辑
-        mysql_parser = MySQLParser(ignore_case=self.ignore_case)
-        return mysql_parser.compare_tables(left_tables, right_tables)
+    def _parse_definitions(self, content, columns, indexes):
+        """解析括号内的列定义和索引，结果写入 columns 和 indexes"""
+        # 使用智能分割方法分割每个定义
+        defs = smart_split_sql_definitions(content, backslash_escapes=self.backslash_escapes)
+        
+        for definition in defs:
+            if not definition:
+                continue
+                
+            # 处理约束定义
+            if definition.upper().startswith(('PRIMARY KEY', 'UNIQUE', 'FOREIGN KEY')):
+                index_type = None
+                index_name = None
+                index_columns = None
+                
+                # 解析约束类型和名称
+                parts = definition.split(None, 2)
+                if len(parts) >= 2:
+                    if parts[0].upper() == 'PRIMARY':
+                        index_type = 'PRIMARY KEY'
+                        index_name = 'PRIMARY'
+                        if len(parts) > 2:
+                            index_columns = parts[2].strip('()')
+                        else:
+                            continue  # 没有列定义，跳过
+                    elif parts[0].upper() in ('UNIQUE', 'FOREIGN'):
+                        if parts[0].upper() == 'FOREIGN':
+                            index_type = 'FOREIGN KEY'
+                            index_name = f"fk_{len(indexes)}"
+                        else:
+                            index_type = parts[0].upper()
+                            index_name = f"unique_{len(indexes)}"
+                        if len(parts) > 2:
+                            index_columns = parts[2].strip('()')
+                        elif len(parts) == 2:
+                            index_columns = parts[1].strip('()')
+                        else:
+                            continue
+                    else:
+                        continue  # 未知的约束类型
+                            
+                    # 确保索引名称和列都不为空
+                    if index_name and index_columns and index_name.strip() and index_columns.strip():
+                        indexes[index_name] = {
+                            'type': index_type,
+                            'columns': index_columns
+                        }
+                continue
+                
+            # 处理列定义
+            parts = definition.split(None, 1)
+            if len(parts) >= 2:
+                col_name = parts[0].strip('"')
+                col_definition = parts[1].strip()
+                # 存储原始定义和解析后的详细信息，标准化后的定义在首次使用时计算
+                columns[col_name] = ColumnDef(col_definition, self._parse_column_definition(col_definition))
 
 class MongoDBSQLParser(BaseSQLParser):
     """MongoDB SQL解析器"""
     
-    def _parse_column_definition(self, definition):
-        """解析MongoDB列定义，返回详细信息"""
-        details = {
-            'Type': None,           # 数据类型
-            'Null': 'YES',          # YES/NO
-            'Default': None,        # 默认值
-            'Comment': None,        # 注释
-            'Extra': None,          # 额外信息
-            'MongoDBType': None,    # MongoDB原始类型
-        }
-        
-        # 分割定义字符串
-        parts = definition.split()
-        if not parts:
-            return details
-            
-        # 解析类型（包括长度/精度）
-        type_parts = []
-        i = 0
-        while i < len(parts):
-            current = parts[i].upper()
-            # 如果遇到属性关键字，停止类型解析
-            if current in ('NOT', 'NULL', 'DEFAULT', 'COMMENT'):
-                break
-            type_parts.append(parts[i])
-            i += 1
-        details['Type'] = ' '.join(type_parts)
-        
-        # 解析剩余属性
-        while i < len(parts):
-            current = parts[i].upper()
-            
-            # 处理 NULL/NOT NULL
-            if current == 'NOT' and i + 1 < len(parts) and parts[i + 1].upper() == 'NULL':
-                details['Null'] = 'NO'
-                i += 2
-            elif current == 'NULL':
-                details['Null'] = 'YES'
-                i += 1
-                
-            # 处理 DEFAULT
-            elif current == 'DEFAULT':
-                if i + 1 < len(parts):
-                    default_value = parts[i + 1]
-                    # 处理带引号的默认值
-                    if default_value.startswith("'") and default_value.endswith("'"):
-                        default_value = default_value[1:-1]
-                    # 处理特殊默认值
-                    elif default_value.upper() in ('CURRENT_TIMESTAMP', 'NULL'):
-                        default_value = default_value
-                    details['Default'] = default_value
-                i += 2
-                
-            # 处理 COMMENT
-            elif current == 'COMMENT':
-                if i + 1 < len(parts):
-                    comment = parts[i + 1]
-                    if comment.startswith("'") and comment.endswith("'"):
-                        comment = comment[1:-1]
-                    details['Comment'] = comment
-                i += 2
-            else:
-                i += 1
-                
-        return details
-        
+    column_parser = MONGODB_COLUMNS
+    
     def _parse_statements(self, statements):
         """解析SQL语句列表，返回表结构字典"""
         tables = {}
@@ -1239,65 +761,8 @@ class MongoDBSQLParser(BaseSQLParser):
                 if isinstance(item, Parenthesis):
                     # 获取括号内的内容
                     content = item.value.strip('()')
-                    # 使用智能分割方法分割每个定义
-                    defs = smart_split_sql_definitions(content)
+                    self._parse_definitions(content, columns, indexes)
                     
-                    for definition in defs:
-                        if not definition:
-                            continue
-                            
-                        # 处理约束定义
-                        if definition.upper().startswith(('PRIMARY KEY', 'UNIQUE', 'FOREIGN KEY')):
-                            index_type = None
-                            index_name = None
-                            index_columns = None
-                            
-                            # 解析约束类型和名称
-                            parts = definition.split(None, 2)
-                            if len(parts) >= 2:
-                                if parts[0].upper() == 'PRIMARY':
-                                    index_type = 'PRIMARY KEY'
-                                    index_name = 'PRIMARY'
-                                    if len(parts) > 2:
-                                        index_columns = parts[2].strip('()')
-                                    else:
-                                        continue  # 没有列定义，跳过
-                                elif parts[0].upper() in ('UNIQUE', 'FOREIGN'):
-                                    if parts[0].upper() == 'FOREIGN':
-                                        index_type = 'FOREIGN KEY'
-                                        index_name = f"fk_{len(indexes)}"
-                                    else:
-                                        index_type = parts[0].upper()
-                                        index_name = f"unique_{len(indexes)}"
-                                    if len(parts) > 2:
-                                        index_columns = parts[2].strip('()')
-                                    elif len(parts) == 2:
-                                        index_columns = parts[1].strip('()')
-                                    else:
-                                        continue
-                                else:
-                                    continue  # 未知的约束类型
-                                        
-                                # 确保索引名称和列都不为空
-                                if index_name and index_columns and index_name.strip() and index_columns.strip():
-                                    indexes[index_name] = {
-                                        'type': index_type,
-                                        'columns': index_columns
-                                    }
-                            continue
-                            
-                        # 处理列定义
-                        parts = definition.split(None, 1)
-                        if len(parts) >= 2:
-                            col_name = parts[0].strip('"')
-                            col_definition = parts[1].strip()
-                            # 存储原始定义和标准化后的定义
-                            columns[col_name] = {
-                                'raw': col_definition,
-                                'normalized': normalize_sql_definition(col_definition),
-                                'details': self._parse_column_definition(col_definition)
-                            }
-                            
             if table_name:
                 tables[table_name] = {
                     'columns': columns,
@@ -1307,83 +772,68 @@ class MongoDBSQLParser(BaseSQLParser):
                 
         return tables
         
-    def compare_tables(self, left_tables, right_tables):
-        """比较两个表结构的差异（与MySQL相同）"""
-        # 使用与MySQL相同的比较逻辑
-        mysql_parser = MySQLParser(ignore_case=self.ignore_case)
-        return mysql_parser.compare_tables(left_tables, right_tables)
+    def _parse_definitions(self, content, columns, indexes):
+        """解析括号内的列定义和索引，结果写入 columns 和 indexes"""
+        # 使用智能分割方法分割每个定义
+        defs = smart_split_sql_definitions(content, backslash_escapes=self.backslash_escapes)
+        
+        for definition in defs:
+            if not definition:
+                continue
+                
+            # 处理约束定义
+            if definition.upper().startswith(('PRIMARY KEY', 'UNIQUE', 'FOREIGN KEY')):
+                index_type = None
+                index_name = None
+                index_columns = None
+                
+                # 解析约束类型和名称
+                parts = definition.split(None, 2)
+                if len(parts) >= 2:
+                    if parts[0].upper() == 'PRIMARY':
+                        index_type = 'PRIMARY KEY'
+                        index_name = 'PRIMARY'
+                        if len(parts) > 2:
+                            index_columns = parts[2].strip('()')
+                        else:
+                            continue  # 没有列定义，跳过
+                    elif parts[0].upper() in ('UNIQUE', 'FOREIGN'):
+                        if parts[0].upper() == 'FOREIGN':
+                            index_type = 'FOREIGN KEY'
+                            index_name = f"fk_{len(indexes)}"
+                        else:
+                            index_type = parts[0].upper()
+                            index_name = f"unique_{len(indexes)}"
+                        if len(parts) > 2:
+                            index_columns = parts[2].strip('()')
+                        elif len(parts) == 2:
+                            index_columns = parts[1].strip('()')
+                        else:
+                            continue
+                    else:
+                        continue  # 未知的约束类型
+                            
+                    # 确保索引名称和列都不为空
+                    if index_name and index_columns and index_name.strip() and index_columns.strip():
+                        indexes[index_name] = {
+                            'type': index_type,
+                            'columns': index_columns
+                        }
+                continue
+                
+            # 处理列定义
+            parts = definition.split(None, 1)
+            if len(parts) >= 2:
+                col_name = parts[0].strip('"')
+                col_definition = parts[1].strip()
+                # 存储原始定义和解析后的详细信息，标准化后的定义在首次使用时计算
+                columns[col_name] = ColumnDef(col_definition, self._parse_column_definition(col_definition))
 
 class Db2SQLParser(BaseSQLParser):
     """IBM Db2 SQL解析器"""
     
-    def _parse_column_definition(self, definition):
-        """解析Db2列定义，返回详细信息"""
-        details = {
-            'Type': None,           # 数据类型
-            'Null': 'YES',          # YES/NO
-            'Default': None,        # 默认值
-            'Comment': None,        # 注释
-            'Extra': None,          # 额外信息
-            'Length': None,         # 长度
-            'Precision': None,      # 精度
-            'Scale': None,          # 小数位数
-        }
-        
-        # 分割定义字符串
-        parts = definition.split()
-        if not parts:
-            return details
-            
-        # 解析类型（包括长度/精度）
-        type_parts = []
-        i = 0
-        while i < len(parts):
-            current = parts[i].upper()
-            # 如果遇到属性关键字，停止类型解析
-            if current in ('NOT', 'NULL', 'DEFAULT', 'COMMENT'):
-                break
-            type_parts.append(parts[i])
-            i += 1
-        details['Type'] = ' '.join(type_parts)
-        
-        # 解析剩余属性
-        while i < len(parts):
-            current = parts[i].upper()
-            
-            # 处理 NULL/NOT NULL
-            if current == 'NOT' and i + 1 < len(parts) and parts[i + 1].upper() == 'NULL':
-                details['Null'] = 'NO'
-                i += 2
-            elif current == 'NULL':
-                details['Null'] = 'YES'
-                i += 1
-                
-            # 处理 DEFAULT
-            elif current == 'DEFAULT':
-                if i + 1 < len(parts):
-                    default_value = parts[i + 1]
-                    # 处理带引号的默认值
-                    if default_value.startswith("'") and default_value.endswith("'"):
-                        default_value = default_value[1:-1]
-                    # 处理特殊默认值
-                    elif default_value.upper() in ('CURRENT_TIMESTAMP', 'NULL'):
-                        default_value = default_value
-                    details['Default'] = default_value
-                i += 2
-                
-            # 处理 COMMENT
-            elif current == 'COMMENT':
-                if i + 1 < len(parts):
-                    comment = parts[i + 1]
-                    if comment.startswith("'") and comment.endswith("'"):
-                        comment = comment[1:-1]
-                    details['Comment'] = comment
-                i += 2
-            else:
-                i += 1
-                
-        return details
-        
+    column_parser = DB2_COLUMNS
+    
     def _parse_statements(self, statements):
         """解析SQL语句列表，返回表结构字典"""
         tables = {}
@@ -1410,65 +860,8 @@ class Db2SQLParser(BaseSQLParser):
                 if isinstance(item, Parenthesis):
                     # 获取括号内的内容
                     content = item.value.strip('()')
-                    # 使用智能分割方法分割每个定义
-                    defs = smart_split_sql_definitions(content)
+                    self._parse_definitions(content, columns, indexes)
                     
-                    for definition in defs:
-                        if not definition:
-                            continue
-                            
-                        # 处理约束定义
-                        if definition.upper().startswith(('PRIMARY KEY', 'UNIQUE', 'FOREIGN KEY')):
-                            index_type = None
-                            index_name = None
-                            index_columns = None
-                            
-                            # 解析约束类型和名称
-                            parts = definition.split(None, 2)
-                            if len(parts) >= 2:
-                                if parts[0].upper() == 'PRIMARY':
-                                    index_type = 'PRIMARY KEY'
-                                    index_name = 'PRIMARY'
-                                    if len(parts) > 2:
-                                        index_columns = parts[2].strip('()')
-                                    else:
-                                        continue  # 没有列定义，跳过
-                                elif parts[0].upper() in ('UNIQUE', 'FOREIGN'):
-                                    if parts[0].upper() == 'FOREIGN':
-                                        index_type = 'FOREIGN KEY'
-                                        index_name = f"fk_{len(indexes)}"
-                                    else:
-                                        index_type = parts[0].upper()
-                                        index_name = f"unique_{len(indexes)}"
-                                    if len(parts) > 2:
-                                        index_columns = parts[2].strip('()')
-                                    elif len(parts) == 2:
-                                        index_columns = parts[1].strip('()')
-                                    else:
-                                        continue
-                                else:
-                                    continue  # 未知的约束类型
-                                        
-                                # 确保索引名称和列都不为空
-                                if index_name and index_columns and index_name.strip() and index_columns.strip():
-                                    indexes[index_name] = {
-                                        'type': index_type,
-                                        'columns': index_columns
-                                    }
-                            continue
-                            
-                        # 处理列定义
-                        parts = definition.split(None, 1)
-                        if len(parts) >= 2:
-                            col_name = parts[0].strip('"')
-                            col_definition = parts[1].strip()
-                            # 存储原始定义和标准化后的定义
-                            columns[col_name] = {
-                                'raw': col_definition,
-                                'normalized': normalize_sql_definition(col_definition),
-                                'details': self._parse_column_definition(col_definition)
-                            }
-                            
             if table_name:
                 tables[table_name] = {
                     'columns': columns,
@@ -1478,17 +871,73 @@ class Db2SQLParser(BaseSQLParser):
                 
         return tables
         
-    def compare_tables(self, left_tables, right_tables):
-        """比较两个表结构的差异（与MySQL相同）"""
-        # 使用与MySQL相同的比较逻辑
-        mysql_parser = MySQLParser(ignore_case=self.ignore_case)
-        return mysql_parser.compare_tables(left_tables, right_tables)
+    def _parse_definitions(self, content, columns, indexes):
+        """解析括号内的列定义和索引，结果写入 columns 和 indexes"""
+        # 使用智能分割方法分割每个定义
+        defs = smart_split_sql_definitions(content, backslash_escapes=self.backslash_escapes)
+        
+        for definition in defs:
+            if not definition:
+                continue
+                
+            # 处理约束定义
+            if definition.upper().startswith(('PRIMARY KEY', 'UNIQUE', 'FOREIGN KEY')):
+                index_type = None
+                index_name = None
+                index_columns = None
+                
+                # 解析约束类型和名称
+                parts = definition.split(None, 2)
+                if len(parts) >= 2:
+                    if parts[0].upper() == 'PRIMARY':
+                        index_type = 'PRIMARY KEY'
+                        index_name = 'PRIMARY'
+                        if len(parts) > 2:
+                            index_columns = parts[2].strip('()')
+                        else:
+                            continue  # 没有列定义，跳过
+                    elif parts[0].upper() in ('UNIQUE', 'FOREIGN'):
+                        if parts[0].upper() == 'FOREIGN':
+                            index_type = 'FOREIGN KEY'
+                            index_name = f"fk_{len(indexes)}"
+                        else:
+                            index_type = parts[0].upper()
+                            index_name = f"unique_{len(indexes)}"
+                        if len(parts) > 2:
+                            index_columns = parts[2].strip('()')
+                        elif len(parts) == 2:
+                            index_columns = parts[1].strip('()')
+                        else:
+                            continue
+                    else:
+                        continue  # 未知的约束类型
+                            
+                    # 确保索引名称和列都不为空
+                    if index_name and index_columns and index_name.strip() and index_columns.strip():
+                        indexes[index_name] = {
+                            'type': index_type,
+                            'columns': index_columns
+                        }
+                continue
+                
+            # 处理列定义
+            parts = definition.split(None, 1)
+            if len(parts) >= 2:
+                col_name = parts[0].strip('"')
+                col_definition = parts[1].strip()
+                # 存储原始定义和解析后的详细信息，标准化后的定义在首次使用时计算
+                columns[col_name] = ColumnDef(col_definition, self._parse_column_definition(col_definition))
 
 class SQLParser:
     """SQL解析器工厂类"""
     
-    def __init__(self, ignore_case=True, db_type="mysql"):
+    # 解析结果格式版本，解析逻辑或结果结构变化时递增，使旧的解析缓存失效
+    PARSE_CACHE_VERSION = 4
+    
+    def __init__(self, ignore_case=True, db_type="mysql", parse_cache=None):
         self.db_type = db_type.lower()
+        # 可选的解析结果缓存（ParseCache），未变化的文件直接使用上次的解析结果
+        self.parse_cache = parse_cache
         self.parsers = {
             'mysql': MySQLParser(ignore_case),
             'postgresql': PostgreSQLParser(ignore_case),
@@ -1508,13 +957,40 @@ class SQLParser:
         """解析SQL字符串，返回表结构字典"""
         return self.parser.parse_sql(sql_content)
         
-    def parse_file(self, file_path):
-        """解析SQL文件，返回表结构字典"""
-        return self.parser.parse_file(file_path)
+    def parse_file(self, file_path, workers=None):
+        """解析SQL文件，返回表结构字典，workers 为解析进程数（None 表示按文件大小自动选择）"""
+        if self.parse_cache is None:
+            return self.parser.parse_file(file_path, workers)
+            
+        ignore_case = self.parser.ignore_case
+        dialect = f"{self.db_type}:{self.PARSE_CACHE_VERSION}"
+        try:
+            tables, file_state = self.parse_cache.load(file_path, dialect, ignore_case)
+            if tables is not None:
+                return tables
+        except Exception as e:
+            print(f"读取解析缓存失败: {str(e)}")
+            return self.parser.parse_file(file_path, workers)
+            
+        tables = self.parser.parse_file(file_path, workers)
+        if tables:
+            try:
+                self.parse_cache.save(file_path, dialect, ignore_case, tables, file_state)
+            except Exception as e:
+                print(f"保存解析缓存失败: {str(e)}")
+        return tables
+        
+    def compare_tables(self, left_tables, right_tables, workers=None):
+        """比较两个表结构的差异，workers 为比较进程数（None 表示按表数量自动选择）"""
+        return self.parser.compare_tables(left_tables, right_tables, workers)
+        
+    def compare_table(self, left_table, right_table):
+        """比较同名的两个表，返回该表的差异"""
+        return self.parser.compare_table(left_table, right_table)
         
-    def compare_tables(self, left_tables, right_tables):
-        """比较两个表结构的差异"""
-        return self.parser.compare_tables(left_tables, right_tables)
+    def normalize_name(self, name):
+        """按当前大小写设置标准化表名"""
+        return self.parser._normalize_name(name)
         
     def set_db_type(self, db_type):
         """设置数据库类型"""
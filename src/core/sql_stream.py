@@ -0,0 +1,329 @@
+import codecs
+import gzip
+import lzma
+import mmap
+import os
+import re
+from contextlib import contextmanager
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Optional
+
+# 每次从文件读取的字节数
+DEFAULT_CHUNK_SIZE = 1 << 20
+# 检测编码时读取的文件开头字节数
+ENCODING_SAMPLE_SIZE = 64 << 10
+# 判断语句类型时最多收集的语句开头长度
+STATEMENT_HEAD_SIZE = 256
+
+_WHITESPACE_RE = re.compile(r'\s*')
+_CREATE_TABLE_RE = re.compile(
+    r'\s*CREATE\s+(?:(?:OR\s+REPLACE|GLOBAL|LOCAL|TEMPORARY|TEMP|UNLOGGED)\s+)*TABLE\b',
+    re.IGNORECASE
+)
+
+def is_create_table(head: str) -> bool:
+    """根据语句开头判断是否为 CREATE TABLE 语句"""
+    return _CREATE_TABLE_RE.match(head) is not None
+
+class SQLStatementSplitter:
+    """增量SQL语句切分器
+    
+    通过 feed 逐块输入文本，按分隔符切分出完整语句，正确跳过字符串、反引号标识符
+    和注释中的分隔符，并支持 mysqldump 中的 DELIMITER 命令。
+    keep 用于根据语句开头决定是否保留该语句，不保留的语句只做引号和注释状态跟踪，
+    不会缓存其内容，因此内存占用只与需要保留的最大单条语句有关。
+    """
+    
+    def __init__(self, keep: Optional[Callable[[str], bool]] = None,
+                 hash_comments: bool = True, backslash_escapes: bool = True):
+        self.keep = keep
+        # 是否把 # 视为行注释（MySQL）
+        self.hash_comments = hash_comments
+        # 字符串中的反斜杠是否为转义字符（MySQL）
+        self.backslash_escapes = backslash_escapes
+        
+        if backslash_escapes:
+            self._quote_body = {
+                "'": re.compile(r"[^'\\]*(?:\\.[^'\\]*)*", re.DOTALL),
+                '"': re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL),
+            }
+        else:
+            self._quote_body = {
+                "'": re.compile(r"[^']*"),
+                '"': re.compile(r'[^"]*'),
+            }
+        self._quote_body['`'] = re.compile(r'[^`]*')
+        
+        self._buffer = ''
+        self._set_delimiter(';')
+        # 当前状态：None 为普通文本，引号字符表示在字符串中，'--' 为行注释，'/*' 为块注释
+        self._mode = None
+        self._reset_statement()
+        
+    def _set_delimiter(self, delimiter: str) -> None:
+        """设置语句分隔符并编译对应的特殊符号正则"""
+        self.delimiter = delimiter
+        specials = [re.escape(delimiter), "['\"`]", '--', r'/\*']
+        if self.hash_comments:
+            specials.append('#')
+        self._special_re = re.compile('|'.join(specials))
+        # 块末尾可能是跨块符号（分隔符、--、/*）的前缀，需要留到下一块再处理
+        self._lookahead = max(len(delimiter), 2) - 1
+        
+        # 一次匹配连续的普通文本和完整的字符串，INSERT 等长语句不必逐个引号处理
+        if delimiter[0] in '\'"`-/#':
+            self._run_re = None
+        else:
+            excluded = "'\"`\\-/" + ('#' if self.hash_comments else '') + re.escape(delimiter[0])
+            quoted = [r'`[^`]*`']
+            for quote in ("'", '"'):
+                quoted.append(quote + self._quote_body[quote].pattern + quote)
+            self._run_re = re.compile(
+                r'(?:[^{}]+|{}|-(?!-|\Z)|/(?!\*|\Z))*'.format(excluded, '|'.join(quoted)),
+                re.DOTALL
+            )
+        
+    def _reset_statement(self) -> None:
+        """开始新的语句"""
+        self._started = False
+        self._parts = []
+        self._head = []
+        self._head_size = 0
+        self._keep = None if self.keep is not None else True
+        
+    def _append(self, buffer: str, start: int, end: int) -> None:
+        """把当前语句的一段文本加入缓存（未开始或不保留的语句直接丢弃）"""
+        if start >= end or not self._started or self._keep is False:
+            return
+        text = buffer[start:end]
+        self._parts.append(text)
+        if self._keep is None:
+            self._head.append(text)
+            self._head_size += len(text)
+            if self._head_size >= STATEMENT_HEAD_SIZE:
+                self._decide()
+                
+    def _decide(self) -> None:
+        """根据已收集的语句开头决定是否保留该语句"""
+        self._keep = bool(self.keep(''.join(self._head)))
+        self._head = []
+        if not self._keep:
+            self._parts = []
+            
+    def _end_statement(self, statements: List[str]) -> None:
+        """当前语句结束"""
+        if self._started:
+            if self._keep is None:
+                self._decide()
+            if self._keep:
+                statement = ''.join(self._parts).strip()
+                if statement:
+                    statements.append(statement + ';')
+        self._reset_statement()
+        
+    def feed(self, text: str, final: bool = False) -> List[str]:
+        """输入一段文本，返回其中已完整的语句；final 为 True 表示输入已结束"""
+        buffer = self._buffer + text if self._buffer else text
+        statements = []
+        pos = 0
+        length = len(buffer)
+        
+        while pos < length:
+            mode = self._mode
+            
+            if mode is None and not self._started:
+                # 跳过语句之间的空白和注释
+                pos = _WHITESPACE_RE.match(buffer, pos).end()
+                if pos >= length:
+                    break
+                char = buffer[pos]
+                if char in '-/' and pos + 1 >= length and not final:
+                    break
+                if buffer.startswith('--', pos) or (char == '#' and self.hash_comments):
+                    self._mode = '--'
+                    continue
+                if buffer.startswith('/*', pos):
+                    self._mode = '/*'
+                    pos += 2
+                    continue
+                if char in 'dD':
+                    # DELIMITER 命令独占一行
+                    if length - pos < 10 and not final:
+                        break
+                    if buffer[pos:pos + 9].upper() == 'DELIMITER' and buffer[pos + 9:pos + 10].isspace():
+                        line_end = buffer.find('\n', pos)
+                        if line_end < 0:
+                            if not final:
+                                break
+                            line_end = length
+                        delimiter = buffer[pos + 10:line_end].strip()
+                        if delimiter:
+                            self._set_delimiter(delimiter)
+                        pos = line_end + 1
+                        continue
+                if buffer.startswith(self.delimiter, pos):
+                    # 空语句
+                    pos += len(self.delimiter)
+                    continue
+                if length - pos < len(self.delimiter) and self.delimiter.startswith(buffer[pos:]) and not final:
+                    break
+                self._started = True
+                continue
+                
+            if mode is None:
+                if self._run_re is not None:
+                    end = self._run_re.match(buffer, pos).end()
+                    self._append(buffer, pos, end)
+                    pos = end
+                match = self._special_re.search(buffer, pos)
+                if match is None:
+                    end = length if final else max(pos, length - self._lookahead)
+                    self._append(buffer, pos, end)
+                    pos = end
+                    break
+                    
+                token = match.group()
+                self._append(buffer, pos, match.start())
+                pos = match.end()
+                if token == self.delimiter:
+                    self._end_statement(statements)
+                    continue
+                self._append(buffer, match.start(), pos)
+                if token in self._quote_body:
+                    self._mode = token
+                elif token == '/*':
+                    self._mode = '/*'
+                else:
+                    self._mode = '--'
+                continue
+                
+            if mode == '--':
+                line_end = buffer.find('\n', pos)
+                if line_end < 0:
+                    self._append(buffer, pos, length)
+                    pos = length
+                    break
+                self._append(buffer, pos, line_end + 1)
+                pos = line_end + 1
+                self._mode = None
+                continue
+                
+            if mode == '/*':
+                comment_end = buffer.find('*/', pos)
+                if comment_end < 0:
+                    # 末尾的 * 可能是 */ 的前半部分
+                    end = length - 1 if buffer.endswith('*') and not final else length
+                    self._append(buffer, pos, end)
+                    pos = end
+                    break
+                self._append(buffer, pos, comment_end + 2)
+                pos = comment_end + 2
+                self._mode = None
+                continue
+                
+            # 字符串或反引号标识符
+            end = self._quote_body[mode].match(buffer, pos).end()
+            if end >= length:
+                self._append(buffer, pos, length)
+                pos = length
+                break
+            if buffer[end] == mode:
+                self._append(buffer, pos, end + 1)
+                pos = end + 1
+                self._mode = None
+                continue
+            # 块末尾是单独的反斜杠，和下一块一起处理
+            self._append(buffer, pos, end)
+            pos = end
+            if not final:
+                break
+            self._append(buffer, pos, length)
+            pos = length
+            
+        self._buffer = buffer[pos:]
+        if final:
+            self._buffer = ''
+            self._end_statement(statements)
+            self._mode = None
+        return statements
+        
+    def finish(self) -> List[str]:
+        """输入结束，返回剩余的最后一条语句（没有以分隔符结尾时）"""
+        return self.feed('', final=True)
+
+def iter_sql_statements(chunks: Iterable[str], keep: Optional[Callable[[str], bool]] = None,
+                        hash_comments: bool = True, backslash_escapes: bool = True) -> Iterator[str]:
+    """从逐块产生的文本中逐条产生SQL语句"""
+    splitter = SQLStatementSplitter(keep, hash_comments, backslash_escapes)
+    for chunk in chunks:
+        yield from splitter.feed(chunk)
+    yield from splitter.finish()
+    
+@contextmanager
+def open_sql_binary(file_path: str) -> Iterator[BinaryIO]:
+    """以二进制流打开SQL文件
+    
+    根据文件头识别 gzip / xz / zstd 压缩文件并流式解压，普通文件使用只读 mmap 映射，
+    返回的对象都支持 read(size)。zstd 需要安装可选依赖 zstandard。
+    """
+    with open(file_path, 'rb') as raw:
+        magic = raw.read(6)
+        raw.seek(0)
+        if magic.startswith(b'\x1f\x8b'):
+            stream = gzip.GzipFile(fileobj=raw)
+        elif magic.startswith(b'\xfd7zXZ\x00'):
+            stream = lzma.LZMAFile(raw)
+        elif magic.startswith(b'\x28\xb5\x2f\xfd'):
+            try:
+                import zstandard
+            except ImportError:
+                raise Exception("读取zstd压缩文件需要安装zstandard：pip install zstandard")
+            stream = zstandard.ZstdDecompressor().stream_reader(raw)
+        elif os.fstat(raw.fileno()).st_size == 0:
+            # 空文件无法映射
+            yield raw
+            return
+        else:
+            stream = mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield stream
+        finally:
+            stream.close()
+            
+def detect_encoding(sample: bytes) -> str:
+    """根据文件开头的样本检测编码：UTF-8（含BOM）、GBK，都不是时使用 Latin-1"""
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    for encoding in ('utf-8', 'gbk'):
+        try:
+            # 样本末尾可能截断了多字节字符，使用增量解码器忽略不完整的结尾
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return 'latin-1'
+    
+def detect_file_encoding(file_path: str) -> str:
+    """读取文件开头（压缩文件为解压后的开头）检测编码"""
+    with open_sql_binary(file_path) as stream:
+        return detect_encoding(stream.read(ENCODING_SAMPLE_SIZE))
+        
+def iter_text_chunks(stream: BinaryIO, encoding: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """从二进制流中按块读取并解码，换行符统一为 \\n（与文本模式打开文件一致）"""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending_cr = False
+    while True:
+        data = stream.read(chunk_size)
+        text = decoder.decode(data, final=not data)
+        if pending_cr:
+            text = '\r' + text
+            pending_cr = False
+        if data and text.endswith('\r'):
+            # \r\n 可能被块边界分开
+            text = text[:-1]
+            pending_cr = True
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        if text:
+            yield text
+        if not data:
+            break
@@ -2,10 +2,17 @@ import sqlite3
 import os
 import sys
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Dict, Any, Tuple
 import json
+import gc
+import hashlib
+import pickle
+import zlib
+from collections.abc import Mapping
 from datetime import datetime
 
+from src.core.schema_model import compact_columns
+
 @dataclass
 class Connection:
     id: Optional[int]
@@ -292,4 +299,248 @@ class ConnectionManager:
                     # 如果解析失败，跳过这条记录
                     continue
             
-            conn.commit() 
\ No newline at end of file
+            conn.commit()
+
+
+class SchemaCache:
+    """表结构快照缓存，与连接信息保存在同一个 SQLite 文件中
+    
+    每个表按 (连接键, 表名) 保存一份带 fingerprint 字段的结构，
+    读取的快照可直接作为 DBConnector.refresh 的上一次结果。
+    """
+    
+    # 不影响表结构结果的连接参数，不参与连接键计算
+    IGNORED_CONFIG_KEYS = {'password', 'max_workers', 'pool_size', 'pool_idle_timeout', 'schema_cache'}
+    
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._init_db()
+
+    def _init_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS schema_snapshots (
+                    conn_key TEXT NOT NULL,
+                    table_name TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    structure TEXT NOT NULL,
+                    updated_at TIMESTAMP NOT NULL,
+                    PRIMARY KEY (conn_key, table_name)
+                )
+            """)
+            conn.commit()
+
+    @classmethod
+    def make_key(cls, db_type: str, config: Dict[str, Any]) -> str:
+        """根据数据库类型和连接参数生成连接键"""
+        identity = {k: v for k, v in config.items() if k not in cls.IGNORED_CONFIG_KEYS}
+        return json.dumps([db_type.lower(), identity], sort_keys=True, default=str)
+
+    def load(self, conn_key: str) -> Dict[str, Dict[str, Any]]:
+        """读取连接的全部表结构快照"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT table_name, fingerprint, structure FROM schema_snapshots WHERE conn_key = ?",
+                (conn_key,)
+            )
+            tables = {}
+            for table_name, fingerprint, structure in cursor.fetchall():
+                tables[table_name] = json.loads(structure)
+                tables[table_name]['columns'] = compact_columns(tables[table_name].get('columns', {}))
+                tables[table_name]['fingerprint'] = fingerprint
+            return tables
+
+    def save(self, conn_key: str, tables: Dict[str, Dict[str, Any]], previous_tables: Dict[str, Dict[str, Any]] = None):
+        """保存指纹有变化的表结构，并删除已不存在的表
+        
+        没有 fingerprint 字段的表（连接器不支持指纹）不会被缓存。
+        """
+        previous_tables = previous_tables or {}
+        now = datetime.now().isoformat()
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT table_name FROM schema_snapshots WHERE conn_key = ?", (conn_key,))
+            removed = [row[0] for row in cursor.fetchall() if row[0] not in tables]
+            cursor.executemany(
+                "DELETE FROM schema_snapshots WHERE conn_key = ? AND table_name = ?",
+                [(conn_key, table_name) for table_name in removed]
+            )
+            rows = []
+            for table_name, structure in tables.items():
+                fingerprint = structure.get('fingerprint')
+                if fingerprint is None or previous_tables.get(table_name, {}).get('fingerprint') == fingerprint:
+                    continue
+                structure = {k: v for k, v in structure.items() if k not in ('fingerprint', 'digests')}
+                rows.append((conn_key, table_name, fingerprint, json.dumps(structure, default=self._json_default), now))
+            cursor.executemany("""
+                INSERT OR REPLACE INTO schema_snapshots (conn_key, table_name, fingerprint, structure, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
+            conn.commit()
+
+    @staticmethod
+    def _json_default(value):
+        """ColumnDef 等映射对象按 dict 保存，其他无法序列化的值转为字符串"""
+        if isinstance(value, Mapping):
+            return dict(value)
+        return str(value)
+
+    def clear(self, conn_key: str = None):
+        """清除指定连接（或全部）的快照"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            if conn_key is None:
+                cursor.execute("DELETE FROM schema_snapshots")
+            else:
+                cursor.execute("DELETE FROM schema_snapshots WHERE conn_key = ?", (conn_key,))
+            conn.commit()
+
+class ParseCache:
+    """SQL文件解析结果缓存，与连接信息保存在同一个 SQLite 文件中
+
+    按 (文件路径, 解析器类型, 是否忽略大小写) 保存一份解析结果，同时记录文件大小、
+    修改时间和内容哈希。大小和修改时间未变时直接命中；变化时计算内容哈希，
+    内容相同（如文件被 touch 或复制回原处）仍可命中。
+    解析结果以 pickle + zlib 压缩后的二进制保存，相同的字符串只保存一份。
+    """
+
+    # 计算内容哈希时每次读取的字节数
+    HASH_CHUNK_SIZE = 1 << 20
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._init_db()
+
+    def _init_db(self):
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS parse_cache (
+                    file_path TEXT NOT NULL,
+                    dialect TEXT NOT NULL,
+                    ignore_case INTEGER NOT NULL,
+                    file_size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    tables BLOB NOT NULL,
+                    updated_at TIMESTAMP NOT NULL,
+                    PRIMARY KEY (file_path, dialect, ignore_case)
+                )
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_parse_cache_hash
+                ON parse_cache (content_hash, dialect, ignore_case)
+            """)
+            conn.commit()
+
+    @staticmethod
+    def file_state(file_path: str) -> tuple:
+        """返回文件的 (大小, 修改时间纳秒)"""
+        stat = os.stat(file_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    @classmethod
+    def content_hash(cls, file_path: str) -> str:
+        """计算文件内容哈希"""
+        digest = hashlib.blake2b(digest_size=20)
+        with open(file_path, 'rb') as file:
+            while True:
+                data = file.read(cls.HASH_CHUNK_SIZE)
+                if not data:
+                    break
+                digest.update(data)
+        return digest.hexdigest()
+
+    def load(self, file_path: str, dialect: str, ignore_case: bool) -> Tuple[Optional[Dict[str, Dict[str, Any]]], tuple]:
+        """读取文件的缓存解析结果，返回 (解析结果, 文件状态)
+
+        文件已变化或没有缓存时解析结果为 None。文件状态为读取前的 (大小, 修改时间纳秒, 内容哈希)，
+        未命中时直接交给 save()，不必再读取一遍文件计算哈希。
+        """
+        file_path = os.path.abspath(file_path)
+        file_size, mtime_ns = self.file_state(file_path)
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT file_size, mtime_ns, tables FROM parse_cache WHERE file_path = ? AND dialect = ? AND ignore_case = ?",
+                (file_path, dialect, int(ignore_case))
+            )
+            row = cursor.fetchone()
+            if row and row[0] == file_size and row[1] == mtime_ns:
+                return self._loads(row[2]), (file_size, mtime_ns, None)
+
+            # 大小或修改时间变化，按内容哈希查找相同内容的缓存
+            content_hash = self.content_hash(file_path)
+            cursor.execute(
+                "SELECT tables FROM parse_cache WHERE content_hash = ? AND dialect = ? AND ignore_case = ? AND file_size = ?",
+                (content_hash, dialect, int(ignore_case), file_size)
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None, (file_size, mtime_ns, content_hash)
+            tables = row[0]
+            cursor.execute("""
+                INSERT OR REPLACE INTO parse_cache
+                (file_path, dialect, ignore_case, file_size, mtime_ns, content_hash, tables, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (file_path, dialect, int(ignore_case), file_size, mtime_ns, content_hash, tables, datetime.now().isoformat()))
+            conn.commit()
+            return self._loads(tables), (file_size, mtime_ns, content_hash)
+
+    def save(self, file_path: str, dialect: str, ignore_case: bool, tables: Dict[str, Dict[str, Any]], file_state: tuple):
+        """保存解析结果
+
+        file_state 为 load() 返回的文件状态，解析期间文件被修改时不保存。
+        """
+        file_path = os.path.abspath(file_path)
+        file_size, mtime_ns, content_hash = file_state
+        if self.file_state(file_path) != (file_size, mtime_ns):
+            return
+        if content_hash is None:
+            content_hash = self.content_hash(file_path)
+        data = self._dumps(tables)
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT OR REPLACE INTO parse_cache
+                (file_path, dialect, ignore_case, file_size, mtime_ns, content_hash, tables, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, (file_path, dialect, int(ignore_case), file_size, mtime_ns, content_hash, data, datetime.now().isoformat()))
+            conn.commit()
+
+    @staticmethod
+    def _dumps(tables: Dict[str, Dict[str, Any]]) -> bytes:
+        """序列化解析结果，值相同的字符串合并为同一对象，pickle 对同一对象只写一次"""
+        strings = {}
+
+        def share(value):
+            if isinstance(value, str):
+                return strings.setdefault(value, value)
+            if isinstance(value, dict):
+                return {share(k): share(v) for k, v in value.items()}
+            return value
+
+        return zlib.compress(pickle.dumps(share(tables), protocol=pickle.HIGHEST_PROTOCOL))
+
+    @staticmethod
+    def _loads(data: bytes) -> Dict[str, Dict[str, Any]]:
+        """反序列化解析结果，期间暂停垃圾回收，避免大量小对象反复触发回收"""
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return pickle.loads(zlib.decompress(data))
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def clear(self, file_path: str = None):
+        """清除指定文件（或全部）的缓存"""
+        with sqlite3.connect(self.db_path) as conn:
+            cursor = conn.cursor()
+            if file_path is None:
+                cursor.execute("DELETE FROM parse_cache")
+            else:
+                cursor.execute("DELETE FROM parse_cache WHERE file_path = ?", (os.path.abspath(file_path),))
+            conn.commit()
@@ -6,10 +6,11 @@
 import sys
 import os
 import threading
+from collections.abc import Mapping
 from datetime import datetime
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QComboBox, QTableWidget, QTableWidgetItem,
+    QPushButton, QLabel, QComboBox, QTableView, QHeaderView,
     QCheckBox, QFrame, QGroupBox, QSplitter, QMessageBox,
     QFileDialog, QTextEdit, QDialog, QRadioButton, QButtonGroup,
     QGridLayout, QLineEdit, QMenuBar, QMenu, QToolBar, QToolButton
@@ -19,11 +20,17 @@ from PyQt6.QtGui import QFont, QColor, QClipboard, QPalette, QIcon, QAction, QBr
 
 from src.core.sql_parser import SQLParser
 from src.core.sql_generator import SQLGenerator
+from src.core.sql_output import PagedSQLFile
 from src.core.db_connector import DBConnector
-from src.data.models import ConnectionManager, Connection, History
+from src.core.compare_pipeline import ComparePipeline
+from src.core.diff_index import DiffIndex
+from src.data.models import ConnectionManager, Connection, History, SchemaCache, ParseCache
 from src.ui.connection_dialog import ConnectionDialog, SelectConnectionDialog
 from src.ui.language_dialog import LanguageDialog
 from src.ui.about_dialog import AboutDialog
+from src.ui.schema_loader import SchemaLoadThread
+from src.ui.comparison_model import ComparisonTableModel
+from src.ui.sql_viewer import SQLViewerDialog
 from src.i18n.i18n_manager import get_i18n_manager, tr
 from src.utils.icon_manager import setup_window_icon, setup_application_icon
 
@@ -45,6 +52,8 @@ class SQLCompareApp(QMainWindow):
         # 数据库类型跟踪
         self.left_db_type = None
         self.right_db_type = None
+        # 从数据库加载的一侧：side -> (数据库类型, 连接配置)，用于按需获取建表语句
+        self.schema_sources = {}
         
         # 搜索相关变量
         self.search_highlight_color = QColor(255, 255, 0, 100)  # 黄色半透明高亮
@@ -57,12 +66,32 @@ class SQLCompareApp(QMainWindow):
         self.current_search_matches = []  # 当前搜索的所有匹配项
         self.current_search_index = -1  # 当前选中的匹配项索引
         
+        # 后台加载表结构的线程（按左右两侧分别保存）
+        self.load_threads = {}
+        # 所有已启动且尚未结束的加载线程，包括已取消或被替换、仍阻塞在查询中的线程
+        self.running_load_threads = set()
+        # 加载过程中合并部分结果的刷新，避免每个表都重绘整个表格
+        self.load_refresh_timers = {}
+        for side in ("left", "right"):
+            timer = QTimer()
+            timer.setSingleShot(True)
+            timer.setInterval(300)
+            timer.timeout.connect(lambda side=side: self.show_tables(side))
+            self.load_refresh_timers[side] = timer
+        # 加载过程中逐表比较的流水线；加载未完成时点击比较会在两侧都完成后自动执行
+        self.compare_pipeline = None
+        self.compare_pending = False
+        # 最近一次比较的逐行差异索引及其对应的 (左侧表结构, 右侧表结构, SQL解析器)
+        self.diff_index = None
+        self.diff_index_sources = None
+        
         # 初始化组件
         self.connection_manager = connection_manager
         # 延迟初始化其他组件，避免阻塞UI
         self.sql_parser = None
         self.sql_generator = None
         self.db_connector = None
+        self.parse_cache = None
         
         # 获取已初始化的国际化管理器实例
         self.i18n_manager = get_i18n_manager()
@@ -141,12 +170,18 @@ class SQLCompareApp(QMainWindow):
     def delayed_initialization(self):
         """延迟初始化，避免阻塞UI线程"""
         # 初始化组件
+        if self.parse_cache is None:
+            # SQL文件解析结果缓存与连接信息保存在同一个数据库文件中
+            self.parse_cache = ParseCache(self.connection_manager.db_path)
         if self.sql_parser is None:
-            self.sql_parser = SQLParser(ignore_case=self.ignore_case)
+            self.sql_parser = SQLParser(ignore_case=self.ignore_case, parse_cache=self.parse_cache)
         if self.sql_generator is None:
             self.sql_generator = SQLGenerator()
+        if self.compare_pipeline is None:
+            self.compare_pipeline = ComparePipeline(self.sql_parser)
         if self.db_connector is None:
-            self.db_connector = DBConnector()
+            # 表结构快照与连接信息保存在同一个数据库文件中
+            self.db_connector = DBConnector(SchemaCache(self.connection_manager.db_path))
         
         # 在后台线程中执行耗时的数据库操作
         def init_history():
@@ -323,7 +358,7 @@ class SQLCompareApp(QMainWindow):
         }
         
         /* 表格样式 */
-        QTableWidget {
+        QTableView {
             background: white;
             border: 1px solid #e0e0e0;
             border-radius: 8px;
@@ -333,17 +368,17 @@ class SQLCompareApp(QMainWindow):
             color: #202020;
         }
         
-        QTableWidget::item {
+        QTableView::item {
             padding: 8px;
             border: none;
         }
         
-        QTableWidget::item:selected {
+        QTableView::item:selected {
             background: #e6f3ff;
             color: #202020;
         }
         
-        QTableWidget::item:hover {
+        QTableView::item:hover {
             background: #f8f9fa;
         }
         
@@ -693,16 +728,32 @@ class SQLCompareApp(QMainWindow):
         
         left_layout.addWidget(select_frame)
         
+        # 加载进度框架，仅在后台加载表结构时显示
+        self.left_load_frame = QFrame()
+        load_layout = QHBoxLayout(self.left_load_frame)
+        load_layout.setContentsMargins(0, 0, 0, 0)
+        self.left_load_label = QLabel()
+        load_layout.addWidget(self.left_load_label, 1)
+        self.left_cancel_btn = QPushButton(tr("cancel_loading"))
+        self.left_cancel_btn.setFixedWidth(100)
+        self.left_cancel_btn.clicked.connect(lambda: self.cancel_schema_load("left"))
+        load_layout.addWidget(self.left_cancel_btn)
+        self.left_load_frame.hide()
+        left_layout.addWidget(self.left_load_frame)
+        
         # 表格视图
-        self.left_tree = QTableWidget()
-        self.left_tree.setColumnCount(3)
-        self.left_tree.setHorizontalHeaderLabels([tr("sequence_number"), tr("field_name"), tr("field_definition")])
+        self.left_tree = QTableView()
+        self.left_model = ComparisonTableModel([tr("sequence_number"), tr("field_name"), tr("field_definition")], self)
+        self.left_model.set_search_colors(self.search_highlight_color, self.current_search_highlight_color)
+        self.left_tree.setModel(self.left_model)
+        # 固定行高，视图无需逐行计算尺寸
+        self.left_tree.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.left_tree.setColumnWidth(0, 60)
         self.left_tree.setColumnWidth(1, 200)
         # 设置第三列自动占用剩余空间
         self.left_tree.horizontalHeader().setStretchLastSection(True)
         self.left_tree.setAlternatingRowColors(True)
-        self.left_tree.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.left_tree.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         left_layout.addWidget(self.left_tree)
         
     def create_right_panel(self, parent):
@@ -783,16 +834,32 @@ class SQLCompareApp(QMainWindow):
         
         right_layout.addWidget(select_frame)
         
+        # 加载进度框架，仅在后台加载表结构时显示
+        self.right_load_frame = QFrame()
+        load_layout = QHBoxLayout(self.right_load_frame)
+        load_layout.setContentsMargins(0, 0, 0, 0)
+        self.right_load_label = QLabel()
+        load_layout.addWidget(self.right_load_label, 1)
+        self.right_cancel_btn = QPushButton(tr("cancel_loading"))
+        self.right_cancel_btn.setFixedWidth(100)
+        self.right_cancel_btn.clicked.connect(lambda: self.cancel_schema_load("right"))
+        load_layout.addWidget(self.right_cancel_btn)
+        self.right_load_frame.hide()
+        right_layout.addWidget(self.right_load_frame)
+        
         # 表格视图
-        self.right_tree = QTableWidget()
-        self.right_tree.setColumnCount(3)
-        self.right_tree.setHorizontalHeaderLabels([tr("sequence_number"), tr("field_name"), tr("field_definition")])
+        self.right_tree = QTableView()
+        self.right_model = ComparisonTableModel([tr("sequence_number"), tr("field_name"), tr("field_definition")], self)
+        self.right_model.set_search_colors(self.search_highlight_color, self.current_search_highlight_color)
+        self.right_tree.setModel(self.right_model)
+        # 固定行高，视图无需逐行计算尺寸
+        self.right_tree.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.right_tree.setColumnWidth(0, 60)
         self.right_tree.setColumnWidth(1, 200)
         # 设置第三列自动占用剩余空间
         self.right_tree.horizontalHeader().setStretchLastSection(True)
         self.right_tree.setAlternatingRowColors(True)
-        self.right_tree.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.right_tree.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         right_layout.addWidget(self.right_tree)
         
         # 连接同步滚动
@@ -800,8 +867,8 @@ class SQLCompareApp(QMainWindow):
         self.right_tree.verticalScrollBar().valueChanged.connect(self.sync_scroll_bars)
         
         # 连接行选择同步
-        self.left_tree.itemSelectionChanged.connect(self.sync_row_selection)
-        self.right_tree.itemSelectionChanged.connect(self.sync_row_selection)
+        self.left_tree.selectionModel().selectionChanged.connect(self.sync_row_selection)
+        self.right_tree.selectionModel().selectionChanged.connect(self.sync_row_selection)
         
     def sync_scroll_bars(self):
         """同步滚动条"""
@@ -820,17 +887,17 @@ class SQLCompareApp(QMainWindow):
             return
             
         sender = self.sender()
-        if sender == self.left_tree:
+        if sender == self.left_tree.selectionModel():
             # 左侧表格选择变化，同步到右侧
-            selected_rows = self.left_tree.selectedItems()
+            selected_rows = self.left_tree.selectionModel().selectedRows()
             if selected_rows:
                 row = selected_rows[0].row()
                 self.sync_row_selection_enabled = False  # 防止循环触发
                 self.right_tree.selectRow(row)
                 self.sync_row_selection_enabled = True
-        elif sender == self.right_tree:
+        elif sender == self.right_tree.selectionModel():
             # 右侧表格选择变化，同步到左侧
-            selected_rows = self.right_tree.selectedItems()
+            selected_rows = self.right_tree.selectionModel().selectedRows()
             if selected_rows:
                 row = selected_rows[0].row()
                 self.sync_row_selection_enabled = False  # 防止循环触发
@@ -844,18 +911,20 @@ class SQLCompareApp(QMainWindow):
     def toggle_hide_same(self, checked):
         """切换隐藏相同行状态"""
         self.hide_same = checked
-        self.show_differences()
+        self.show_differences(recompare=False)
         
     def toggle_show_missing(self, checked):
         """切换仅显示缺失状态"""
         self.show_missing_only = checked
-        self.show_differences()
+        self.show_differences(recompare=False)
         
     def toggle_ignore_case(self, checked):
         """切换忽略大小写状态"""
         self.ignore_case = checked
         # 重新初始化SQL解析器
-        self.sql_parser = SQLParser(ignore_case=self.ignore_case)
+        self.sql_parser = SQLParser(ignore_case=self.ignore_case, parse_cache=self.parse_cache)
+        # 已计算的逐表差异基于旧的大小写设置，需要重建比较流水线
+        self.compare_pipeline = ComparePipeline(self.sql_parser)
         # 如果已经有数据，重新比较
         if self.left_tables and self.right_tables:
             self.show_differences()
@@ -908,6 +977,7 @@ class SQLCompareApp(QMainWindow):
                     self.left_tables = self.sql_parser.parse_file(file_path)
                 else:
                     self.right_tables = self.sql_parser.parse_file(file_path)
+                self.schema_sources.pop(side, None)
                     
                 # 显示表结构
                 self.show_tables(side)
@@ -929,6 +999,11 @@ class SQLCompareApp(QMainWindow):
         if not self._check_database_compatibility():
             return
             
+        # 仍有一侧在加载时，等两侧都加载完成后再显示差异（加载期间已在逐表比较）
+        if self.load_threads:
+            self.compare_pending = True
+            return
+            
         # 执行比较
         self.show_differences()
         
@@ -955,171 +1030,83 @@ class SQLCompareApp(QMainWindow):
             
         return True
 
-    def show_differences(self):
-        """显示差异"""
+    def show_differences(self, recompare=True):
+        """显示差异
+        
+        recompare 为 False 时（切换隐藏相同行/仅显示缺失），若两侧表结构未变化则直接复用
+        已有的差异索引，只按状态过滤，不重新比较。
+        """
         # 禁用行选择同步，避免在数据加载过程中触发
         self.sync_row_selection_enabled = False
         
         # 清空显示区域
-        self.left_tree.setRowCount(0)
-        self.right_tree.setRowCount(0)
-        
-        # 获取差异
-        differences = self.sql_parser.compare_tables(self.left_tables, self.right_tables)
-        
-        # 获取所有表名
-        all_tables = sorted(set(list(self.left_tables.keys()) + list(self.right_tables.keys())))
-        
+        self.left_model.clear()
+        self.right_model.clear()
+        
+        sources = (self.left_tables, self.right_tables, self.sql_parser)
+        if (recompare or self.diff_index is None or self.diff_index_sources is None or
+                any(a is not b for a, b in zip(self.diff_index_sources, sources))):
+            # 获取差异，两侧由后台加载得到时直接使用加载过程中逐表比较的结果
+            if self.compare_pipeline is not None and self.compare_pipeline.matches(self.left_tables, self.right_tables):
+                differences = self.compare_pipeline.get_differences()
+            else:
+                differences = self.sql_parser.compare_tables(self.left_tables, self.right_tables)
+            # 一次性计算每个字段行的差异状态
+            self.diff_index = DiffIndex.build(self.left_tables, self.right_tables, differences)
+            self.diff_index_sources = sources
+            
         # 准备数据
         left_data = []
         right_data = []
-        
-        # 为每个表创建数据
-        for table_index, table_name in enumerate(all_tables, 1):
-            # 获取左右表的字段
-            left_columns = self.left_tables.get(table_name, {}).get('columns', {})
-            right_columns = self.right_tables.get(table_name, {}).get('columns', {})
-            
-            # 计算字段数量
-            left_count = len(left_columns)
-            right_count = len(right_columns)
-            
-            # 检查表是否有差异
-            has_table_differences = (
-                table_name in differences.get('modified_tables', {}) or
-                table_name in differences.get('added_tables', []) or
-                table_name in differences.get('removed_tables', [])
-            )
-            
-            # 如果启用了隐藏相同行且表没有差异，则跳过
-            if self.hide_same and not has_table_differences:
-                continue
-                
-            # 添加表头行
-            left_data.append([f"{tr('table')}{table_index}", f"{tr('table_name')} {table_name}", f"{tr('field_count')} {left_count}"])
-            right_data.append([f"{tr('table')}{table_index}", f"{tr('table_name')} {table_name}", f"{tr('field_count')} {right_count}"])
-            
-            # 添加字段信息
-            all_columns = sorted(set(list(left_columns.keys()) + list(right_columns.keys())))
-            
-            for col_index, col_name in enumerate(all_columns, 1):
-                left_def = left_columns.get(col_name, "")
-                right_def = right_columns.get(col_name, "")
-                
-                # 确定是否有差异
-                has_column_differences = False
-                is_missing = False
-                
-                if table_name in differences.get('modified_tables', {}):
-                    changes = differences['modified_tables'][table_name]
-                    if 'columns' in changes:
-                        cols_changes = changes['columns']
-                        if (col_name in cols_changes.get('removed_columns', {}) or
-                            col_name in cols_changes.get('added_columns', {}) or
-                            col_name in cols_changes.get('modified_columns', {})):
-                            has_column_differences = True
-                
-                if not left_def and right_def:
-                    has_column_differences = True
-                    is_missing = True
-                if not right_def and left_def:
-                    has_column_differences = True
-                    is_missing = True
-                
-                # 如果启用了隐藏相同行且字段没有差异，则跳过
-                if self.hide_same and not has_column_differences:
-                    continue
-                    
-                # 如果启用了仅显示缺失且不是缺失字段，则跳过
-                if self.show_missing_only and not is_missing:
-                    continue
-                
-                # 准备数据
-                left_def_display = left_def.get('raw', '') if isinstance(left_def, dict) else left_def
-                right_def_display = right_def.get('raw', '') if isinstance(right_def, dict) else right_def
-                
-                left_row = [str(col_index), col_name, left_def_display or tr("missing")]
-                right_row = [str(col_index), col_name, right_def_display or tr("missing")]
+        diffs = bytearray()
+        
+        table_label = tr("table")
+        table_name_label = tr("table_name")
+        field_count_label = tr("field_count")
+        missing_label = tr("missing")
+        diff_colors = {
+            DiffIndex.SAME: ComparisonTableModel.DIFF_NONE,
+            DiffIndex.MODIFIED: ComparisonTableModel.DIFF_CHANGED,
+            DiffIndex.MISSING_LEFT: ComparisonTableModel.DIFF_MISSING,
+            DiffIndex.MISSING_RIGHT: ComparisonTableModel.DIFF_MISSING,
+        }
+        
+        # 按状态过滤，生成两侧的显示行
+        for status, number, name, left_value, right_value in self.diff_index.rows(self.hide_same, self.show_missing_only):
+            if status is None:
+                # 表头行
+                left_data.append([f"{table_label}{number}", f"{table_name_label} {name}", f"{field_count_label} {left_value}"])
+                right_data.append([f"{table_label}{number}", f"{table_name_label} {name}", f"{field_count_label} {right_value}"])
+                diffs.append(ComparisonTableModel.DIFF_NONE)
+            else:
+                left_data.append([str(number), name, left_value or missing_label])
+                right_data.append([str(number), name, right_value or missing_label])
+                diffs.append(diff_colors[status])
                 
-                left_data.append(left_row)
-                right_data.append(right_row)
-        
         # 填充表格
         self.fill_table(self.left_tree, left_data)
         self.fill_table(self.right_tree, right_data)
         
-        # 设置差异颜色
-        self.set_difference_colors(left_data, right_data, differences)
+        # 设置差异颜色（两侧表格共享同一份差异状态）
+        self.left_model.set_differences(diffs)
+        self.right_model.set_differences(diffs)
         
         # 重新启用行选择同步
         self.sync_row_selection_enabled = True
         
     def fill_table(self, table, data):
-        """填充表格数据"""
-        table.setRowCount(len(data))
+        """填充表格数据（只记录行数据和行类型，样式由模型在绘制时计算）"""
+        table_name_label = tr("table_name")
+        section_labels = (tr("field"), tr("index"))
+        kinds = bytearray(len(data))
         for row_index, row_data in enumerate(data):
-            for col_index, cell_data in enumerate(row_data):
-                item = QTableWidgetItem(str(cell_data))
-                table.setItem(row_index, col_index, item)
-                
-                # 设置表头行的样式
-                if row_data[1].startswith(tr("table_name")):
-                    item.setBackground(QColor(240, 240, 240))
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
-                # 设置标题行的样式
-                elif row_data[1] in [tr("field"), tr("index")]:
-                    item.setBackground(QColor(220, 220, 220))
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
-        
-    def set_difference_colors(self, left_data, right_data, differences):
-        """设置差异颜色"""
-        # 遍历数据，找到差异行并设置颜色
-        for row_index, (left_row, right_row) in enumerate(zip(left_data, right_data)):
-            # 跳过表头行
-            if left_row[1].startswith("表名:"):
-                continue
-                
-            # 检查是否是字段行
-            if len(left_row) >= 3 and len(right_row) >= 3:
-                col_name = left_row[1]
-                left_def = left_row[2]
-                right_def = right_row[2]
-                
-                # 检查是否有差异
-                has_differences = False
-                is_missing = False
-                
-                if left_def == tr("missing") or right_def == tr("missing"):
-                    has_differences = True
-                    is_missing = True
-                elif left_def != right_def:
-                    # 在忽略大小写模式下，需要标准化比较
-                    if self.ignore_case:
-                        from utils.util import normalize_sql_definition
-                        left_normalized = normalize_sql_definition(left_def)
-                        right_normalized = normalize_sql_definition(right_def)
-                        if left_normalized != right_normalized:
-                            has_differences = True
-                    else:
-                        has_differences = True
-                
-                # 设置颜色
-                if has_differences:
-                    color = QColor("green") if is_missing else QColor("red")
-                    
-                    # 设置左侧表格颜色
-                    left_item = self.left_tree.item(row_index, 2)
-                    if left_item:
-                        left_item.setForeground(color)
-                    
-                    # 设置右侧表格颜色
-                    right_item = self.right_tree.item(row_index, 2)
-                    if right_item:
-                        right_item.setForeground(color)
+            # 表头行
+            if row_data[1].startswith(table_name_label):
+                kinds[row_index] = ComparisonTableModel.ROW_TABLE_HEADER
+            # 标题行
+            elif row_data[1] in section_labels:
+                kinds[row_index] = ComparisonTableModel.ROW_SECTION_HEADER
+        table.model().set_rows(data, kinds)
         
     def generate_sync_sql(self):
         """生成同步SQL"""
@@ -1146,11 +1133,19 @@ class SQLCompareApp(QMainWindow):
             target_side = dialog.target_side
             left_name = dialog.left_name
             right_name = dialog.right_name
+            self.sql_generator.combine_alters = dialog.combine_alters
+            self.sql_generator.online_ddl = dialog.online_ddl
+            self.sql_generator.dependency_order = dialog.dependency_order
+            # 批量加载时未获取的建表语句在生成过程中按需从数据库获取
+            create_sql_connectors = {}
+            self.sql_generator.create_sql_loader = (
+                lambda tables, table_name: self._load_create_sql(create_sql_connectors, tables, table_name)
+            )
             
             try:
                 if target_side == "right":
                     # 以右侧为目标库，将左侧结构同步到右侧
-                    sync_sql = self.sql_generator.generate_sync_sql(
+                    sync_sql = self.sql_generator.iter_sync_sql(
                         self.left_tables, 
                         self.right_tables, 
                         target_db_type
@@ -1158,18 +1153,49 @@ class SQLCompareApp(QMainWindow):
                     title = tr("sync_sql_title_right").format(left_name=left_name, right_name=right_name)
                 else:
                     # 以左侧为目标库，将右侧结构同步到左侧
-                    sync_sql = self.sql_generator.generate_sync_sql(
+                    sync_sql = self.sql_generator.iter_sync_sql(
                         self.right_tables, 
                         self.left_tables, 
                         target_db_type
                     )
                     title = tr("sync_sql_title_left").format(right_name=right_name, left_name=left_name)
                 
-                # 显示SQL窗口
-                self.show_sql_window(title, sync_sql)
+                # 同步SQL逐行写入临时文件，窗口中分页显示
+                QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+                try:
+                    sql_file = PagedSQLFile(sync_sql)
+                finally:
+                    QApplication.restoreOverrideCursor()
+                    self.sql_generator.create_sql_loader = None
+                    for connector in create_sql_connectors.values():
+                        connector.close()
+                    
+                with sql_file:
+                    # 显示SQL窗口
+                    self.show_sql_window(title, sql_file)
                 
             except Exception as e:
                 QMessageBox.critical(self, tr("error"), f"{tr('generate_sync_sql_error')}:\n{str(e)}")
+                
+    def _load_create_sql(self, connectors, tables, table_name):
+        """从表结构所在的数据库获取建表语句，每侧只建立一个连接（来自连接池）"""
+        if tables is self.left_tables:
+            side = "left"
+        elif tables is self.right_tables:
+            side = "right"
+        else:
+            return None
+        source = self.schema_sources.get(side)
+        if source is None:
+            return None
+            
+        connector = connectors.get(side)
+        if connector is None:
+            db_type, db_config = source
+            connector = DBConnector()
+            connector.connect(db_config, db_type)
+            connectors[side] = connector
+        return connector.get_create_table_sql(table_name)
     
     def _determine_target_database_type(self):
         """确定目标数据库类型"""
@@ -1182,116 +1208,11 @@ class SQLCompareApp(QMainWindow):
         # 如果都是文件，默认使用MySQL类型
         return "mysql"
 
-    def show_sql_window(self, title, sql_content):
-        """显示SQL窗口"""
-        dialog = QDialog(self)
-        dialog.setWindowTitle(title)
-        dialog.setGeometry(200, 200, 900, 700)
-        
-        # 应用Windows 11风格样式
-        dialog.setStyleSheet("""
-        QDialog {
-            background-color: #fafafa;
-            color: #202020;
-        }
-        
-        QPushButton {
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #ffffff, stop:1 #f8f8f8);
-            border: 1px solid #d0d0d0;
-            border-radius: 6px;
-            padding: 8px 16px;
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 13px;
-            font-weight: 500;
-            color: #202020;
-            min-height: 20px;
-        }
-        
-        QPushButton:hover {
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #f0f8ff, stop:1 #e6f3ff);
-            border: 1px solid #0078d4;
-            color: #0078d4;
-        }
-        
-        QPushButton#primary {
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #0078d4, stop:1 #106ebe);
-            border: 1px solid #0078d4;
-            color: white;
-            font-weight: 600;
-        }
-        
-        QPushButton#primary:hover {
-            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                stop:0 #106ebe, stop:1 #005a9e);
-            border: 1px solid #106ebe;
-        }
-        
-        QTextEdit {
-            border: 1px solid #d0d0d0;
-            border-radius: 6px;
-            padding: 8px;
-            background: white;
-            font-family: 'Consolas', 'Monaco', monospace;
-            font-size: 12px;
-            color: #202020;
-        }
-        
-        QTextEdit:focus {
-            border: 2px solid #0078d4;
-        }
-        
-        QLabel {
-            font-family: 'Segoe UI', Arial, sans-serif;
-            font-size: 13px;
-            color: #202020;
-        }
-        """)
-        
-        layout = QVBoxLayout(dialog)
-        layout.setSpacing(15)
-        layout.setContentsMargins(20, 20, 20, 20)
-        
-        # 提示信息
-        info_label = QLabel(tr("generated_sync_sql_prompt"))
-        info_label.setStyleSheet("color: #666; font-weight: bold; margin-bottom: 10px; font-size: 14px;")
-        layout.addWidget(info_label)
-        
-        # SQL文本区域
-        text_edit = QTextEdit()
-        text_edit.setPlainText(sql_content)
-        text_edit.setFont(QFont("Consolas", 11))
-        layout.addWidget(text_edit)
-        
-        # 按钮区域
-        btn_layout = QHBoxLayout()
-        btn_layout.setSpacing(10)
-        
-        # 复制按钮
-        copy_btn = QPushButton(tr("copy_sql"))
-        copy_btn.setObjectName("primary")
-        copy_btn.clicked.connect(lambda: self.copy_to_clipboard(sql_content))
-        btn_layout.addWidget(copy_btn)
-        
-        btn_layout.addStretch()
-        
-        # 关闭按钮
-        close_btn = QPushButton(tr("close"))
-        close_btn.clicked.connect(dialog.accept)
-        btn_layout.addWidget(close_btn)
-        
-        layout.addLayout(btn_layout)
-        
+    def show_sql_window(self, title, sql_file):
+        """分页显示同步SQL"""
+        dialog = SQLViewerDialog(title, sql_file, self)
         dialog.exec()
         
-    def copy_to_clipboard(self, text):
-        """复制文本到剪贴板"""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(text)
-        QMessageBox.information(self, tr("info"), tr("sql_copied_to_clipboard"))
-        
     def update_history_lists(self):
         """更新历史记录列表"""
         # 获取历史记录
@@ -1336,28 +1257,14 @@ class SQLCompareApp(QMainWindow):
         side = self.current_search_side
         text = self.current_search_text
         
-        # 获取对应的表格
-        table = self.left_tree if side == "left" else self.right_tree
+        # 获取对应的表格模型
+        model = self.left_model if side == "left" else self.right_model
         
         # 清除之前的高亮
         self.clear_search_highlight(side)
         
         # 搜索匹配的行
-        matched_rows = []
-        for row in range(table.rowCount()):
-            for col in range(table.columnCount()):
-                item = table.item(row, col)
-                if item:
-                    item_text = item.text()
-                    if self.ignore_case:
-                        item_text = item_text.lower()
-                        search_text = text.lower()
-                    else:
-                        search_text = text
-                    
-                    if search_text in item_text:
-                        matched_rows.append(row)
-                        break
+        matched_rows = model.find_rows(text, self.ignore_case)
         
         # 更新搜索匹配项
         self.current_search_matches = matched_rows
@@ -1376,13 +1283,8 @@ class SQLCompareApp(QMainWindow):
     
     def clear_search_highlight(self, side):
         """清除搜索高亮"""
-        table = self.left_tree if side == "left" else self.right_tree
-        
-        for row in range(table.rowCount()):
-            for col in range(table.columnCount()):
-                item = table.item(row, col)
-                if item:
-                    item.setBackground(QBrush())
+        model = self.left_model if side == "left" else self.right_model
+        model.clear_search_highlight()
         
         # 清除搜索状态
         self.current_search_matches = []
@@ -1394,13 +1296,8 @@ class SQLCompareApp(QMainWindow):
     
     def highlight_matched_rows(self, side, matched_rows):
         """高亮匹配的行"""
-        table = self.left_tree if side == "left" else self.right_tree
-        
-        for row in matched_rows:
-            for col in range(table.columnCount()):
-                item = table.item(row, col)
-                if item:
-                    item.setBackground(self.search_highlight_color)
+        model = self.left_model if side == "left" else self.right_model
+        model.set_search_highlight(matched_rows)
     
     def navigate_to_next_match(self, side):
         """导航到下一个匹配项"""
@@ -1426,19 +1323,14 @@ class SQLCompareApp(QMainWindow):
             return
             
         table = self.left_tree if side == "left" else self.right_tree
+        model = self.left_model if side == "left" else self.right_model
         current_row = self.current_search_matches[self.current_search_index]
         
-        # 重新高亮所有匹配项，突出显示当前项
-        self.highlight_matched_rows(side, self.current_search_matches)
-        
-        # 高亮当前选中的匹配项（使用不同颜色）
-        for col in range(table.columnCount()):
-            item = table.item(current_row, col)
-            if item:
-                item.setBackground(self.current_search_highlight_color)
+        # 重新高亮所有匹配项，当前选中的匹配项使用不同颜色
+        model.set_search_highlight(self.current_search_matches, current_row)
         
         # 滚动到当前匹配项
-        table.scrollToItem(table.item(current_row, 0))
+        table.scrollTo(model.index(current_row, 0))
         
         # 选中该行
         table.selectRow(current_row)
@@ -1478,7 +1370,7 @@ class SQLCompareApp(QMainWindow):
         table = self.left_tree if side == "left" else self.right_tree
         
         # 确保行在可视范围内
-        table.scrollToItem(table.item(row, 0))
+        table.scrollTo(table.model().index(row, 0))
         
         # 选中该行
         table.selectRow(row)
@@ -1529,6 +1421,7 @@ class SQLCompareApp(QMainWindow):
                     else:
                         self.right_tables = self.sql_parser.parse_file(history.value)
                         self.right_db_type = None  # 文件类型未知
+                    self.schema_sources.pop(side, None)
                     
                     # 显示表结构
                     self.show_tables(side)
@@ -1547,23 +1440,8 @@ class SQLCompareApp(QMainWindow):
                             else:
                                 self.right_db_type = conn.type
                             
-                            # 连接到数据库
-                            self.db_connector.connect(db_config, conn.type)
-                            
-                            # 获取表结构
-                            tables = self.db_connector.get_table_structure()
-                            
-                            # 关闭连接
-                            self.db_connector.close()
-                            
-                            # 更新表结构
-                            if side == "left":
-                                self.left_tables = tables
-                            else:
-                                self.right_tables = tables
-                                
-                            # 显示表结构
-                            self.show_tables(side)
+                            # 在后台线程中连接数据库并获取表结构
+                            self.start_schema_load(side, conn.type, db_config)
                         except Exception as e:
                             QMessageBox.critical(self, tr("error"), f"{tr('get_table_structure_failed')}: {str(e)}")
                     elif conn.type == "agent":
@@ -1644,33 +1522,127 @@ class SQLCompareApp(QMainWindow):
                 else:
                     self.right_db_type = connection.type
                 
-                # 连接到数据库
-                self.db_connector.connect(db_config, connection.type)
-                
-                # 获取表结构
-                tables = self.db_connector.get_table_structure()
-                
-                # 关闭连接
-                self.db_connector.close()
-                
-                # 更新表结构
-                if side == "left":
-                    self.left_tables = tables
-                else:
-                    self.right_tables = tables
-                    
-                # 显示表结构
-                self.show_tables(side)
+                # 在后台线程中连接数据库并获取表结构
+                self.start_schema_load(side, connection.type, db_config)
             except Exception as e:
                 QMessageBox.critical(self, tr("error"), f"{tr('get_table_structure_failed')}: {str(e)}")
         elif connection.type == "agent":
             QMessageBox.information(self, tr("info"), tr("agent_connection_not_supported"))
         
+    def start_schema_load(self, side, db_type, db_config):
+        """在后台线程中加载表结构，左右两侧互不阻塞"""
+        # 取消该侧尚未完成的加载
+        self.cancel_schema_load(side)
+        
+        if side == "left":
+            self.left_tables = {}
+        else:
+            self.right_tables = {}
+        self.show_tables(side)
+        self.schema_sources[side] = (db_type, db_config)
+        
+        thread = SchemaLoadThread(side, db_type, db_config, self.db_connector.schema_cache,
+                                  self.compare_pipeline, self)
+        thread.table_loaded.connect(self.on_schema_table_loaded)
+        thread.load_finished.connect(self.on_schema_load_finished)
+        thread.load_failed.connect(self.on_schema_load_failed)
+        thread.load_cancelled.connect(self.on_schema_load_cancelled)
+        thread.finished.connect(self._on_load_thread_finished)
+        thread.finished.connect(thread.deleteLater)
+        self.load_threads[side] = thread
+        self.running_load_threads.add(thread)
+        
+        load_label = self.left_load_label if side == "left" else self.right_load_label
+        load_frame = self.left_load_frame if side == "left" else self.right_load_frame
+        load_label.setText(tr("loading_table_structure"))
+        load_frame.show()
+        thread.start()
+        
+    def cancel_schema_load(self, side):
+        """取消指定侧正在进行的加载，已加载的表保留显示"""
+        thread = self.load_threads.get(side)
+        if thread is not None:
+            thread.cancel()
+            self.compare_pending = False
+        self._end_schema_load(side)
+        
+    def _end_schema_load(self, side):
+        """结束指定侧的加载状态并隐藏进度"""
+        self.load_threads.pop(side, None)
+        self.load_refresh_timers[side].stop()
+        load_frame = self.left_load_frame if side == "left" else self.right_load_frame
+        load_frame.hide()
+        
+    def _on_load_thread_finished(self):
+        """加载线程已结束，不再需要在关闭窗口时等待"""
+        self.running_load_threads.discard(self.sender())
+        
+    def _is_current_load(self, side):
+        """信号是否来自该侧当前的加载线程（已取消或被替换的线程发出的信号将被忽略）"""
+        return self.load_threads.get(side) is self.sender()
+        
+    def on_schema_table_loaded(self, side, table_name, structure, done, total):
+        """单个表加载完成，更新进度并合并刷新部分结果"""
+        if not self._is_current_load(side):
+            return
+            
+        tables = self.left_tables if side == "left" else self.right_tables
+        tables[table_name] = structure
+        # 表结构被原地修改，已有的差异索引失效
+        self.diff_index = None
+        
+        load_label = self.left_load_label if side == "left" else self.right_load_label
+        load_label.setText(tr("loading_table_progress").format(done=done, total=total, table_name=table_name))
+        
+        timer = self.load_refresh_timers[side]
+        if not timer.isActive():
+            timer.start()
+            
+    def on_schema_load_finished(self, side, tables):
+        """加载完成"""
+        if not self._is_current_load(side):
+            return
+            
+        self._end_schema_load(side)
+        if side == "left":
+            self.left_tables = tables
+        else:
+            self.right_tables = tables
+        self.show_tables(side)
+        
+        # 加载期间点击过比较，且两侧都已完成
+        if self.compare_pending and not self.load_threads:
+            self.compare_pending = False
+            self.start_compare()
+            
+    def on_schema_load_failed(self, side, message):
+        """加载失败"""
+        if not self._is_current_load(side):
+            return
+            
+        self._end_schema_load(side)
+        self.compare_pending = False
+        self.show_tables(side)
+        QMessageBox.critical(self, tr("error"), f"{tr('get_table_structure_failed')}: {message}")
+        
+    def on_schema_load_cancelled(self, side):
+        """加载已取消（界面状态已在 cancel_schema_load 中处理）"""
+        self.show_tables(side)
+        
+    def closeEvent(self, event):
+        """关闭窗口时取消并等待所有后台加载线程（包括已取消但仍在运行的线程）"""
+        for side in list(self.load_threads):
+            self.cancel_schema_load(side)
+        for thread in list(self.running_load_threads):
+            thread.cancel()
+            thread.wait()
+        self.running_load_threads.clear()
+        super().closeEvent(event)
+        
     def show_tables(self, side):
         """显示表结构"""
-        # 清空显示区域
+        # 获取显示区域
         table = self.left_tree if side == "left" else self.right_tree
-        table.setRowCount(0)
         
         # 获取表数据
         tables = self.left_tables if side == "left" else self.right_tables
@@ -1701,7 +1673,7 @@ class SQLCompareApp(QMainWindow):
                 
                 # 添加字段行
                 for col_index, (col_name, col_def) in enumerate(sorted(columns.items()), 1):
-                    col_def_display = col_def.get('raw', '') if isinstance(col_def, dict) else col_def
+                    col_def_display = col_def.get('raw', '') if isinstance(col_def, Mapping) else col_def
                     table_data.append([str(col_index), col_name, col_def_display])
             
             # 添加索引信息
@@ -1728,6 +1700,12 @@ class TargetDatabaseDialog(QDialog):
         self.connection_manager = connection_manager
         self.target_db_type = target_db_type
         self.target_side = "right"
+        # MySQL：同一个表的修改合并为一条 ALTER TABLE
+        self.combine_alters = False
+        # MySQL：在线DDL模式
+        self.online_ddl = False
+        # 按表之间的依赖关系分批输出
+        self.dependency_order = False
         self.left_name = tr("left_data_source")
         self.right_name = tr("right_data_source")
         
@@ -1898,6 +1876,23 @@ class TargetDatabaseDialog(QDialog):
         
         layout.addWidget(option_group)
         
+        # MySQL 生成选项
+        if self.target_db_type.lower() == "mysql":
+            self.combine_alters_check = QCheckBox(tr("combine_alter_statements"))
+            self.combine_alters_check.setToolTip(tr("combine_alter_statements_tip"))
+            self.combine_alters_check.toggled.connect(self.on_combine_alters_toggled)
+            layout.addWidget(self.combine_alters_check)
+            
+            self.online_ddl_check = QCheckBox(tr("online_ddl_mode"))
+            self.online_ddl_check.setToolTip(tr("online_ddl_mode_tip"))
+            self.online_ddl_check.toggled.connect(self.on_online_ddl_toggled)
+            layout.addWidget(self.online_ddl_check)
+            
+        self.dependency_order_check = QCheckBox(tr("dependency_order"))
+        self.dependency_order_check.setToolTip(tr("dependency_order_tip"))
+        self.dependency_order_check.toggled.connect(self.on_dependency_order_toggled)
+        layout.addWidget(self.dependency_order_check)
+        
         # 按钮
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
@@ -1922,6 +1917,18 @@ class TargetDatabaseDialog(QDialog):
             self.target_side = "right"
         elif button == self.left_radio:
             self.target_side = "left"
+            
+    def on_combine_alters_toggled(self, checked):
+        """合并ALTER语句选项变化"""
+        self.combine_alters = checked
+        
+    def on_online_ddl_toggled(self, checked):
+        """在线DDL模式选项变化"""
+        self.online_ddl = checked
+        
+    def on_dependency_order_toggled(self, checked):
+        """按依赖关系分批输出选项变化"""
+        self.dependency_order = checked
 
 
 
@@ -1944,6 +1951,9 @@ def main():
     # 创建主窗口，传入已创建的connection_manager
     window = SQLCompareApp(connection_manager)
     
+    # 退出时断开连接池中保留的数据库连接
+    app.aboutToQuit.connect(DBConnector.close_all)
+    
     # 设置应用和窗口图标
     setup_window_icon(window)
     
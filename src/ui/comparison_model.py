@@ -0,0 +1,156 @@
+"""
+对比表格数据模型 - PyQt6版本
+"""
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PyQt6.QtGui import QColor, QBrush, QFont
+
+
+class ComparisonTableModel(QAbstractTableModel):
+    """对比表格的虚拟化数据模型
+    
+    每行只保存一个 (序号, 名称, 定义) 元组，行类型、差异颜色和搜索高亮分别保存在
+    紧凑的字节数组或字典中。背景、字体和前景色在 data() 中按角色即时计算，
+    视图只会请求可见行的数据，不会为每个单元格创建 Qt 对象。
+    """
+    
+    # 行类型
+    ROW_NORMAL = 0
+    ROW_TABLE_HEADER = 1   # 表头行（表名、字段数）
+    ROW_SECTION_HEADER = 2  # 字段/索引标题行
+    
+    # 定义列的差异状态
+    DIFF_NONE = 0
+    DIFF_MISSING = 1
+    DIFF_CHANGED = 2
+    
+    # 搜索高亮状态
+    SEARCH_MATCH = 1
+    SEARCH_CURRENT = 2
+    
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._rows = []
+        self._kinds = bytearray()
+        self._diffs = bytearray()
+        self._search = {}
+        
+        self._kind_backgrounds = {
+            self.ROW_TABLE_HEADER: QBrush(QColor(240, 240, 240)),
+            self.ROW_SECTION_HEADER: QBrush(QColor(220, 220, 220)),
+        }
+        self._diff_foregrounds = {
+            self.DIFF_MISSING: QBrush(QColor("green")),
+            self.DIFF_CHANGED: QBrush(QColor("red")),
+        }
+        self._search_backgrounds = {
+            self.SEARCH_MATCH: QBrush(QColor(255, 255, 0, 100)),
+            self.SEARCH_CURRENT: QBrush(QColor(255, 165, 0, 150)),
+        }
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+        
+    def set_search_colors(self, match_color, current_color):
+        """设置搜索高亮颜色"""
+        self._search_backgrounds = {
+            self.SEARCH_MATCH: QBrush(match_color),
+            self.SEARCH_CURRENT: QBrush(current_color),
+        }
+        
+    def set_rows(self, rows, kinds=None):
+        """替换全部行数据
+        
+        rows 为每行一个序列（序号、名称、定义），kinds 为与之等长的行类型字节数组。
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self._kinds = kinds if kinds is not None else bytearray(len(rows))
+        self._diffs = bytearray(len(rows))
+        self._search = {}
+        self.endResetModel()
+        
+    def clear(self):
+        """清空数据"""
+        self.set_rows([])
+        
+    def set_differences(self, diffs):
+        """设置定义列的差异状态（与行数等长的字节数组）"""
+        self._diffs = diffs
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 2), self.index(len(self._rows) - 1, 2),
+                                  [Qt.ItemDataRole.ForegroundRole])
+            
+    def find_rows(self, text, ignore_case=True):
+        """返回任一单元格包含指定文本的行号列表"""
+        if ignore_case:
+            text = text.lower()
+            return [row for row, values in enumerate(self._rows)
+                    if any(text in str(value).lower() for value in values)]
+        return [row for row, values in enumerate(self._rows)
+                if any(text in str(value) for value in values)]
+        
+    def set_search_highlight(self, rows, current_row=-1):
+        """高亮匹配的行，current_row 使用当前项颜色"""
+        changed = set(self._search)
+        self._search = {row: self.SEARCH_MATCH for row in rows}
+        if current_row >= 0:
+            self._search[current_row] = self.SEARCH_CURRENT
+        changed.update(self._search)
+        self._emit_rows_changed(changed, [Qt.ItemDataRole.BackgroundRole])
+        
+    def clear_search_highlight(self):
+        """清除搜索高亮"""
+        self.set_search_highlight([])
+        
+    def _emit_rows_changed(self, rows, roles):
+        """通知视图指定行的数据已变化"""
+        if not rows:
+            return
+        last_column = self.columnCount() - 1
+        self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), last_column), roles)
+        
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+        
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._headers)
+        
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            if 0 <= section < len(self._headers):
+                return self._headers[section]
+            return None
+        return super().headerData(section, orientation, role)
+        
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        column = index.column()
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            values = self._rows[row]
+            return str(values[column]) if column < len(values) else ""
+            
+        if role == Qt.ItemDataRole.BackgroundRole:
+            search_state = self._search.get(row)
+            if search_state:
+                return self._search_backgrounds[search_state]
+            return self._kind_backgrounds.get(self._kinds[row])
+            
+        if role == Qt.ItemDataRole.FontRole:
+            if self._kinds[row] != self.ROW_NORMAL:
+                return self._bold_font
+            return None
+            
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if column == 2 and row < len(self._diffs):
+                return self._diff_foregrounds.get(self._diffs[row])
+            return None
+            
+        return None
@@ -0,0 +1,86 @@
+"""
+表结构后台加载线程 - PyQt6版本
+"""
+
+import threading
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from src.core.db_connector import DBConnector, LoadCancelled
+
+
+class SchemaLoadThread(QThread):
+    """在后台线程中连接数据库并获取表结构
+    
+    每个线程使用独立的 DBConnector（连接仍来自共享连接池），左右两侧可以同时加载。
+    每获取完一个表发出 table_loaded，界面据此显示进度和部分结果。
+    传入 compare_pipeline 时，每个表在加载线程中直接交给流水线逐表比较。
+    """
+    
+    # side, table_name, structure, done, total
+    table_loaded = pyqtSignal(str, str, object, int, int)
+    # side, tables
+    load_finished = pyqtSignal(str, object)
+    # side, error message
+    load_failed = pyqtSignal(str, str)
+    # side
+    load_cancelled = pyqtSignal(str)
+    
+    def __init__(self, side, db_type, db_config, schema_cache=None, compare_pipeline=None, parent=None):
+        super().__init__(parent)
+        self.side = side
+        self.db_type = db_type
+        self.db_config = db_config
+        self.schema_cache = schema_cache
+        self.compare_pipeline = compare_pipeline
+        self._cancel_event = threading.Event()
+        
+    def cancel(self):
+        """请求取消加载，当前表获取完成后生效"""
+        self._cancel_event.set()
+        
+    def is_cancelled(self):
+        """是否已请求取消"""
+        return self._cancel_event.is_set()
+        
+    def run(self):
+        """线程入口"""
+        if self.compare_pipeline is not None:
+            self.compare_pipeline.reset_side(self.side)
+            
+        db_connector = DBConnector(self.schema_cache)
+        try:
+            db_connector.connect(self.db_config, self.db_type)
+            try:
+                tables = db_connector.get_table_structure(
+                    progress_callback=self._on_progress,
+                    cancel_event=self._cancel_event
+                )
+            finally:
+                db_connector.close()
+        except LoadCancelled:
+            self.load_cancelled.emit(self.side)
+            return
+        except Exception as e:
+            if self.is_cancelled():
+                self.load_cancelled.emit(self.side)
+            else:
+                self.load_failed.emit(self.side, str(e))
+            return
+            
+        if self.is_cancelled():
+            self.load_cancelled.emit(self.side)
+            return
+            
+        if self.compare_pipeline is not None:
+            self.compare_pipeline.finish_side(self.side, tables)
+        self.load_finished.emit(self.side, tables)
+            
+    def _on_progress(self, done, total, table_name, structure):
+        """进度回调，可能在工作线程中调用，通过信号转交给界面线程"""
+        # 已取消的线程可能已被新的加载替换，不能再向流水线添加表
+        if self.is_cancelled():
+            return
+        if self.compare_pipeline is not None:
+            self.compare_pipeline.add_table(self.side, table_name, structure)
+        self.table_loaded.emit(self.side, table_name, structure, done, total)
@@ -0,0 +1,204 @@
+"""
+同步SQL查看对话框 - 分页显示
+"""
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
+    QPlainTextEdit, QApplication, QFileDialog, QMessageBox
+)
+from PyQt6.QtGui import QFont
+
+from src.i18n.i18n_manager import tr
+
+
+class SQLViewerDialog(QDialog):
+    """分页查看同步SQL
+    
+    SQL保存在 PagedSQLFile 的临时文件中，文本框中只放当前页，
+    大量的建表语句也不会一次性加载到界面。可以把全部SQL保存到文件。
+    """
+    
+    def __init__(self, title, sql_file, parent=None):
+        super().__init__(parent)
+        self.sql_file = sql_file
+        self.current_page = 0
+        
+        self.setWindowTitle(title)
+        self.setGeometry(200, 200, 900, 700)
+        
+        # 应用Windows 11风格样式
+        self.apply_windows11_style()
+        
+        self.setup_ui()
+        self.show_page(0)
+        
+    def apply_windows11_style(self):
+        """应用Windows 11风格样式"""
+        self.setStyleSheet("""
+        QDialog {
+            background-color: #fafafa;
+            color: #202020;
+        }
+        
+        QPushButton {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #ffffff, stop:1 #f8f8f8);
+            border: 1px solid #d0d0d0;
+            border-radius: 6px;
+            padding: 8px 16px;
+            font-family: 'Segoe UI', Arial, sans-serif;
+            font-size: 13px;
+            font-weight: 500;
+            color: #202020;
+            min-height: 20px;
+        }
+        
+        QPushButton:hover {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #f0f8ff, stop:1 #e6f3ff);
+            border: 1px solid #0078d4;
+            color: #0078d4;
+        }
+        
+        QPushButton:disabled {
+            color: #a0a0a0;
+            border: 1px solid #e0e0e0;
+        }
+        
+        QPushButton#primary {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #0078d4, stop:1 #106ebe);
+            border: 1px solid #0078d4;
+            color: white;
+            font-weight: 600;
+        }
+        
+        QPushButton#primary:hover {
+            background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                stop:0 #106ebe, stop:1 #005a9e);
+            border: 1px solid #106ebe;
+        }
+        
+        QPlainTextEdit {
+            border: 1px solid #d0d0d0;
+            border-radius: 6px;
+            padding: 8px;
+            background: white;
+            font-family: 'Consolas', 'Monaco', monospace;
+            font-size: 12px;
+            color: #202020;
+        }
+        
+        QPlainTextEdit:focus {
+            border: 2px solid #0078d4;
+        }
+        
+        QLabel {
+            font-family: 'Segoe UI', Arial, sans-serif;
+            font-size: 13px;
+            color: #202020;
+        }
+        """)
+        
+    def setup_ui(self):
+        """设置界面"""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(15)
+        layout.setContentsMargins(20, 20, 20, 20)
+        
+        # 提示信息
+        info_label = QLabel(tr("generated_sync_sql_prompt"))
+        info_label.setStyleSheet("color: #666; font-weight: bold; margin-bottom: 10px; font-size: 14px;")
+        layout.addWidget(info_label)
+        
+        # SQL文本区域（只显示当前页）
+        self.text_edit = QPlainTextEdit()
+        self.text_edit.setReadOnly(True)
+        self.text_edit.setFont(QFont("Consolas", 11))
+        layout.addWidget(self.text_edit)
+        
+        # 分页区域
+        page_layout = QHBoxLayout()
+        page_layout.setSpacing(10)
+        
+        self.prev_btn = QPushButton(tr("previous_page"))
+        self.prev_btn.clicked.connect(lambda: self.show_page(self.current_page - 1))
+        page_layout.addWidget(self.prev_btn)
+        
+        self.page_label = QLabel()
+        page_layout.addWidget(self.page_label)
+        
+        self.next_btn = QPushButton(tr("next_page"))
+        self.next_btn.clicked.connect(lambda: self.show_page(self.current_page + 1))
+        page_layout.addWidget(self.next_btn)
+        
+        page_layout.addStretch()
+        layout.addLayout(page_layout)
+        
+        # 只有一页时不显示分页按钮
+        if self.sql_file.page_count <= 1:
+            self.prev_btn.hide()
+            self.next_btn.hide()
+            
+        # 按钮区域
+        btn_layout = QHBoxLayout()
+        btn_layout.setSpacing(10)
+        
+        # 复制按钮
+        copy_btn = QPushButton(tr("copy_sql"))
+        copy_btn.setObjectName("primary")
+        copy_btn.clicked.connect(self.copy_to_clipboard)
+        btn_layout.addWidget(copy_btn)
+        
+        # 保存按钮
+        save_btn = QPushButton(tr("save_sql"))
+        save_btn.clicked.connect(self.save_to_file)
+        btn_layout.addWidget(save_btn)
+        
+        btn_layout.addStretch()
+        
+        # 关闭按钮
+        close_btn = QPushButton(tr("close"))
+        close_btn.clicked.connect(self.accept)
+        btn_layout.addWidget(close_btn)
+        
+        layout.addLayout(btn_layout)
+        
+    def show_page(self, index):
+        """显示第 index 页"""
+        page_count = self.sql_file.page_count
+        index = max(0, min(index, page_count - 1))
+        self.current_page = index
+        self.text_edit.setPlainText(self.sql_file.read_page(index))
+        self.page_label.setText(tr("sql_page_info").format(
+            page=index + 1, pages=page_count, lines=self.sql_file.line_count
+        ))
+        self.prev_btn.setEnabled(index > 0)
+        self.next_btn.setEnabled(index < page_count - 1)
+        
+    def copy_to_clipboard(self):
+        """复制SQL到剪贴板，多页时只复制当前页"""
+        clipboard = QApplication.clipboard()
+        if self.sql_file.page_count <= 1:
+            clipboard.setText(self.sql_file.read_all())
+            QMessageBox.information(self, tr("info"), tr("sql_copied_to_clipboard"))
+        else:
+            clipboard.setText(self.text_edit.toPlainText())
+            QMessageBox.information(self, tr("info"), tr("sql_page_copied_to_clipboard").format(page=self.current_page + 1))
+            
+    def save_to_file(self):
+        """把全部SQL保存到文件"""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            tr("save_sql"),
+            "sync.sql",
+            tr("sql_save_filter")
+        )
+        if not file_path:
+            return
+            
+        try:
+            self.sql_file.save(file_path)
+            QMessageBox.information(self, tr("info"), tr("sql_saved").format(path=file_path))
+        except Exception as e:
+            QMessageBox.critical(self, tr("error"), f"{tr('save_sql_error')}:\n{str(e)}")
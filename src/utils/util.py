@@ -9,54 +9,68 @@ def normalize_sql_definition(definition):
     definition = ' '.join(definition.split())
     return definition
 
-def smart_split_sql_definitions(content):
+_SPLIT_TOKEN_RE = re.compile(r"""
+    '[^'\\]*(?:\\.[^'\\]*)*\\?(?:'|\Z)      # 单引号字符串（反斜杠转义，'' 视为两个相邻字符串）
+  | "[^"\\]*(?:\\.[^"\\]*)*\\?(?:"|\Z)      # 双引号字符串/标识符
+  | `[^`]*(?:`|\Z)                          # 反引号标识符
+  | --[^\n]*                                 # 行注释
+  | /\*.*?(?:\*/|\Z)                         # 块注释
+  | [(),]
+""", re.VERBOSE | re.DOTALL)
+
+_SPLIT_TOKEN_NO_ESCAPE_RE = re.compile(r"""
+    '[^']*(?:'|\Z)
+  | "[^"]*(?:"|\Z)
+  | `[^`]*(?:`|\Z)
+  | --[^\n]*
+  | /\*.*?(?:\*/|\Z)
+  | [(),]
+""", re.VERBOSE | re.DOTALL)
+
+def smart_split_sql_definitions(content, backslash_escapes=True):
     """
     智能分割SQL定义，正确处理包含逗号的字符串字面量
     例如："name VARCHAR(255) DEFAULT 'Smith, John', age INT" 
     会被正确分割为：["name VARCHAR(255) DEFAULT 'Smith, John'", "age INT"]
+    
+    只用正则定位引号、括号、逗号和注释的位置，按切片拼接定义，耗时与内容长度成线性关系。
+    支持 '' 形式的引号转义、反引号标识符，-- 和 /* */ 注释会被去掉（其中的逗号不作为分隔符）。
+    backslash_escapes 为 False 时字符串中的反斜杠不作为转义字符（标准SQL）。
     """
+    token_re = _SPLIT_TOKEN_RE if backslash_escapes else _SPLIT_TOKEN_NO_ESCAPE_RE
     definitions = []
-    current_def = ""
-    in_string = False
-    string_char = None
+    pieces = []
+    start = 0
     paren_count = 0
-    i = 0
-    
-    while i < len(content):
-        char = content[i]
-        
-        # 处理字符串字面量
-        if char in ("'", '"') and not in_string:
-            in_string = True
-            string_char = char
-            current_def += char
-        elif char == string_char and in_string:
-            # 检查是否是转义的引号
-            if i > 0 and content[i-1] == '\\':
-                current_def += char
-            else:
-                in_string = False
-                string_char = None
-                current_def += char
-        elif char == '(' and not in_string:
+    
+    for match in token_re.finditer(content):
+        token = match.group()
+        char = token[0]
+        if char == '(':
             paren_count += 1
-            current_def += char
-        elif char == ')' and not in_string:
+        elif char == ')':
             paren_count -= 1
-            current_def += char
-        elif char == ',' and not in_string and paren_count == 0:
-            # 这是一个真正的分隔符
-            if current_def.strip():
-                definitions.append(current_def.strip())
-            current_def = ""
-        else:
-            current_def += char
-        
-        i += 1
+        elif char == ',':
+            if paren_count == 0:
+                # 这是一个真正的分隔符
+                pieces.append(content[start:match.start()])
+                definition = ''.join(pieces).strip()
+                if definition:
+                    definitions.append(definition)
+                pieces = []
+                start = match.end()
+        elif token.startswith('--') or token.startswith('/*'):
+            # 去掉注释，块注释按空白处理
+            pieces.append(content[start:match.start()])
+            if char == '/':
+                pieces.append(' ')
+            start = match.end()
     
     # 添加最后一个定义
-    if current_def.strip():
-        definitions.append(current_def.strip())
+    pieces.append(content[start:])
+    definition = ''.join(pieces).strip()
+    if definition:
+        definitions.append(definition)
     
     return definitions
 
@@ -140,6 +154,20 @@ def get_mysql_to_db2_mappings():
         'AUTO_INCREMENT': ''
     }
 
+# DEFAULT 后面的内容，考虑各种情况（按顺序尝试）
+_DEFAULT_VALUE_PATTERNS = [re.compile(pattern, re.IGNORECASE) for pattern in (
+    # 匹配带单引号的字符串
+    r"DEFAULT\s+'([^']*(?:''[^']*)*)'(?=\s|$|,|\))",
+    # 匹配带双引号的字符串
+    r'DEFAULT\s+"([^"]*(?:""[^"]*)*)"(?=\s|$|,|\))',
+    # 匹配带括号的表达式
+    r'DEFAULT\s+(\([^)]+\))(?=\s|$|,|\))',
+    # 匹配函数调用
+    r'DEFAULT\s+([A-Z_][A-Z0-9_]*\([^)]*\))(?=\s|$|,|\))',
+    # 匹配简单的值（数字、关键字等）
+    r'DEFAULT\s+([^\s,)]+)(?=\s|$|,|\))',
+)]
+
 def extract_default_value_enhanced(col_def: str) -> str:
     """
     增强的默认值提取逻辑，能够处理复杂的默认值表达式
@@ -154,30 +182,21 @@ def extract_default_value_enhanced(col_def: str) -> str:
     if 'DEFAULT' not in col_def.upper():
         return None
     
-    # 使用正则表达式匹配DEFAULT后面的内容
-    import re
-    
-    # 匹配DEFAULT后面的内容，考虑各种情况
-    patterns = [
-        # 匹配带单引号的字符串
-        r"DEFAULT\s+'([^']*(?:''[^']*)*)'(?=\s|$|,|\))",
-        # 匹配带双引号的字符串 
-        r'DEFAULT\s+"([^"]*(?:""[^"]*)*)"(?=\s|$|,|\))',
-        # 匹配带括号的表达式
-        r'DEFAULT\s+(\([^)]+\))(?=\s|$|,|\))',
-        # 匹配函数调用
-        r'DEFAULT\s+([A-Z_][A-Z0-9_]*\([^)]*\))(?=\s|$|,|\))',
-        # 匹配简单的值（数字、关键字等）
-        r'DEFAULT\s+([^\s,)]+)(?=\s|$|,|\))'
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, col_def, re.IGNORECASE)
+    # 按顺序尝试各种默认值格式
+    for pattern in _DEFAULT_VALUE_PATTERNS:
+        match = pattern.search(col_def)
         if match:
             return match.group(1)
     
     return None
 
+_COMMENT_RE = re.compile(r"COMMENT\s+'([^']*(?:''[^']*)*)'|", re.IGNORECASE)
+_TYPE_RE = re.compile(r'^\s*([A-Z]+(?:\([^)]+\))?)', re.IGNORECASE)
+_NOT_NULL_RE = re.compile(r'\bNOT\s+NULL\b', re.IGNORECASE)
+_NULL_RE = re.compile(r'\bNULL\b', re.IGNORECASE)
+_AUTO_INCREMENT_RE = re.compile(r'\bAUTO_INCREMENT\b', re.IGNORECASE)
+_ATTRIBUTE_RES = [(attr, re.compile(r'\b' + attr + r'\b', re.IGNORECASE)) for attr in ('UNSIGNED', 'ZEROFILL', 'BINARY')]
+
 def parse_complex_column_definition(definition: str) -> dict:
     """
     解析复杂的列定义，更准确地提取各个属性
@@ -197,29 +216,28 @@ def parse_complex_column_definition(definition: str) -> dict:
     details['Default'] = extract_default_value_enhanced(definition)
     
     # 提取注释
-    import re
-    comment_match = re.search(r"COMMENT\s+'([^']*(?:''[^']*)*)'|", definition, re.IGNORECASE)
+    comment_match = _COMMENT_RE.search(definition)
     if comment_match:
         details['Comment'] = comment_match.group(1)
     
     # 提取类型（更精确的匹配）
-    type_match = re.match(r'^\s*([A-Z]+(?:\([^)]+\))?)', definition, re.IGNORECASE)
+    type_match = _TYPE_RE.match(definition)
     if type_match:
         details['Type'] = type_match.group(1)
     
     # 检查NULL/NOT NULL
-    if re.search(r'\bNOT\s+NULL\b', definition, re.IGNORECASE):
+    if _NOT_NULL_RE.search(definition):
         details['Null'] = 'NO'
-    elif re.search(r'\bNULL\b', definition, re.IGNORECASE):
+    elif _NULL_RE.search(definition):
         details['Null'] = 'YES'
     
     # 检查AUTO_INCREMENT
-    if re.search(r'\bAUTO_INCREMENT\b', definition, re.IGNORECASE):
+    if _AUTO_INCREMENT_RE.search(definition):
         details['Extra'] = 'auto_increment'
     
     # 检查其他属性
-    for attr in ['UNSIGNED', 'ZEROFILL', 'BINARY']:
-        if re.search(r'\b' + attr + r'\b', definition, re.IGNORECASE):
+    for attr, pattern in _ATTRIBUTE_RES:
+        if pattern.search(definition):
             details['Attributes'].add(attr.lower())
     
     # 转换属性集合